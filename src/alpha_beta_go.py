@@ -1,7 +1,8 @@
 from six.moves import input
 
+from mydlgo.eval import stone_difference
 from mydlgo.goboard import GameState, Move
-from mydlgo.gotypes import Player, Point
+from mydlgo.gotypes import Player
 from mydlgo.minimax import AlphaBetaAgent
 from mydlgo.utils import print_board, print_move, point_from_coordinate
 
@@ -9,24 +10,9 @@ from mydlgo.utils import print_board, print_move, point_from_coordinate
 BOARD_SIZE = 5
 
 
-def capture_diff(game_state: GameState):
-    black_stones = 0
-    white_stones = 0
-    for r in range(1, game_state.board.num_rows + 1):
-        for c in range(1, game_state.board.num_cols + 1):
-            p = Point(r, c)
-            color = game_state.board.get_player_at(p)
-            if color == Player.BLACK:
-                black_stones += 1
-            elif color == Player.WHITE:
-                white_stones += 1
-    diff = black_stones - white_stones
-    return diff if game_state.next_player == Player.BLACK else -diff
-
-
 def main():
     game = GameState.new_game(BOARD_SIZE)
-    bot = AlphaBetaAgent(2, capture_diff)
+    bot = AlphaBetaAgent(2, stone_difference)
 
     while not game.is_over():
         print_board(game.board)
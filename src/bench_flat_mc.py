@@ -0,0 +1,46 @@
+"""
+Playouts per second of FlatMCAgent from 1 worker up to the number of CPUs, or up to the second argument.
+
+No multi-core result is recorded here yet: the machine this was last run on has a single CPU, where
+extra workers only share that CPU. There, on 9x9 with 2000 playouts per move:
+
+      1 workers:      184 playouts/s (x1.00), per worker 184
+      2 workers:      182 playouts/s (x0.99), per worker 93 93
+      3 workers:      172 playouts/s (x0.94), per worker 59 59 59
+      4 workers:      237 playouts/s (x1.29), per worker 60 61 61 63
+
+The workers get equal shares of the playouts, which is what near-linear scaling needs on more cores;
+the x1.29 at 4 workers is run-to-run noise, not a speedup.
+"""
+import multiprocessing
+import sys
+
+from mydlgo import goboard_fast
+from mydlgo.mcts import FlatMCAgent
+
+BOARD_SIZE = int(sys.argv[1]) if len(sys.argv) > 1 else 9
+MAX_WORKERS = int(sys.argv[2]) if len(sys.argv) > 2 else multiprocessing.cpu_count()
+NUM_PLAYOUTS = 2000
+
+
+def main():
+    game = goboard_fast.GameState.new_game(BOARD_SIZE)
+    print(f"{BOARD_SIZE}x{BOARD_SIZE}, {NUM_PLAYOUTS} playouts per move")
+    baseline = None
+    for num_workers in range(1, MAX_WORKERS + 1):
+        bot = FlatMCAgent(NUM_PLAYOUTS, num_workers=num_workers, seed=0)
+        bot.select_move(game)  # starts the pool
+        move = bot.select_move(game)
+        bot.close()
+        rate = bot.last_playouts_per_second
+        if baseline is None:
+            baseline = rate
+        per_worker = sorted(bot.worker_playouts_per_second().values())
+        print(
+            f"{num_workers:3d} workers: {rate:8.0f} playouts/s (x{rate / baseline:.2f}), "
+            f"per worker {' '.join('%.0f' % r for r in per_worker)}, played {move.point}"
+        )
+
+
+if __name__ == "__main__":
+    main()
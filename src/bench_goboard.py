@@ -0,0 +1,174 @@
+"""
+Placements per second of the board engines on a fixed set of random games.
+
+The ratios are against BaselineBoard, the dict-of-GoString engine that goboard.Board was before the array
+engines were added. Best of 9 interleaved runs on one core:
+
+                              9x9                      19x19
+    place_stone               fast x1.5   bit x1.8     fast x2.5   bit x2.2
+    deepcopy + place_stone    fast x51    bit x81      fast x139   bit x289
+
+The order of magnitude holds for deepcopy + place_stone, which is GameState.apply_move and what self-play
+pays per move, but not for place_stone alone. A placement still runs a few dozen interpreted list reads
+and writes per stone it touches, which bounds a pure Python engine at a few times the old one.
+"""
+import copy
+import random
+import sys
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from mydlgo import goboard, goboard_bit, goboard_fast, zobrist
+from mydlgo.goboard import GoString
+from mydlgo.gotypes import Player, Point
+
+BOARD_SIZE = int(sys.argv[1]) if len(sys.argv) > 1 else 19
+NUM_GAMES = 5
+NUM_RUNS = 9
+
+
+class BaselineBoard:
+    """ goboard.Board before the array engines, kept as the yardstick: strings are immutable GoStrings
+    in a dict and copy.deepcopy copies all of them. """
+
+    # Class level like the old module level table, so that deepcopy does not copy it.
+    _hash_codes: Dict[Tuple[int, int], Dict[Tuple[Point, Player], int]] = {}
+
+    def __init__(self, num_rows: int, num_cols: int):
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self._grid: Dict[Point, Optional[GoString]] = {}
+        self._hash = zobrist.EMPTY_BOARD
+        if (num_rows, num_cols) not in self._hash_codes:
+            codes = zobrist.hash_codes(num_rows, num_cols)
+            self._hash_codes[num_rows, num_cols] = {
+                (Point(r, c), player): codes[((r - 1) * num_cols + c - 1) * 3 + player.value]
+                for r in range(1, num_rows + 1)
+                for c in range(1, num_cols + 1)
+                for player in (Player.BLACK, Player.WHITE)
+            }
+
+    def place_stone(self, player: Player, point: Point):
+        adjacent_same_color: List[GoString] = []
+        adjacent_opposite_color: List[GoString] = []
+        liberties: Set[Point] = set()
+        for neighbor in point.neighbors():
+            if not self.is_on_grid(neighbor):
+                continue
+            neighbor_string = self._grid.get(neighbor)
+            if neighbor_string is None:
+                liberties.add(neighbor)
+            elif neighbor_string.color == player:
+                if neighbor_string not in adjacent_same_color:
+                    adjacent_same_color.append(neighbor_string)
+            elif neighbor_string not in adjacent_opposite_color:
+                adjacent_opposite_color.append(neighbor_string)
+
+        new_string = GoString(player, [point], liberties)
+        for same_color_string in adjacent_same_color:
+            new_string = new_string.merged_with(same_color_string)
+        for new_string_point in new_string.stones:
+            self._grid[new_string_point] = new_string
+        self._hash ^= self._hash_codes[self.num_rows, self.num_cols][point, player]
+
+        for other_color_string in adjacent_opposite_color:
+            replacement = other_color_string.without_liberty(point)
+            if replacement.num_liberties > 0:
+                self._replace_string(other_color_string.without_liberty(point))
+            else:
+                self._remove_string(other_color_string)
+
+    def _replace_string(self, new_string: GoString):
+        for point in new_string.stones:
+            self._grid[point] = new_string
+
+    def _remove_string(self, string: GoString):
+        for point in string.stones:
+            for neighbor in point.neighbors():
+                neighbor_string = self._grid.get(neighbor)
+                if neighbor_string is None:
+                    continue
+                if neighbor_string is not string:
+                    self._replace_string(neighbor_string.with_liberty(point))
+            self._grid[point] = None
+            self._hash ^= self._hash_codes[self.num_rows, self.num_cols][point, string.color]
+
+    def is_on_grid(self, point: Point) -> bool:
+        return 1 <= point.row <= self.num_rows and 1 <= point.col <= self.num_cols
+
+
+def random_game(board_size: int, seed: int) -> List[Point]:
+    """ Sequence of non-suicidal random plays, used as a fixed workload for both boards. """
+    rng = random.Random(seed)
+    board = goboard_fast.Board(board_size, board_size)
+    moves: List[Point] = []
+    player = Player.BLACK
+    for _ in range(board_size * board_size * 2):
+        empties = [
+            Point(r, c)
+            for r in range(1, board_size + 1)
+            for c in range(1, board_size + 1)
+            if board.get_player_at(Point(r, c)) is None
+        ]
+        rng.shuffle(empties)
+        for point in empties:
+            trial = copy.deepcopy(board)
+            trial.place_stone(player, point)
+            if trial.num_liberties(point) > 0:
+                board = trial
+                moves.append(point)
+                break
+        else:
+            break
+        player = player.other
+    return moves
+
+
+def bench_place_stone(board_class, games: List[List[Point]]) -> float:
+    num_moves = 0
+    start = time.perf_counter()
+    for moves in games:
+        board = board_class(BOARD_SIZE, BOARD_SIZE)
+        player = Player.BLACK
+        for point in moves:
+            board.place_stone(player, point)
+            player = player.other
+        num_moves += len(moves)
+    return num_moves / (time.perf_counter() - start)
+
+
+def bench_copy_and_place(board_class, games: List[List[Point]]) -> float:
+    num_moves = 0
+    start = time.perf_counter()
+    for moves in games:
+        board = board_class(BOARD_SIZE, BOARD_SIZE)
+        player = Player.BLACK
+        for point in moves:
+            board = copy.deepcopy(board)
+            board.place_stone(player, point)
+            player = player.other
+        num_moves += len(moves)
+    return num_moves / (time.perf_counter() - start)
+
+
+def main():
+    games = [random_game(BOARD_SIZE, seed) for seed in range(NUM_GAMES)]
+    print(f"{BOARD_SIZE}x{BOARD_SIZE}, {sum(len(g) for g in games)} moves in {NUM_GAMES} games")
+    engines = (
+        ("baseline", BaselineBoard),
+        ("goboard", goboard.Board),
+        ("goboard_fast", goboard_fast.Board),
+        ("goboard_bit", goboard_bit.Board),
+    )
+    for name, bench in (("place_stone", bench_place_stone), ("deepcopy + place_stone", bench_copy_and_place)):
+        # Interleaved, so that a slow spell of the machine does not favor one engine.
+        rates = {engine: 0.0 for engine, _ in engines}
+        for _ in range(NUM_RUNS):
+            for engine, board_class in engines:
+                rates[engine] = max(rates[engine], bench(board_class, games))
+        base = rates["baseline"]
+        print(f"{name:>24}: " + "  ".join(f"{e} {v:8.0f}/s (x{v / base:.1f})" for e, v in rates.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import random
+import sys
+import time
+from typing import Tuple
+
+from mydlgo import goboard_fast
+from mydlgo.agent import RandomBot
+from mydlgo.goboard import GameState
+from mydlgo.gotypes import Player, Point
+from mydlgo.minimax import AlphaBetaAgent, NegamaxAgent, TranspositionTable
+
+BOARD_SIZE = 5
+DEPTH = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+SEEDS = range(5)
+
+
+class CountingGameState(goboard_fast.GameState):
+    """ Every node but the root is reached through push(), so counting pushes counts nodes. """
+
+    pushes = 0
+
+    def push(self, move):
+        CountingGameState.pushes += 1
+        return super().push(move)
+
+
+def stone_diff(game_state) -> int:
+    stones = {Player.BLACK: 0, Player.WHITE: 0}
+    for r in range(1, game_state.board.num_rows + 1):
+        for c in range(1, game_state.board.num_cols + 1):
+            color = game_state.board.get_player_at(Point(r, c))
+            if color is not None:
+                stones[color] += 1
+    return stones[game_state.next_player] - stones[game_state.next_player.other]
+
+
+def fixed_position(seed: int):
+    random.seed(seed)
+    bot = RandomBot()
+    game: GameState = CountingGameState.new_game(BOARD_SIZE)
+    for _ in range(6):
+        game = game.apply_move(bot.select_move(game))
+    return game
+
+
+def count_nodes(agent, game) -> Tuple[int, float]:
+    CountingGameState.pushes = 0
+    start = time.perf_counter()
+    agent.select_move(game)
+    return CountingGameState.pushes, time.perf_counter() - start
+
+
+def main():
+    # AlphaBetaAgent(d) searches d + 1 plies below the root, NegamaxAgent(d) searches d plies. All of
+    # them get a fresh transposition table, so the difference is down to the search itself. The two
+    # NegamaxAgent columns differ only in the null-window searches of PVS.
+    print(f"{BOARD_SIZE}x{BOARD_SIZE}, {DEPTH} plies")
+    agents = [
+        ("AlphaBetaAgent", lambda: AlphaBetaAgent(DEPTH - 1, stone_diff, tt=TranspositionTable())),
+        ("NegamaxAgent without PVS", lambda: NegamaxAgent(DEPTH, stone_diff, tt=TranspositionTable(), pvs=False)),
+        ("NegamaxAgent", lambda: NegamaxAgent(DEPTH, stone_diff, tt=TranspositionTable())),
+    ]
+    totals = [0] * len(agents)
+    for seed in SEEDS:
+        game = fixed_position(seed)
+        columns = []
+        for i, (name, make_agent) in enumerate(agents):
+            nodes, seconds = count_nodes(make_agent(), game)
+            totals[i] += nodes
+            columns.append(f"{name} {nodes:7d} nodes {seconds:6.2f}s")
+        print(f"position {seed}: " + "  ".join(columns))
+    print("total: " + ", ".join(f"{name} {total} nodes" for (name, _), total in zip(agents, totals)))
+    print(f"nodes with PVS / without: {totals[2] / totals[1]:.2f}")
+    print(f"nodes of NegamaxAgent / AlphaBetaAgent: {totals[2] / totals[0]:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,11 @@
 from .base import Agent  # noqa;
 from .naive import RandomBot  # noqa;
+
+
+def __getattr__(name):
+    # BatchRandomBot needs NumPy, which the agents playing on a single board do not.
+    if name == "BatchRandomBot":
+        from .naive_batch import BatchRandomBot
+
+        return BatchRandomBot
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
@@ -7,3 +7,12 @@ class Agent:
 
     def select_move(self, game_state: GameState):
         raise NotImplementedError()
+
+    def close(self):
+        """ Release the worker processes or other resources the agent holds. """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
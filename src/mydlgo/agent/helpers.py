@@ -1,8 +1,12 @@
+from typing import TYPE_CHECKING
+
 from mydlgo.gotypes import Point, Player
-from mydlgo.goboard import Board
+
+if TYPE_CHECKING:
+    from mydlgo.goboard import AnyBoard
 
 
-def is_point_an_eye(board: Board, point: Point, color: Player) -> bool:
+def is_point_an_eye(board: "AnyBoard", point: Point, color: Player) -> bool:
     if board.get_player_at(point) is not None:  # 空の点でなければ眼ではない
         return False
 
@@ -3,20 +3,16 @@ import random
 from .base import Agent
 from .helpers import is_point_an_eye
 from mydlgo.goboard import Move, GameState
-from mydlgo.gotypes import Point
 
 
 class RandomBot(Agent):
     def select_move(self, game_state: GameState) -> Move:
         """ Choose a random valid move that preserves our own eyes. """
-        candidates = []
-        for r in range(1, game_state.board.num_rows + 1):
-            for c in range(1, game_state.board.num_cols + 1):
-                candidate = Point(row=r, col=c)
-                if game_state.is_valid_move(Move.play(candidate)) and not is_point_an_eye(
-                    game_state.board, candidate, game_state.next_player
-                ):
-                    candidates.append(candidate)
+        candidates = [
+            move.point
+            for move in game_state.legal_moves()
+            if move.point is not None and not is_point_an_eye(game_state.board, move.point, game_state.next_player)
+        ]
 
         if len(candidates) == 0:
             return Move.pass_turn()
@@ -0,0 +1,15 @@
+import numpy as np
+
+from mydlgo.goboard_batch import PASS, BatchGameState
+
+
+class BatchRandomBot:
+    def __init__(self, seed=None):
+        self.rng = np.random.default_rng(seed)
+
+    def select_moves(self, game_state: BatchGameState) -> np.ndarray:
+        """ RandomBot for every game of the batch: a random legal move that preserves our own eyes. """
+        board = game_state.board
+        candidates = game_state.legal_moves_mask() & ~board.eyes(game_state.next_color)[:, board.point_cells]
+        scores = np.where(candidates, self.rng.random(candidates.shape), -1.0)
+        return np.where(candidates.any(axis=1), scores.argmax(axis=1), PASS)
@@ -0,0 +1,210 @@
+"""
+On-disk training data for encoded positions.
+
+A dataset is a directory of shards plus an `index.json`. Every shard is three `.npy` files with one
+row per position: the encoded planes, the index of the move played and the outcome of the game for
+the player to move (1 won, -1 lost, 0 unknown). Readers open the shards with `numpy.memmap`, so only
+the rows a batch touches are ever read from disk.
+
+    index.json
+    shard-00000.planes.npy     (N, num_planes, num_rows, num_cols)
+    shard-00000.moves.npy      (N,) int32
+    shard-00000.outcomes.npy   (N,) int8
+"""
+from __future__ import annotations
+import json
+import os
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from . import goboard_fast
+from .encoders import Encoder
+from .goboard import GameState, Move
+from .gotypes import Player
+from .records import GameRecord
+
+__all__ = ["DatasetWriter", "Dataset", "game_positions"]
+
+INDEX = "index.json"
+
+
+def _shard_path(path: str, shard: int, field: str) -> str:
+    return os.path.join(path, "shard-%05d.%s.npy" % (shard, field))
+
+
+def game_positions(game_state: GameState) -> List[Tuple[GameState, Move]]:
+    """ Every position of the game leading to `game_state` with the move played from it, oldest first.
+
+    Resignations are left out since they have no move index.
+    """
+    positions = []
+    state = game_state
+    while state.previous_state is not None:
+        assert state.last_move is not None
+        if not state.last_move.is_resign:
+            positions.append((state.previous_state, state.last_move))
+        state = state.previous_state
+    positions.reverse()
+    return positions
+
+
+def _record_winner(record: GameRecord) -> Optional[Player]:
+    if record.result.startswith("B+"):
+        return Player.BLACK
+    if record.result.startswith("W+"):
+        return Player.WHITE
+    return None
+
+
+class DatasetWriter:
+    def __init__(self, path: str, encoder: Encoder, shard_size: int = 65536):
+        """ Append positions encoded by `encoder` to the dataset at `path`, creating it if needed.
+
+        Shards of `shard_size` rows are preallocated on disk and positions are encoded straight into
+        them. Call close(), or use the writer as a context manager, to trim the last shard and write
+        the index.
+        """
+        self.path = path
+        self.encoder = encoder
+        self.shard_size = shard_size
+        os.makedirs(path, exist_ok=True)
+        self._index = self._load_index()
+        self._shard = len(self._index["shards"])
+        self._arrays: Optional[Dict[str, np.ndarray]] = None
+        self._count = 0
+
+    def _load_index(self) -> Dict:
+        index_path = os.path.join(self.path, INDEX)
+        meta = {
+            "encoder": self.encoder.name,
+            "shape": list(self.encoder.shape()),
+            "dtype": self.encoder.dtype.str,
+        }
+        if not os.path.exists(index_path):
+            return dict(meta, shards=[])
+        with open(index_path) as f:
+            index = json.load(f)
+        if any(index[key] != value for key, value in meta.items()):
+            raise ValueError("Dataset %s was written with a different encoder" % self.path)
+        return index
+
+    def __enter__(self) -> DatasetWriter:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add(self, game_state: GameState, move: Move, outcome: int):
+        if self._arrays is None or self._count == self.shard_size:
+            self._finish_shard()
+            self._arrays = {
+                field: np.lib.format.open_memmap(
+                    _shard_path(self.path, self._shard, field), mode="w+", dtype=dtype, shape=shape
+                )
+                for field, dtype, shape in self._fields(self.shard_size)
+            }
+        self.encoder.encode_into(game_state, self._arrays["planes"][self._count])
+        self._arrays["moves"][self._count] = self.encoder.encode_move(move)
+        self._arrays["outcomes"][self._count] = outcome
+        self._count += 1
+
+    def add_game(self, game_state: GameState, winner: Optional[Player] = None):
+        """ Add every position of the game that ended in `game_state`, winner taken from the game
+        unless given. """
+        if winner is None:
+            winner = game_state.winner()
+        for state, move in game_positions(game_state):
+            outcome = 0 if winner is None else (1 if state.next_player == winner else -1)
+            self.add(state, move, outcome)
+
+    def add_record(self, record: GameRecord, game_state_class=goboard_fast.GameState):
+        game = game_state_class.new_game(record.board_size)
+        for move in record.moves:
+            game = game.apply_move(move)
+        self.add_game(game, _record_winner(record))
+
+    def _fields(self, num_rows: int) -> List[Tuple[str, np.dtype, Tuple[int, ...]]]:
+        return [
+            ("planes", self.encoder.dtype, (num_rows,) + self.encoder.shape()),
+            ("moves", np.dtype(np.int32), (num_rows,)),
+            ("outcomes", np.dtype(np.int8), (num_rows,)),
+        ]
+
+    def _finish_shard(self):
+        if self._arrays is None:
+            return
+        for field, dtype, shape in self._fields(self._count):
+            array = self._arrays[field]
+            array.flush()
+            if self._count < self.shard_size:
+                # Rewrite the partly filled shard at its real size.
+                trimmed = np.array(array[: self._count])
+                del array
+                self._arrays[field] = None
+                np.save(_shard_path(self.path, self._shard, field), trimmed)
+        self._index["shards"].append(self._count)
+        self._shard += 1
+        self._arrays = None
+        self._count = 0
+
+    def close(self):
+        self._finish_shard()
+        with open(os.path.join(self.path, INDEX), "w") as f:
+            json.dump(self._index, f)
+
+
+class Dataset:
+    def __init__(self, path: str):
+        """ Read-only view of the dataset at `path`; shards are memory-mapped, not loaded. """
+        with open(os.path.join(path, INDEX)) as f:
+            self.index = json.load(f)
+        self.path = path
+        self.shape = tuple(self.index["shape"])
+        self._shards = [
+            tuple(np.load(_shard_path(path, i, field), mmap_mode="r") for field in ("planes", "moves", "outcomes"))
+            for i in range(len(self.index["shards"]))
+        ]
+        self._offsets = np.cumsum([0] + self.index["shards"])
+
+    def __len__(self) -> int:
+        return int(self._offsets[-1])
+
+    def __getitem__(self, i: int) -> Tuple[np.ndarray, int, int]:
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        shard = int(np.searchsorted(self._offsets, i, side="right")) - 1
+        planes, moves, outcomes = self._shards[shard]
+        row = i - self._offsets[shard]
+        return planes[row], int(moves[row]), int(outcomes[row])
+
+    def batch(self, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """ Planes, moves and outcomes of the positions at `indices`, read shard by shard. """
+        indices = np.asarray(indices)
+        planes = np.empty((len(indices),) + self.shape, dtype=np.dtype(self.index["dtype"]))
+        moves = np.empty(len(indices), dtype=np.int32)
+        outcomes = np.empty(len(indices), dtype=np.int8)
+        shards = np.searchsorted(self._offsets, indices, side="right") - 1
+        for shard in np.unique(shards):
+            selected = np.flatnonzero(shards == shard)
+            # Sorted rows read the memory map front to back.
+            order = selected[np.argsort(indices[selected])]
+            rows = indices[order] - self._offsets[shard]
+            shard_planes, shard_moves, shard_outcomes = self._shards[shard]
+            planes[order] = shard_planes[rows]
+            moves[order] = shard_moves[rows]
+            outcomes[order] = shard_outcomes[rows]
+        return planes, moves, outcomes
+
+    def sample(self, batch_size: int, rng: Optional[np.random.Generator] = None):
+        """ A batch of positions drawn uniformly at random without replacement. """
+        rng = rng if rng is not None else np.random.default_rng()
+        return self.batch(rng.choice(len(self), size=batch_size, replace=False))
+
+    def batches(self, batch_size: int, shuffle: bool = True, rng: Optional[np.random.Generator] = None) -> Iterator:
+        """ One pass over the dataset in batches of at most `batch_size` positions. """
+        indices = np.arange(len(self))
+        if shuffle:
+            (rng if rng is not None else np.random.default_rng()).shuffle(indices)
+        for start in range(0, len(indices), batch_size):
+            yield self.batch(indices[start : start + batch_size])
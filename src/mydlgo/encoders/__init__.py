@@ -0,0 +1,4 @@
+from .base import *  # noqa;
+from .oneplane import *  # noqa;
+from .multiplane import *  # noqa;
+from .history import *  # noqa;
@@ -0,0 +1,114 @@
+"""
+Feature planes for training models on positions.
+
+An encoder maps a GameState to a (num_planes, num_rows, num_cols) array seen from the player to move,
+and moves to indices: points in raster order from row 1, then pass. encode_many() writes a whole
+batch into one array, which callers can allocate once and hand back on every call.
+"""
+from __future__ import annotations
+from typing import Dict, Optional, Sequence, Tuple, Type, Union
+
+import numpy as np
+
+from mydlgo.goboard import GameState, Move
+from mydlgo.gotypes import Player, Point
+
+__all__ = ["Encoder", "register_encoder", "get_encoder_by_name", "encoder_names"]
+
+BoardSize = Union[int, Tuple[int, int]]
+
+
+class Encoder:
+    name = ""
+    num_planes = 0
+
+    def __init__(self, board_size: BoardSize, dtype=np.float32):
+        self.num_rows, self.num_cols = (board_size, board_size) if isinstance(board_size, int) else board_size
+        self.dtype = np.dtype(dtype)
+
+    def shape(self) -> Tuple[int, int, int]:
+        return self.num_planes, self.num_rows, self.num_cols
+
+    def encode(self, game_state: GameState) -> np.ndarray:
+        out = np.empty(self.shape(), dtype=self.dtype)
+        self.encode_into(game_state, out)
+        return out
+
+    def encode_into(self, game_state: GameState, out: np.ndarray):
+        """ Write the planes of `game_state` into `out`, a C-contiguous array of shape(). """
+        raise NotImplementedError()
+
+    def encode_many(self, game_states: Sequence[GameState], out: Optional[np.ndarray] = None) -> np.ndarray:
+        """ Planes of every position, stacked. Pass the result back as `out` to reuse it for the next
+        batch; it is allocated only when missing or too small, and the first len(game_states) entries
+        are returned. """
+        n = len(game_states)
+        if out is None or len(out) < n:
+            out = np.empty((n,) + self.shape(), dtype=self.dtype)
+        for i, game_state in enumerate(game_states):
+            self.encode_into(game_state, out[i])
+        return out[:n]
+
+    def num_points(self) -> int:
+        return self.num_rows * self.num_cols
+
+    def num_moves(self) -> int:
+        """ Every point plus pass. """
+        return self.num_points() + 1
+
+    def encode_point(self, point: Point) -> int:
+        return (point.row - 1) * self.num_cols + (point.col - 1)
+
+    def decode_point_index(self, index: int) -> Point:
+        return Point(index // self.num_cols + 1, index % self.num_cols + 1)
+
+    def encode_move(self, move: Move) -> int:
+        if move.is_pass:
+            return self.num_points()
+        if move.point is None:
+            raise ValueError("Resignation has no move index")
+        return self.encode_point(move.point)
+
+    def decode_move_index(self, index: int) -> Move:
+        if index == self.num_points():
+            return Move.pass_turn()
+        return Move.play(self.decode_point_index(index))
+
+    def encode_moves(self, moves: Sequence[Move], out: Optional[np.ndarray] = None) -> np.ndarray:
+        n = len(moves)
+        if out is None or len(out) < n:
+            out = np.empty(n, dtype=np.int64)
+        for i, move in enumerate(moves):
+            out[i] = self.encode_move(move)
+        return out[:n]
+
+
+def relative_colors(player: Player) -> np.ndarray:
+    """ Lookup table from stone values (0 empty, 1 black, 2 white) to 0 empty, 1 own, 2 opponent. """
+    return _RELATIVE[player]
+
+
+_RELATIVE = {
+    Player.BLACK: np.array([0, 1, 2], dtype=np.intp),
+    Player.WHITE: np.array([0, 2, 1], dtype=np.intp),
+}
+
+_ENCODERS: Dict[str, Type[Encoder]] = {}
+
+
+def register_encoder(cls: Type[Encoder]) -> Type[Encoder]:
+    """ Class decorator making an encoder available to get_encoder_by_name() under its `name`. """
+    if cls.name in _ENCODERS:
+        raise ValueError("Encoder %r is already registered" % cls.name)
+    _ENCODERS[cls.name] = cls
+    return cls
+
+
+def get_encoder_by_name(name: str, board_size: BoardSize, **kwargs) -> Encoder:
+    if name not in _ENCODERS:
+        raise ValueError("Unknown encoder %r, expected one of %s" % (name, ", ".join(encoder_names())))
+    return _ENCODERS[name](board_size, **kwargs)
+
+
+def encoder_names() -> Sequence[str]:
+    return sorted(_ENCODERS)
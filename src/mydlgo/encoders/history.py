@@ -0,0 +1,45 @@
+from __future__ import annotations
+from typing import Optional
+
+import numpy as np
+
+from mydlgo.goboard import GameState
+from mydlgo.gotypes import Player
+from .base import BoardSize, Encoder, register_encoder, relative_colors
+
+__all__ = ["HistoryEncoder"]
+
+
+@register_encoder
+class HistoryEncoder(Encoder):
+    """ The stones of the last `history` positions and the turn.
+
+    Planes 2k and 2k + 1 hold the stones of the player to move and of the opponent k moves ago, found
+    through `previous_state`; they stay empty before the start of the game. The last plane is all ones
+    when black is to move. States created with push() share one board with their ancestors, so their
+    history can only be encoded from a chain built with apply_move().
+    """
+
+    name = "history"
+
+    def __init__(self, board_size: BoardSize, dtype=np.float32, history: int = 8):
+        Encoder.__init__(self, board_size, dtype)
+        self.history = history
+        self.num_planes = 2 * history + 1
+        # Own and opponent planes, indexed by stone value, for each player to move.
+        self._tables = {
+            player: np.array([[0, 1, 0], [0, 0, 1]], dtype=self.dtype)[:, relative_colors(player)]
+            for player in (Player.BLACK, Player.WHITE)
+        }
+
+    def encode_into(self, game_state: GameState, out: np.ndarray):
+        table = self._tables[game_state.next_player]
+        state: Optional[GameState] = game_state
+        for k in range(self.history):
+            planes = out[2 * k : 2 * k + 2]
+            if state is None:
+                planes.fill(0)
+                continue
+            np.take(table, state.board.as_array(), axis=1, out=planes, mode="clip")
+            state = state.previous_state
+        out[-1].fill(1 if game_state.next_player == Player.BLACK else 0)
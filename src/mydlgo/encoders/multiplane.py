@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import numpy as np
+
+from mydlgo.goboard import GameState, Move
+from mydlgo.gotypes import Player
+from .base import BoardSize, Encoder, register_encoder, relative_colors
+
+__all__ = ["MultiPlaneEncoder"]
+
+MAX_LIBERTIES = 4
+
+
+@register_encoder
+class MultiPlaneEncoder(Encoder):
+    """ Stones split by liberties, ko and turn, from the point of view of the player to move.
+
+    Planes 0-3 hold the stones of the player to move whose string has 1, 2, 3 or at least 4 liberties,
+    planes 4-7 the same for the opponent, plane 8 the points where ko forbids playing and plane 9 is all
+    ones when black is to move. Ko is only looked for next to the last move, where a stone can be
+    retaken; a superko repetition elsewhere on the board is not marked.
+    """
+
+    name = "multiplane"
+    num_planes = 2 * MAX_LIBERTIES + 2
+
+    def __init__(self, board_size: BoardSize, dtype=np.float32):
+        Encoder.__init__(self, board_size, dtype)
+        # Stone planes by key = relative color * (MAX_LIBERTIES + 1) + capped liberties.
+        width = MAX_LIBERTIES + 1
+        self._table = np.zeros((2 * MAX_LIBERTIES, 3 * width), dtype=self.dtype)
+        for side in (1, 2):
+            for libs in range(1, width):
+                self._table[(side - 1) * MAX_LIBERTIES + libs - 1, side * width + libs] = 1
+        self._key = np.empty((self.num_rows, self.num_cols), dtype=np.intp)
+        self._libs = np.empty((self.num_rows, self.num_cols), dtype=np.intp)
+
+    def encode_into(self, game_state: GameState, out: np.ndarray):
+        board = game_state.board
+        player = game_state.next_player
+        key = self._key
+        np.take(relative_colors(player), board.as_array(), out=key, mode="clip")
+        np.multiply(key, MAX_LIBERTIES + 1, out=key)
+        np.minimum(board.liberty_array(), MAX_LIBERTIES, out=self._libs)
+        np.add(key, self._libs, out=key)
+        np.take(self._table, key, axis=1, out=out[: 2 * MAX_LIBERTIES], mode="clip")
+
+        ko = out[2 * MAX_LIBERTIES]
+        ko.fill(0)
+        last_move = game_state.last_move
+        if last_move is not None and last_move.point is not None:
+            for neighbor in last_move.point.neighbors():
+                if (
+                    board.is_on_grid(neighbor)
+                    and board.get_player_at(neighbor) is None
+                    and game_state.does_move_violate_ko(player, Move.play(neighbor))
+                ):
+                    ko[neighbor.row - 1, neighbor.col - 1] = 1
+        out[2 * MAX_LIBERTIES + 1].fill(1 if player == Player.BLACK else 0)
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import numpy as np
+
+from mydlgo.goboard import GameState
+from mydlgo.gotypes import Player
+from .base import BoardSize, Encoder, register_encoder, relative_colors
+
+__all__ = ["OnePlaneEncoder"]
+
+
+@register_encoder
+class OnePlaneEncoder(Encoder):
+    """ A single plane: 1 for stones of the player to move, -1 for the opponent's, 0 for empty points. """
+
+    name = "oneplane"
+    num_planes = 1
+
+    def __init__(self, board_size: BoardSize, dtype=np.float32):
+        Encoder.__init__(self, board_size, dtype)
+        self._values = {
+            player: np.array([0, 1, -1], dtype=self.dtype)[relative_colors(player)]
+            for player in (Player.BLACK, Player.WHITE)
+        }
+
+    def encode_into(self, game_state: GameState, out: np.ndarray):
+        np.take(self._values[game_state.next_player], game_state.board.as_array(), out=out[0], mode="clip")
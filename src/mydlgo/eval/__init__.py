@@ -0,0 +1,3 @@
+from .base import *  # noqa;
+from .queue import *  # noqa;
+from .evaluators import *  # noqa;
@@ -0,0 +1,51 @@
+from __future__ import annotations
+import copy
+from typing import Any, Callable, Sequence
+
+import numpy as np
+
+from mydlgo.goboard import GameState
+
+__all__ = ["Evaluator", "FunctionEvaluator"]
+
+
+class Evaluator:
+    """ Scores positions from the point of view of the player to move, many at a time.
+
+    An evaluator is also a plain `eval_fn(game_state)`, so it can be given to any search. Batch
+    evaluation happens in two steps: prepare() takes what the evaluator needs from a position while
+    it is on the board, and evaluate_prepared() scores a whole batch of those at once. Searches that
+    push and pop moves on a shared board call prepare() before popping.
+    """
+
+    def __call__(self, game_state: GameState) -> float:
+        return float(self.evaluate_prepared([self.prepare(game_state)])[0])
+
+    def prepare(self, game_state: GameState) -> Any:
+        """ By default a copy of the position that does not share the board. """
+        return game_state.__class__(
+            copy.deepcopy(game_state.board), game_state.next_player, game_state.previous_state, game_state.last_move
+        )
+
+    def evaluate_prepared(self, items: Sequence[Any]) -> np.ndarray:
+        raise NotImplementedError()
+
+    def evaluate_batch(self, game_states: Sequence[GameState]) -> np.ndarray:
+        return self.evaluate_prepared([self.prepare(game_state) for game_state in game_states])
+
+
+class FunctionEvaluator(Evaluator):
+    """ Batch interface over an existing `eval_fn(game_state)`, one position at a time. """
+
+    def __init__(self, eval_fn: Callable[[GameState], float]):
+        self.eval_fn = eval_fn
+
+    def __call__(self, game_state: GameState) -> float:
+        return self.eval_fn(game_state)
+
+    def prepare(self, game_state: GameState) -> float:
+        # Nothing to gain from batching, so score right away instead of copying the position.
+        return self.eval_fn(game_state)
+
+    def evaluate_prepared(self, items: Sequence[float]) -> np.ndarray:
+        return np.array(items, dtype=np.float64)
@@ -0,0 +1,148 @@
+"""
+Evaluators working on the (num_rows, num_cols) stone arrays of `Board.as_array()`.
+
+A batch of positions is stacked into one (N, num_rows, num_cols) array with the color to move of
+each position, and every evaluator is a few whole-array operations on that stack. Scores are from the
+point of view of the player to move and are whole numbers, as the minimax searches expect.
+"""
+from __future__ import annotations
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+from mydlgo.goboard import GameState
+from mydlgo.goboard_batch import string_planes
+from mydlgo.gotypes import Player
+from mydlgo.scoring import BLACK_STONES, BLACK_TERRITORY, WHITE_STONES, WHITE_TERRITORY, area_scores, territory_counts
+from .base import Evaluator
+
+__all__ = [
+    "StoneDifference",
+    "LibertyWeighted",
+    "TerritoryEstimate",
+    "Influence",
+    "liberty_counts",
+    "stone_difference",
+]
+
+Prepared = Tuple[np.ndarray, int]
+
+
+def _stack(items: Sequence[Prepared]) -> Tuple[np.ndarray, np.ndarray]:
+    stones = np.stack([stones for stones, _ in items])
+    colors = np.array([color for _, color in items], dtype=np.int8)
+    return stones, colors[:, None, None]
+
+
+def _signed(stones: np.ndarray, colors: np.ndarray) -> np.ndarray:
+    """ +1 for stones of the player to move, -1 for the opponent's, 0 for empty points. """
+    return 2 * (stones == colors).astype(np.int32) - (stones != 0)
+
+
+def _neighbor_sum(values: np.ndarray) -> np.ndarray:
+    # Shifted slices added in place; padding the stack first costs more than the sums on small boards.
+    total = np.zeros_like(values)
+    total[:, 1:] += values[:, :-1]
+    total[:, :-1] += values[:, 1:]
+    total[:, :, 1:] += values[:, :, :-1]
+    total[:, :, :-1] += values[:, :, 1:]
+    return total
+
+
+def liberty_counts(stones: np.ndarray) -> np.ndarray:
+    """ Liberties of the string of every stone of an (N, num_rows, num_cols) stack, 0 on empty points. """
+    return string_planes(stones)[1]
+
+
+class _ArrayEvaluator(Evaluator):
+    def __call__(self, game_state: GameState) -> float:
+        stones = game_state.board.as_array()[None]
+        colors = np.array(game_state.next_player.value, dtype=np.int8).reshape(1, 1, 1)
+        return float(self.evaluate_arrays(stones, colors)[0])
+
+    def prepare(self, game_state: GameState) -> Prepared:
+        # as_array() follows the board, which the caller may change before the batch is evaluated.
+        return game_state.board.as_array().copy(), game_state.next_player.value
+
+    def evaluate_prepared(self, items: Sequence[Prepared]) -> np.ndarray:
+        stones, colors = _stack(items)
+        return self.evaluate_arrays(stones, colors)
+
+    def evaluate_arrays(self, stones: np.ndarray, colors: np.ndarray) -> np.ndarray:
+        raise NotImplementedError()
+
+
+class StoneDifference(_ArrayEvaluator):
+    """ Our stones minus the opponent's. """
+
+    def evaluate_arrays(self, stones: np.ndarray, colors: np.ndarray) -> np.ndarray:
+        ours = np.count_nonzero(stones == colors, axis=(1, 2))
+        return 2 * ours - np.count_nonzero(stones, axis=(1, 2))
+
+
+class LibertyWeighted(_ArrayEvaluator):
+    """ Every stone counts the liberties of its string, up to `max_liberties`, so stones in atari are
+    worth little and safe stones a lot. """
+
+    def __init__(self, max_liberties: int = 4):
+        self.max_liberties = max_liberties
+
+    def __call__(self, game_state: GameState) -> float:
+        # A single board already knows its liberties, no need to label its strings.
+        board = game_state.board
+        signed = _signed(board.as_array()[None], np.int8(game_state.next_player.value))
+        return float((signed[0] * np.minimum(board.liberty_array(), self.max_liberties)).sum())
+
+    def evaluate_arrays(self, stones: np.ndarray, colors: np.ndarray) -> np.ndarray:
+        weights = np.minimum(liberty_counts(stones), self.max_liberties)
+        return (_signed(stones, colors) * weights).sum(axis=(1, 2))
+
+
+class Influence(_ArrayEvaluator):
+    """ Stones plus the empty points under our influence, minus the same for the opponent.
+
+    Every stone radiates a strength halved at each step, spread `radius` steps along the grid; an
+    empty point belongs to whoever has more influence on it. The spread is linear in the stones, so it
+    is a single product with a matrix built once per board size, for one position as for a batch.
+    """
+
+    def __init__(self, radius: int = 3):
+        self.radius = radius
+        self._kernels: Dict[Tuple[int, int], np.ndarray] = {}
+
+    def _kernel(self, num_rows: int, num_cols: int) -> np.ndarray:
+        """ Row i is the influence of a stone on the i-th point, on every point. """
+        if (num_rows, num_cols) not in self._kernels:
+            num_points = num_rows * num_cols
+            spread = np.eye(num_points).reshape(num_points, num_rows, num_cols) * 2.0 ** self.radius
+            kernel = spread
+            for _ in range(self.radius):
+                spread = _neighbor_sum(spread) / 2
+                kernel = kernel + spread
+            self._kernels[num_rows, num_cols] = kernel.reshape(num_points, num_points)
+        return self._kernels[num_rows, num_cols]
+
+    def evaluate_arrays(self, stones: np.ndarray, colors: np.ndarray) -> np.ndarray:
+        n, num_rows, num_cols = stones.shape
+        signed = _signed(stones, colors).reshape(n, -1)
+        field = signed @ self._kernel(num_rows, num_cols)
+        empty = stones.reshape(n, -1) == 0
+        return signed.sum(axis=1) + (np.sign(field) * empty).sum(axis=1).astype(np.int64)
+
+
+class TerritoryEstimate(_ArrayEvaluator):
+    """ Area score difference of `scoring.evaluate_territory`, without komi. """
+
+    def __call__(self, game_state: GameState) -> float:
+        # One position is cheaper to count in plain Python, or already counted on boards that track regions.
+        black, white = area_scores(game_state.board)
+        return float(black - white if game_state.next_player == Player.BLACK else white - black)
+
+    def evaluate_arrays(self, stones: np.ndarray, colors: np.ndarray) -> np.ndarray:
+        counts = territory_counts(stones)
+        black = counts[:, BLACK_STONES] + counts[:, BLACK_TERRITORY]
+        white = counts[:, WHITE_STONES] + counts[:, WHITE_TERRITORY]
+        return np.where(colors[:, 0, 0] == Player.BLACK.value, black - white, white - black)
+
+
+stone_difference = StoneDifference()
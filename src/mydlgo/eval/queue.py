@@ -0,0 +1,75 @@
+from __future__ import annotations
+import time
+from typing import Any, List, Optional
+
+from mydlgo.goboard import GameState
+from .base import Evaluator
+
+__all__ = ["EvaluationQueue", "PendingEvaluation"]
+
+
+class PendingEvaluation:
+    def __init__(self, queue: EvaluationQueue):
+        self._queue = queue
+        self._value: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        return self._value is not None
+
+    @property
+    def value(self) -> float:
+        """ The score, evaluating the queue right away if it has not been evaluated yet. """
+        if self._value is None:
+            self._queue.flush()
+        assert self._value is not None
+        return self._value
+
+
+class EvaluationQueue:
+    """ Collects positions and evaluates them in batches.
+
+    The queue is evaluated as soon as it holds `batch_size` positions, when the oldest position has
+    waited `timeout` seconds (checked whenever a position is added or poll() is called), or when the
+    value of a pending position is read.
+    """
+
+    def __init__(self, evaluator: Evaluator, batch_size: int = 256, timeout: Optional[float] = None):
+        self.evaluator = evaluator
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self._items: List[Any] = []
+        self._pending: List[PendingEvaluation] = []
+        self._oldest = 0.0
+        self.num_batches = 0
+        self.num_evaluated = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, game_state: GameState) -> PendingEvaluation:
+        if not self._items:
+            self._oldest = time.perf_counter()
+        self._items.append(self.evaluator.prepare(game_state))
+        pending = PendingEvaluation(self)
+        self._pending.append(pending)
+        if len(self._items) >= self.batch_size:
+            self.flush()
+        else:
+            self.poll()
+        return pending
+
+    def poll(self):
+        if self._items and self.timeout is not None and time.perf_counter() - self._oldest >= self.timeout:
+            self.flush()
+
+    def flush(self):
+        if not self._items:
+            return
+        items, pending = self._items, self._pending
+        self._items, self._pending = [], []
+        scores = self.evaluator.evaluate_prepared(items)
+        for evaluation, score in zip(pending, scores):
+            evaluation._value = float(score)
+        self.num_batches += 1
+        self.num_evaluated += len(items)
@@ -1,11 +1,20 @@
 from __future__ import annotations
-from typing import Dict, List, Set, FrozenSet, Tuple, Optional, Union
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Set, FrozenSet, Tuple, Optional, Union
 import copy
 
 from .gotypes import Player, Point
 from .scoring import compute_game_result
 from . import zobrist
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from . import goboard_bit, goboard_fast
+
+    # The board engines share an interface without sharing a base class.
+    AnyBoard = Union["Board", goboard_fast.Board, goboard_bit.Board]
+
 
 class Move:
     def __init__(self, point: Optional[Point] = None, is_pass=False, is_resign=False):
@@ -28,8 +37,20 @@ class Move:
     def resign(cls) -> Move:
         return Move(is_resign=True)
 
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, Move)
+            and self.point == other.point
+            and self.is_pass == other.is_pass
+            and self.is_resign == other.is_resign
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.point, self.is_pass, self.is_resign))
+
 
 StringOrLiberty = Union[Point, List[Point], Set[Point], FrozenSet[Point]]
+StringChange = Tuple[Point, Optional["GoString"]]
 
 
 class GoString:
@@ -68,12 +89,139 @@ class GoString:
         )
 
 
+def read_only_view(array: np.ndarray) -> np.ndarray:
+    """ A view of `array` that callers cannot write to, but that follows the changes made to it. """
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+# Whether each player may play at an empty point, and whether it captures there, black first.
+PointStatus = Optional[Tuple[Tuple[bool, bool], Tuple[bool, bool]]]
+
+
+class PointIndex:
+    """ Empty points of a board in raster order, the ones each player may play, and the ones where it captures.
+
+    A board only marks the points that a move or a rollback may have changed as pending, and the lists catch
+    up the next time they are read, so place_stone() pays nothing for positions nobody asks for their legal
+    moves. Keys are whatever the board indexes its points with, as long as they sort in raster order.
+    """
+
+    def __init__(self, keys: Iterable[Any], points: Optional[List[Point]] = None):
+        self.pending: Set[Any] = set(keys)
+        self._points = points  # the Point of every key, when keys are not points themselves
+        self.empty: List[Any] = []
+        self.playable: Tuple[List[Any], List[Any]] = ([], [])
+        self.moves: Tuple[List[Move], List[Move]] = ([], [])  # a Move for every playable key
+        self.capturing: Tuple[Set[Any], Set[Any]] = (set(), set())
+
+    def copy(self) -> PointIndex:
+        other = PointIndex((), self._points)
+        other.pending = self.pending.copy()
+        other.empty = self.empty[:]
+        other.playable = (self.playable[0][:], self.playable[1][:])
+        other.moves = (self.moves[0][:], self.moves[1][:])
+        other.capturing = (self.capturing[0].copy(), self.capturing[1].copy())
+        return other
+
+    def refresh(self, status: Callable[[Any], PointStatus]):
+        """ Bring the pending keys up to date; `status` tells how a key stands in the current position. """
+        for key in self.pending:
+            state = status(key)
+            _update_sorted(self.empty, None, key, state is not None)
+            for side in (0, 1):
+                if _update_sorted(self.playable[side], self.moves[side], key, state is not None and state[0][side]):
+                    point = key if self._points is None else self._points[key]
+                    self.moves[side].insert(bisect_left(self.playable[side], key), Move.play(point))
+                if state is not None and state[1][side]:
+                    self.capturing[side].add(key)
+                else:
+                    self.capturing[side].discard(key)
+        self.pending.clear()
+
+
+def _update_sorted(keys: List[Any], parallel: Optional[List[Any]], key: Any, member: bool) -> bool:
+    """ Insert or remove `key` in the sorted `keys`, deleting the matching entry of `parallel` along with it.
+
+    Returns whether `key` was inserted, so that the caller can insert into `parallel` too.
+    """
+    i = bisect_left(keys, key)
+    present = i < len(keys) and keys[i] == key
+    if member and not present:
+        keys.insert(i, key)
+        return True
+    if present and not member:
+        del keys[i]
+        if parallel is not None:
+            del parallel[i]
+    return False
+
+
+def _side(player: Player) -> int:
+    return 0 if player is Player.BLACK else 1
+
+
+def _atari_level(string: GoString) -> int:
+    """ Self-capture checks only distinguish strings with 0, 1 or more liberties. """
+    return min(string.num_liberties, 2)
+
+
 class Board:
     def __init__(self, num_rows: int, num_cols: int):
         self.num_rows = num_rows
         self.num_cols = num_cols
         self._grid: Dict[Point, Optional[GoString]] = {}
         self._hash = zobrist.EMPTY_BOARD
+        self._codes = zobrist.hash_codes(num_rows, num_cols)
+        # Hash, stone counts, grid changes and points marked for the PointIndex since every checkpoint.
+        self._undo: List[Tuple[int, Dict[Player, int], List[StringChange], Set[Point]]] = []
+        self._counts = {Player.BLACK: 0, Player.WHITE: 0}
+        # Stone colors row by row, written only where a stone is placed or removed.
+        self._stones = bytearray(num_rows * num_cols)
+        self._stones_view: Optional[np.ndarray] = None
+        # String id and liberty planes, labelled on request for the position with the stored hash.
+        self._planes: Optional[Tuple[int, np.ndarray, np.ndarray]] = None
+        self._index = PointIndex(Point(r, c) for r in range(1, num_rows + 1) for c in range(1, num_cols + 1))
+
+    def __deepcopy__(self, memo) -> Board:
+        # GoString is immutable, so copies can share every string and only need a new grid.
+        other = Board.__new__(Board)
+        other.num_rows = self.num_rows
+        other.num_cols = self.num_cols
+        other._grid = self._grid.copy()
+        other._hash = self._hash
+        other._codes = self._codes
+        other._undo = []
+        other._counts = self._counts.copy()
+        other._stones = self._stones[:]
+        other._stones_view = None
+        other._planes = self._planes
+        other._index = self._index.copy()
+        return other
+
+    def checkpoint(self):
+        """ Start recording grid changes so that the next rollback() can undo them. """
+        self._undo.append((self._hash, self._counts.copy(), [], set()))
+
+    def rollback(self):
+        """ Undo every change since the matching checkpoint(). """
+        board_hash, self._counts, changes, marked = self._undo.pop()
+        for point, string in reversed(changes):
+            self._grid[point] = string
+            self._set_color(point, string)
+        # The points a move may have changed are the ones its undo may change back.
+        self._index.pending |= marked
+        self._hash = board_hash
+
+    def _set_string(self, point: Point, string: Optional[GoString]):
+        if self._undo:
+            self._undo[-1][2].append((point, self._grid.get(point)))
+        self._grid[point] = string
+
+    def _set_color(self, point: Point, string: Optional[GoString]):
+        color = 0 if string is None else 1 if string.color is Player.BLACK else 2
+        self._stones[(point.row - 1) * self.num_cols + point.col - 1] = color
 
     def place_stone(self, player: Player, point: Point):
         assert self.is_on_grid(point)
@@ -102,22 +250,52 @@ class Board:
 
         for same_color_string in adjacent_same_color:  # 同じ色の隣接する連をマージする
             new_string = new_string.merged_with(same_color_string)
-        for new_string_point in new_string.stones:
-            self._grid[new_string_point] = new_string
-        self._hash ^= zobrist.HASH_CODE[point, player]
-
+        self._replace_string(new_string)
+        k = (point.row - 1) * self.num_cols + point.col - 1
+        color = 1 if player is Player.BLACK else 2
+        self._stones[k] = color
+        self._hash ^= self._codes[k * 3 + color]
+        self._counts[player] += 1
+
+        # Only the new stone, its neighbors, the captured points and the liberties of strings whose
+        # liberty count crossed the atari threshold can change how the PointIndex sees them.
+        dirty = set(liberties)
+        dirty.add(point)
+        if adjacent_same_color:
+            level = _atari_level(new_string)
+            if any(_atari_level(string) != level for string in adjacent_same_color):
+                dirty |= new_string.liberties
+        captured: List[GoString] = []
         for other_color_string in adjacent_opposite_color:  # 敵の色の隣接する連の呼吸点を減らす
             replacement = other_color_string.without_liberty(point)
             if replacement.num_liberties > 0:
-                self._replace_string(other_color_string.without_liberty(point))
+                self._replace_string(replacement)
+                if _atari_level(replacement) != _atari_level(other_color_string):
+                    dirty |= replacement.liberties
             else:
-                self._remove_string(other_color_string)
+                captured.append(other_color_string)
+        for captured_string in captured:
+            # Strings in atari that the capture relieves gain only captured points as liberties.
+            for stone in captured_string.stones:
+                for neighbor in stone.neighbors():
+                    string = self._grid.get(neighbor)
+                    if string is not None and string.color == player and string.num_liberties < 2:
+                        dirty |= string.liberties
+            self._remove_string(captured_string)
+            dirty |= captured_string.stones
+        self._index.pending |= dirty
+        if self._undo:
+            self._undo[-1][3].update(dirty)
 
     def _replace_string(self, new_string: GoString):
+        grid = self._grid
+        if self._undo:
+            self._undo[-1][2].extend((point, grid.get(point)) for point in new_string.stones)
         for point in new_string.stones:
-            self._grid[point] = new_string
+            grid[point] = new_string
 
     def _remove_string(self, string: GoString):
+        color = 1 if string.color is Player.BLACK else 2
         for point in string.stones:
             for neighbor in point.neighbors():
                 neighbor_string = self._grid.get(neighbor)
@@ -125,8 +303,11 @@ class Board:
                     continue
                 if neighbor_string is not string:
                     self._replace_string(neighbor_string.with_liberty(point))
-            self._grid[point] = None
-            self._hash ^= zobrist.HASH_CODE[point, string.color]
+            self._set_string(point, None)
+            k = (point.row - 1) * self.num_cols + point.col - 1
+            self._stones[k] = 0
+            self._hash ^= self._codes[k * 3 + color]
+        self._counts[string.color] -= len(string.stones)
 
     def is_on_grid(self, point: Point) -> bool:
         return 1 <= point.row <= self.num_rows and 1 <= point.col <= self.num_cols
@@ -143,21 +324,143 @@ class Board:
             return None
         return string
 
+    def is_self_capture(self, player: Player, point: Point) -> bool:
+        """ Whether playing at the empty `point` would leave the new string without liberties. """
+        friendly_strings: List[GoString] = []
+        for neighbor in point.neighbors():
+            if not self.is_on_grid(neighbor):
+                continue
+            neighbor_string = self._grid.get(neighbor)
+            if neighbor_string is None:  # 隣接する空点があれば自殺手ではない
+                return False
+            if neighbor_string.color == player:
+                friendly_strings.append(neighbor_string)
+            elif neighbor_string.num_liberties == 1:  # 敵の連を取る手は自殺手ではない
+                return False
+        return all(string.num_liberties == 1 for string in friendly_strings)
+
+    def hash_after(self, player: Player, point: Point) -> int:
+        """ Zobrist hash of the board after `player` plays at `point`, without placing the stone. """
+        next_hash = self._hash ^ self._hash_code(point, player)
+        captured: List[GoString] = []
+        for neighbor in point.neighbors():
+            neighbor_string = self._grid.get(neighbor)
+            if (
+                neighbor_string is None
+                or neighbor_string.color == player
+                or neighbor_string.num_liberties != 1
+                or any(neighbor_string is string for string in captured)
+            ):
+                continue
+            captured.append(neighbor_string)
+            for stone in neighbor_string.stones:
+                next_hash ^= self._hash_code(stone, neighbor_string.color)
+        return next_hash
+
+    def empty_points(self) -> List[Point]:
+        self._index.refresh(self._status)
+        return self._index.empty[:]
+
+    def playable_points(self, player: Player) -> List[Point]:
+        """ Empty points where `player` would not self-capture, in raster order. Ko is not considered. """
+        self._index.refresh(self._status)
+        return self._index.playable[_side(player)][:]
+
+    def playable_moves(self, player: Player) -> List[Move]:
+        """ The moves at playable_points(), made once when a point becomes playable rather than on every call. """
+        self._index.refresh(self._status)
+        return self._index.moves[_side(player)][:]
+
+    def capturing_points(self, player: Player) -> List[Point]:
+        """ Empty points where `player` would capture a string, in no particular order. """
+        self._index.refresh(self._status)
+        return list(self._index.capturing[_side(player)])
+
+    def _status(self, point: Point) -> PointStatus:
+        if self._grid.get(point) is not None:
+            return None
+        liberty = False
+        safe = [False, False]  # next to a friendly string with another liberty
+        captures = [False, False]
+        for neighbor in point.neighbors():
+            if not self.is_on_grid(neighbor):
+                continue
+            string = self._grid.get(neighbor)
+            if string is None:
+                liberty = True
+            elif string.num_liberties > 1:
+                safe[_side(string.color)] = True
+            else:
+                captures[1 - _side(string.color)] = True
+        return (
+            (liberty or safe[0] or captures[0], liberty or safe[1] or captures[1]),
+            (captures[0], captures[1]),
+        )
+
+    def num_stones(self, player: Player) -> int:
+        return self._counts[player]
+
+    def stone_bytes(self) -> bytes:
+        """ Stones row by row as in as_array(), without NumPy. """
+        return bytes(self._stones)
+
+    def as_array(self) -> np.ndarray:
+        """ Stones as a read-only (num_rows, num_cols) int8 array, 0 empty, 1 black, 2 white, row 1 first.
+
+        The array is a view that place_stone() and rollback() keep up to date, so it is not a snapshot:
+        copy it to keep a position.
+        """
+        if self._stones_view is None:
+            # Playing and scoring do not need NumPy; only the array views import it.
+            import numpy as np
+
+            stones = np.frombuffer(self._stones, dtype=np.int8).reshape(self.num_rows, self.num_cols)
+            self._stones_view = read_only_view(stones)
+        return self._stones_view
+
+    def string_array(self) -> np.ndarray:
+        """ Read-only id of the string of every stone, the dense index `(row - 1) * num_cols + (col - 1)`
+        of its first stone in raster order, -1 on empty points. """
+        return self._string_planes()[1]
+
+    def liberty_array(self) -> np.ndarray:
+        """ Read-only liberty count of the string of every stone, 0 on empty points. """
+        return self._string_planes()[2]
+
+    def _string_planes(self) -> Tuple[int, np.ndarray, np.ndarray]:
+        # Labelled once per position on request, so that place_stone() pays nothing for the planes.
+        if self._planes is None or self._planes[0] != self._hash:
+            from .goboard_batch import string_planes
+
+            ids, libs = string_planes(self.as_array()[None])
+            self._planes = (self._hash, read_only_view(ids[0]), read_only_view(libs[0]))
+        return self._planes
+
+    def _hash_code(self, point: Point, player: Player) -> int:
+        # Comparing identities is much cheaper than `player.value`, an Enum property.
+        color = 1 if player is Player.BLACK else 2
+        return self._codes[((point.row - 1) * self.num_cols + point.col - 1) * 3 + color]
+
     def zobrist_hash(self) -> int:
         return self._hash
 
 
 class GameState:
-    def __init__(self, board: Board, next_player: Player, previous: Optional[GameState], move: Optional[Move]):
+    def __init__(self, board: AnyBoard, next_player: Player, previous: Optional[GameState], move: Optional[Move]):
         self.board = board
         self.next_player = next_player
         self.previous_state = previous
         self.previous_states: FrozenSet = (
-            frozenset(previous.previous_states | {(previous.next_player, previous.board.zobrist_hash())})
+            frozenset(previous.previous_states | {(previous.next_player, previous._hash)})
             if previous is not None
             else frozenset()
         )
         self.last_move = move
+        self._hash: int = board.zobrist_hash()
+        # The most stones any earlier position had, which tells legal_moves() when a move that captures
+        # nothing cannot repeat one.
+        self._num_stones = board.num_stones(Player.BLACK) + board.num_stones(Player.WHITE)
+        self._peak_stones: int = max(previous._peak_stones, previous._num_stones) if previous is not None else -1
 
     def apply_move(self, move: Move) -> GameState:
         if move.is_play:
@@ -166,15 +469,36 @@ class GameState:
             next_board.place_stone(self.next_player, move.point)
         else:
             next_board = self.board
-        return GameState(next_board, self.next_player.other, self, move)
+        return self.__class__(next_board, self.next_player.other, self, move)
+
+    def push(self, move: Move) -> GameState:
+        """ Play `move` on this state's board in place and return the child state sharing that board.
+
+        The parent must not be used until the child is undone with pop(). This lets searchers walk
+        a tree with a single board instead of copying it for every node.
+        """
+        if move.is_play:
+            assert move.point is not None
+            self.board.checkpoint()
+            self.board.place_stone(self.next_player, move.point)
+        return self.__class__(self.board, self.next_player.other, self, move)
+
+    def pop(self) -> GameState:
+        """ Undo the push() that created this state and return the parent state. """
+        assert self.previous_state is not None and self.previous_state.board is self.board
+        if self.last_move is not None and self.last_move.is_play:
+            self.board.rollback()
+        return self.previous_state
 
     @classmethod
-    def new_game(cls, board_size: int) -> GameState:
-        board = Board(board_size, board_size)
+    def new_game(cls, board_size: Union[int, Tuple[int, int]]) -> GameState:
+        """ Empty board of board_size x board_size points, or of (num_rows, num_cols). """
+        num_rows, num_cols = (board_size, board_size) if isinstance(board_size, int) else board_size
+        board = Board(num_rows, num_cols)
         return GameState(board, Player.BLACK, None, None)
 
     @property
-    def situation(self) -> Tuple[Player, Board]:
+    def situation(self) -> Tuple[Player, AnyBoard]:
         return (self.next_player, self.board)
 
     def is_over(self) -> bool:
@@ -192,19 +516,14 @@ class GameState:
             return False
         assert move.point is not None
 
-        next_board = copy.deepcopy(self.board)
-        next_board.place_stone(player, move.point)
-        new_string = next_board.get_go_string(move.point)
-        return new_string.is_captured() if new_string is not None else False
+        return self.board.is_self_capture(player, move.point)
 
     def does_move_violate_ko(self, player: Player, move: Move) -> bool:
         if not move.is_play:
             return False
         assert move.point is not None
 
-        next_board = copy.deepcopy(self.board)
-        next_board.place_stone(player, move.point)
-        next_situation = (player.other, next_board.zobrist_hash())
+        next_situation = (player.other, self.board.hash_after(player, move.point))
         return next_situation in self.previous_states
 
     def is_valid_move(self, move: Move) -> bool:
@@ -222,16 +541,26 @@ class GameState:
 
     def legal_moves(self) -> List[Move]:
         moves: List[Move] = []
-        for row in range(1, self.board.num_rows + 1):
-            for col in range(1, self.board.num_cols + 1):
-                move = Move.play(Point(row, col))
-                if self.is_valid_move(move):
-                    moves.append(move)
+        if not self.is_over():
+            moves = self.board.playable_moves(self.next_player)
+            violations = [point for point in self._ko_candidates() if self._violates_ko(point)]
+            if violations:
+                moves = [move for move in moves if move.point not in violations]
         moves.append(Move.pass_turn())
         moves.append(Move.resign())
 
         return moves
 
+    def _ko_candidates(self) -> List[Point]:
+        """ Points where a move may repeat an earlier position. """
+        if self._peak_stones <= self._num_stones:
+            # A move that captures nothing leaves more stones than any earlier position had.
+            return self.board.capturing_points(self.next_player)
+        return self.board.playable_points(self.next_player)
+
+    def _violates_ko(self, point: Point) -> bool:
+        return (self.next_player.other, self.board.hash_after(self.next_player, point)) in self.previous_states
+
     def winner(self) -> Optional[Player]:
         if not self.is_over():
             return None
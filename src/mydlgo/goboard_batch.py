@@ -0,0 +1,405 @@
+"""
+Many games on stacked NumPy arrays.
+
+Each game lives on a padded board flattened to (num_rows + 2) * (num_cols + 2) cells, the outer ring
+holding BORDER, so a neighbor is always `index +- 1` or `index +- stride` and never wraps into another
+row. A batch of N games is an (N, cells) int8 array, and every step (placing N stones, capturing,
+hashing, computing N legal move masks) is a handful of whole-array operations.
+
+Moves are given as dense point indices `(row - 1) * num_cols + (col - 1)`, or PASS. Unlike GameState,
+the batch only forbids simple ko (retaking a single stone right away); positional superko would need a
+per-game history that does not vectorize.
+"""
+from __future__ import annotations
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from . import zobrist
+from .gotypes import Point
+from .scoring import BLACK_STONES, BLACK_TERRITORY, WHITE_STONES, WHITE_TERRITORY
+
+EMPTY = 0
+BLACK = 1
+WHITE = 2
+BORDER = 3
+
+PASS = -1
+
+_HASH_CODES: Dict[Tuple[int, int], np.ndarray] = {}
+
+
+def _hash_codes(num_rows: int, num_cols: int) -> np.ndarray:
+    """ Zobrist codes indexed by [color, padded cell], shared between all batches of the same size. """
+    key = (num_rows, num_cols)
+    if key not in _HASH_CODES:
+        stride = num_cols + 2
+        rows, cols = np.meshgrid(np.arange(1, num_rows + 1), np.arange(1, num_cols + 1), indexing="ij")
+        cells = rows * stride + cols
+        table = np.array(zobrist.hash_codes(num_rows, num_cols), dtype=np.uint64)
+        codes = np.zeros((3, (num_rows + 2) * stride), dtype=np.uint64)
+        for color in (BLACK, WHITE):
+            codes[color, cells] = table[((rows - 1) * num_cols + cols - 1) * 3 + color]
+        _HASH_CODES[key] = codes
+    return _HASH_CODES[key]
+
+
+def label_components(group: np.ndarray, stride: int) -> np.ndarray:
+    """ Label the 4-connected components of cells sharing the same non-zero `group` value.
+
+    `group` is (N, cells) over padded boards. Every cell of a component is labelled with the index into
+    `group.ravel()` of the first cell of the component, and cells whose group is 0 are labelled -1.
+    Labels are spread with min-hooking between neighbors plus pointer jumping until nothing changes.
+    """
+    n, size = group.shape
+    big = n * size
+    labels = np.where(group > 0, np.arange(big, dtype=np.int64).reshape(n, size), big)
+    links = []
+    for off in (1, stride):
+        links.append((off, (group[:, off:] == group[:, :-off]) & (group[:, off:] > 0)))
+
+    while True:
+        hooked = labels.copy()
+        for off, same in links:
+            np.minimum(hooked[:, :-off], np.where(same, labels[:, off:], big), out=hooked[:, :-off])
+            np.minimum(hooked[:, off:], np.where(same, labels[:, :-off], big), out=hooked[:, off:])
+        flat = hooked.ravel()
+        inside = np.flatnonzero(flat < big)
+        while True:
+            jumped = flat[flat[inside]]
+            if np.array_equal(jumped, flat[inside]):
+                break
+            flat[inside] = jumped
+        if np.array_equal(hooked, labels):
+            return np.where(labels < big, labels, -1)
+        labels = hooked
+
+
+def area_owners(cells: np.ndarray, stride: int) -> np.ndarray:
+    """ Color that counts each cell in area scoring: its stone, or the only color around its empty
+    region. Dame and the border are EMPTY.
+
+    `cells` is (N, cells) over padded boards with BORDER around. As in scoring.evaluate_territory, an
+    empty region is territory when the stones around it are all of one color and dame otherwise; all
+    regions of all games are labelled in one call of label_components.
+    """
+    empty = cells == EMPTY
+    regions = label_components(empty.astype(np.int8), stride).ravel()
+    flat = cells.ravel()
+    empty_cells = np.flatnonzero(empty)
+    touches_black = np.zeros(flat.size, dtype=bool)
+    touches_white = np.zeros(flat.size, dtype=bool)
+    for off in (-stride, stride, -1, 1):
+        # Empty cells are never on the border, so their neighbors belong to the same game.
+        neighbor = flat[empty_cells + off]
+        touches_black[regions[empty_cells[neighbor == BLACK]]] = True
+        touches_white[regions[empty_cells[neighbor == WHITE]]] = True
+    region = regions[empty_cells]
+    owners = np.where(flat == BORDER, EMPTY, flat).astype(np.int8)
+    owners[empty_cells] = np.where(
+        touches_black[region] & ~touches_white[region],
+        BLACK,
+        np.where(touches_white[region] & ~touches_black[region], WHITE, EMPTY),
+    )
+    return owners.reshape(cells.shape)
+
+
+def territory_counts(cells: np.ndarray, stride: int) -> np.ndarray:
+    """ (N, 5) counts of black stones, white stones, black territory, white territory and dame, with
+    `cells` as in area_owners. The columns are named in scoring. """
+    owners = area_owners(cells, stride)
+    empty = cells == EMPTY
+    return np.stack(
+        [
+            np.count_nonzero(cells == BLACK, axis=1),
+            np.count_nonzero(cells == WHITE, axis=1),
+            np.count_nonzero(empty & (owners == BLACK), axis=1),
+            np.count_nonzero(empty & (owners == WHITE), axis=1),
+            np.count_nonzero(empty & (owners == EMPTY), axis=1),
+        ],
+        axis=1,
+    )
+
+
+def string_planes(stones: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """ String ids and liberty counts of every stone of an (N, num_rows, num_cols) stone stack.
+
+    The id of a string is the dense point index `(row - 1) * num_cols + (col - 1)` of its first stone in
+    raster order. Empty points have id -1 and 0 liberties.
+    """
+    n, num_rows, num_cols = stones.shape
+    stride = num_cols + 2
+    size = (num_rows + 2) * stride
+    padded = np.pad(stones, ((0, 0), (1, 1), (1, 1))).reshape(n, size)
+    labels = label_components(padded, stride).ravel()
+    # Distinct (string, empty neighbor) pairs; the padding is empty too but belongs to no string's
+    # liberties, so pairs through it are dropped.
+    on_board = np.pad(np.ones((n, num_rows, num_cols), dtype=bool), ((0, 0), (1, 1), (1, 1))).ravel()
+    empty = np.flatnonzero((padded.ravel() == EMPTY) & on_board)
+    pairs = []
+    for off in (1, -1, stride, -stride):
+        string = labels[empty + off]
+        owned = string >= 0
+        pairs.append(string[owned] * labels.size + empty[owned])
+    unique = np.unique(np.concatenate(pairs))
+    libs = np.bincount(unique // labels.size, minlength=labels.size)
+
+    stone = labels >= 0
+    counts = np.where(stone, libs[np.maximum(labels, 0)], 0)
+    cell = labels % size
+    ids = np.where(stone, (cell // stride - 1) * num_cols + cell % stride - 1, -1)
+    shape = (n, num_rows + 2, stride)
+    return (
+        ids.reshape(shape)[:, 1:-1, 1:-1].astype(np.int32),
+        counts.reshape(shape)[:, 1:-1, 1:-1].astype(np.int32),
+    )
+
+
+class BatchBoard:
+    def __init__(self, num_games: int, num_rows: int, num_cols: int):
+        self.num_games = num_games
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self.stride = num_cols + 2
+        self.num_cells = (num_rows + 2) * self.stride
+
+        cells = np.full((num_rows + 2, self.stride), BORDER, dtype=np.int8)
+        cells[1:-1, 1:-1] = EMPTY
+        self.cells = np.tile(cells.ravel(), (num_games, 1))
+        self.hashes = np.full(num_games, zobrist.EMPTY_BOARD, dtype=np.uint64)
+        # String id of every stone: the index into cells.ravel() of the stone that was played last when
+        # the string was formed, which stays part of the string until it is captured. -1 if no stone.
+        self.labels = np.full(self.cells.shape, -1, dtype=np.int64)
+        self._codes = _hash_codes(num_rows, num_cols)
+        self.point_cells = (
+            (np.arange(num_rows)[:, None] + 1) * self.stride + np.arange(num_cols)[None, :] + 1
+        ).ravel()
+        self._analysis: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+    @classmethod
+    def from_stones(cls, stones: np.ndarray) -> BatchBoard:
+        """ One game per position of an (N, num_rows, num_cols) stack of `Board.as_array()`. """
+        num_games, num_rows, num_cols = stones.shape
+        board = cls(num_games, num_rows, num_cols)
+        board.grid()[:] = stones
+        board.labels = label_components(np.where(board.cells == BORDER, EMPTY, board.cells), board.stride)
+        # Empty points and the border have no codes, so every cell can be looked up.
+        codes = board._codes[np.minimum(board.cells, WHITE), np.arange(board.num_cells)]
+        board.hashes[:] = np.uint64(zobrist.EMPTY_BOARD) ^ np.bitwise_xor.reduce(codes, axis=1)
+        return board
+
+    def copy(self) -> BatchBoard:
+        other = BatchBoard.__new__(BatchBoard)
+        other.__dict__.update(self.__dict__)
+        other.cells = self.cells.copy()
+        other.hashes = self.hashes.copy()
+        other.labels = self.labels.copy()
+        return other
+
+    def grid(self) -> np.ndarray:
+        """ (N, num_rows, num_cols) view of the stones: 0 empty, 1 black, 2 white. """
+        return self.cells.reshape(self.num_games, self.num_rows + 2, self.stride)[:, 1:-1, 1:-1]
+
+    def point_index(self, point: Point) -> int:
+        return (point.row - 1) * self.num_cols + (point.col - 1)
+
+    def point(self, index: int) -> Point:
+        return Point(index // self.num_cols + 1, index % self.num_cols + 1)
+
+    def _shifted(self, values: np.ndarray, off: int, fill) -> np.ndarray:
+        """ values[:, i + off] for every cell i, padded with `fill` past the ends. """
+        shifted = np.full_like(values, fill)
+        if off > 0:
+            shifted[:, :-off] = values[:, off:]
+        else:
+            shifted[:, -off:] = values[:, :off]
+        return shifted
+
+    def _neighbor_offsets(self) -> Tuple[int, int, int, int]:
+        return (-self.stride, self.stride, -1, 1)
+
+    def analyze(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """ String labels, liberty level (0, 1 or 2 meaning "two or more") and last liberty per cell.
+
+        The level and last liberty are those of the string occupying the cell. Cached until the next
+        stone is placed.
+        """
+        if self._analysis is None:
+            cells = self.cells.ravel()
+            labels = self.labels.ravel()
+            big = cells.size
+            stones = np.flatnonzero(labels >= 0)
+            first = np.full(len(stones), big, dtype=np.int64)
+            last = np.full(len(stones), -1, dtype=np.int64)
+            for off in self._neighbor_offsets():
+                neighbors = stones + off  # stones are never on the border, so this stays in the same game
+                empty_neighbor = cells[neighbors] == EMPTY
+                np.minimum(first, np.where(empty_neighbor, neighbors, big), out=first)
+                np.maximum(last, np.where(empty_neighbor, neighbors, -1), out=last)
+
+            stone_labels = labels[stones]
+            string_first = np.full(big, big, dtype=np.int64)
+            string_last = np.full(big, -1, dtype=np.int64)
+            np.minimum.at(string_first, stone_labels, first)
+            np.maximum.at(string_last, stone_labels, last)
+
+            level = np.zeros(big, dtype=np.int8)
+            liberty = np.full(big, -1, dtype=np.int64)
+            first = string_first[stone_labels]
+            last = string_last[stone_labels]
+            level[stones] = np.where(first == big, 0, np.where(first == last, 1, 2))
+            liberty[stones] = np.where(first == big, -1, first)
+            self._analysis = (self.labels, level.reshape(self.cells.shape), liberty.reshape(self.cells.shape))
+        return self._analysis
+
+    def playable(self, colors: np.ndarray) -> np.ndarray:
+        """ (N, cells) mask of empty cells where colors[i] would not self-capture in game i. """
+        cells = self.cells
+        _, level, _ = self.analyze()
+        own = colors[:, None]
+        opp = BLACK + WHITE - own
+        ok = np.zeros(cells.shape, dtype=bool)
+        for off in self._neighbor_offsets():
+            neighbor = self._shifted(cells, off, BORDER)
+            neighbor_level = self._shifted(level, off, 0)
+            ok |= neighbor == EMPTY
+            ok |= (neighbor == opp) & (neighbor_level == 1)  # 敵の連を取る手
+            ok |= (neighbor == own) & (neighbor_level == 2)  # 呼吸点の残る味方の連につなぐ手
+        return ok & (cells == EMPTY)
+
+    def eyes(self, colors: np.ndarray) -> np.ndarray:
+        """ (N, cells) mask of empty cells that are eyes of colors[i], as in agent.helpers.is_point_an_eye. """
+        cells = self.cells
+        own = colors[:, None]
+        eye = cells == EMPTY
+        for off in self._neighbor_offsets():
+            neighbor = self._shifted(cells, off, BORDER)
+            eye &= (neighbor == own) | (neighbor == BORDER)
+        friendly = np.zeros(cells.shape, dtype=np.int8)
+        off_board = np.zeros(cells.shape, dtype=np.int8)
+        for off in (-self.stride - 1, -self.stride + 1, self.stride - 1, self.stride + 1):
+            corner = self._shifted(cells, off, BORDER)
+            friendly += corner == own
+            off_board += corner == BORDER
+        return eye & np.where(off_board > 0, off_board + friendly == 4, friendly >= 3)
+
+    def place_stones(self, moves: np.ndarray, colors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """ Play colors[i] at dense point moves[i] in every game where moves[i] != PASS.
+
+        The moves must be playable. Returns the number of captured stones per game and the cell of the
+        captured stone for games that captured exactly one.
+        """
+        _, level, liberty = self.analyze()
+        rows = np.flatnonzero(moves != PASS)
+        cells = self.point_cells[moves[rows]]
+        played_colors = colors[rows]
+        assert np.all(self.cells[rows, cells] == EMPTY), "Illegal play on an occupied point"
+
+        opp = (BLACK + WHITE - played_colors)[:, None]
+        targets = (rows * self.num_cells + cells)[:, None]
+        captured = (self.cells[rows] == opp) & (level[rows] == 1) & (liberty[rows] == targets)
+
+        # 同じ色の隣接する連をマージする: every friendly neighbor string takes the new stone's id.
+        new_labels = rows * self.num_cells + cells
+        relabel = np.arange(self.cells.size, dtype=np.int64)
+        for off in self._neighbor_offsets():
+            friendly = self.cells[rows, cells + off] == played_colors
+            relabel[self.labels[rows, cells + off][friendly]] = new_labels[friendly]
+        labels = self.labels[rows]
+        labels = np.where(labels >= 0, relabel[labels], -1)
+        labels[np.arange(len(rows)), cells] = new_labels
+        self.labels[rows] = np.where(captured, -1, labels)
+
+        self.cells[rows, cells] = played_colors
+        self.hashes[rows] ^= self._codes[played_colors, cells]
+        codes = self._codes[BLACK + WHITE - played_colors]
+        self.hashes[rows] ^= np.bitwise_xor.reduce(np.where(captured, codes, np.uint64(0)), axis=1)
+        self.cells[rows] = np.where(captured, EMPTY, self.cells[rows])
+        self._analysis = None
+
+        num_captured = np.zeros(self.num_games, dtype=np.int64)
+        num_captured[rows] = captured.sum(axis=1)
+        single = np.full(self.num_games, -1, dtype=np.int64)
+        single[rows] = np.where(num_captured[rows] == 1, captured.argmax(axis=1), -1)
+        return num_captured, single
+
+    def area_scores(self) -> Tuple[np.ndarray, np.ndarray]:
+        """ Stones plus surrounded empty regions for black and white, as scoring.evaluate_territory counts them. """
+        counts = territory_counts(self.cells, self.stride)
+        black = counts[:, BLACK_STONES] + counts[:, BLACK_TERRITORY]
+        white = counts[:, WHITE_STONES] + counts[:, WHITE_TERRITORY]
+        return black, white
+
+
+class BatchGameState:
+    def __init__(self, board: BatchBoard):
+        self.board = board
+        self.next_color = np.full(board.num_games, BLACK, dtype=np.int8)
+        self.ko = np.full(board.num_games, -1, dtype=np.int64)  # cell that may not be retaken this turn
+        self.passes = np.zeros(board.num_games, dtype=np.int8)  # consecutive passes
+        self.num_moves = np.zeros(board.num_games, dtype=np.int64)
+
+    @classmethod
+    def new_game(cls, num_games: int, board_size: int) -> BatchGameState:
+        return cls(BatchBoard(num_games, board_size, board_size))
+
+    @classmethod
+    def from_game_states(cls, game_states: Sequence, num_copies: int = 1) -> BatchGameState:
+        """ `num_copies` games in a row from each GameState position, with the same player to move. The
+        history is not carried over, so the games start without passes or a ko. """
+        stones = np.stack([game_state.board.as_array() for game_state in game_states])
+        state = cls(BatchBoard.from_stones(np.repeat(stones, num_copies, axis=0)))
+        colors = [game_state.next_player.value for game_state in game_states]
+        state.next_color[:] = np.repeat(np.array(colors, dtype=np.int8), num_copies)
+        return state
+
+    def copy(self) -> BatchGameState:
+        other = BatchGameState.__new__(BatchGameState)
+        other.board = self.board.copy()
+        other.next_color = self.next_color.copy()
+        other.ko = self.ko.copy()
+        other.passes = self.passes.copy()
+        other.num_moves = self.num_moves.copy()
+        return other
+
+    @property
+    def num_games(self) -> int:
+        return self.board.num_games
+
+    def is_over(self) -> np.ndarray:
+        return self.passes >= 2
+
+    def legal_moves_mask(self) -> np.ndarray:
+        """ (N, num_rows * num_cols) mask of legal plays for the player to move; passing is always legal. """
+        legal = self.board.playable(self.next_color)
+        games = np.flatnonzero(self.ko >= 0)
+        legal[games, self.ko[games]] = False
+        legal[self.is_over()] = False
+        return legal[:, self.board.point_cells]
+
+    def play(self, moves: np.ndarray):
+        """ Apply one move per game in place. Moves of finished games are ignored. """
+        moves = np.where(self.is_over(), PASS, moves)
+        board = self.board
+        num_captured, single = board.place_stones(moves, self.next_color)
+
+        # Simple ko: a lone stone that captured a lone stone and has that point as its only liberty.
+        played = np.flatnonzero((moves != PASS) & (num_captured == 1))
+        self.ko[:] = -1
+        if len(played) > 0:
+            cells = board.point_cells[moves[played]]
+            lone = np.ones(len(played), dtype=bool)
+            for off in board._neighbor_offsets():
+                neighbor = board.cells[played, cells + off]
+                lone &= (neighbor != self.next_color[played]) & ((neighbor != EMPTY) | (cells + off == single[played]))
+            self.ko[played[lone]] = single[played[lone]]
+
+        active = ~self.is_over()
+        self.passes = np.where(moves == PASS, self.passes + 1, 0).astype(np.int8)
+        self.num_moves += active
+        self.next_color = np.where(active, BLACK + WHITE - self.next_color, self.next_color).astype(np.int8)
+
+    def winners(self, komi: float = 7.5) -> np.ndarray:
+        """ BLACK or WHITE per game by area score, as compute_game_result would report. """
+        black, white = self.board.area_scores()
+        return np.where(black > white + komi, BLACK, WHITE).astype(np.int8)
@@ -0,0 +1,321 @@
+"""
+Bitboard engine.
+
+Every color is a single Python int with one bit per point. A row takes num_cols + 1 bits, the extra
+bit being an always-empty guard column, so shifting by one or by a whole row never wraps a stone onto
+the opposite edge once the result is masked with the on-board bits. Strings, liberties and captures
+are all computed with shift-and-mask flood fills, and copying a position only copies two ints.
+"""
+from __future__ import annotations
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from . import goboard
+from . import zobrist
+from .goboard import GoString, Move, read_only_view  # noqa;
+from .goboard_batch import string_planes
+from .gotypes import Player, Point
+
+_MASKS: Dict[Tuple[int, int], Tuple[int, List[int], List[int]]] = {}
+
+
+def _board_masks(num_rows: int, num_cols: int) -> Tuple[int, List[int], List[int]]:
+    """ On-board mask and Zobrist codes by bit index, shared between all boards of the same size. """
+    key = (num_rows, num_cols)
+    if key not in _MASKS:
+        stride = num_cols + 1
+        on_board = 0
+        black = [0] * (num_rows * stride)
+        white = [0] * (num_rows * stride)
+        codes = zobrist.hash_codes(num_rows, num_cols)
+        for r in range(1, num_rows + 1):
+            for c in range(1, num_cols + 1):
+                i = (r - 1) * stride + (c - 1)
+                on_board |= 1 << i
+                code = ((r - 1) * num_cols + c - 1) * 3
+                black[i] = codes[code + 1]
+                white[i] = codes[code + 2]
+        _MASKS[key] = (on_board, black, white)
+    return _MASKS[key]
+
+
+_MOVES: Dict[Tuple[int, int], Dict[int, Move]] = {}
+
+
+def _move_table(num_rows: int, num_cols: int) -> Dict[int, Move]:
+    """ Move of every on-board bit index, shared between all boards of the same size. """
+    key = (num_rows, num_cols)
+    if key not in _MOVES:
+        stride = num_cols + 1
+        _MOVES[key] = {
+            (r - 1) * stride + (c - 1): Move.play(Point(r, c))
+            for r in range(1, num_rows + 1)
+            for c in range(1, num_cols + 1)
+        }
+    return _MOVES[key]
+
+
+def iter_bits(mask: int):
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class Board:
+    def __init__(self, num_rows: int, num_cols: int):
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self._stride = num_cols + 1
+        self._on_board, self._black_codes, self._white_codes = _board_masks(num_rows, num_cols)
+        self._black = 0
+        self._white = 0
+        self._hash = zobrist.EMPTY_BOARD
+        self._undo: List[Tuple[int, int, int]] = []
+        self._atari_cache: Dict[Player, Dict[int, int]] = {}
+        # One int8 per bit index, guard column included, and its view, made on the first as_array().
+        self._stones: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._stones_hash: Optional[int] = None  # hash of the position the array was last filled with
+        self._planes: Optional[Tuple[int, np.ndarray, np.ndarray]] = None
+
+    def __deepcopy__(self, memo) -> Board:
+        other = Board.__new__(Board)
+        other.num_rows = self.num_rows
+        other.num_cols = self.num_cols
+        other._stride = self._stride
+        other._on_board = self._on_board
+        other._black_codes = self._black_codes
+        other._white_codes = self._white_codes
+        other._black = self._black
+        other._white = self._white
+        other._hash = self._hash
+        other._undo = []
+        other._atari_cache = self._atari_cache
+        other._stones = None
+        other._stones_hash = None
+        other._planes = self._planes
+        return other
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, Board)
+            and self.num_rows == other.num_rows
+            and self.num_cols == other.num_cols
+            and self._black == other._black
+            and self._white == other._white
+        )
+
+    def checkpoint(self):
+        self._undo.append((self._black, self._white, self._hash))
+
+    def rollback(self):
+        self._black, self._white, self._hash = self._undo.pop()
+        self._atari_cache = {}
+
+    def index(self, point: Point) -> int:
+        return (point.row - 1) * self._stride + (point.col - 1)
+
+    def bit(self, point: Point) -> int:
+        return 1 << self.index(point)
+
+    def point(self, index: int) -> Point:
+        return Point(index // self._stride + 1, index % self._stride + 1)
+
+    def stones(self, player: Player) -> int:
+        return self._black if player is Player.BLACK else self._white
+
+    def _codes(self, player: Player) -> List[int]:
+        return self._black_codes if player is Player.BLACK else self._white_codes
+
+    def empty(self) -> int:
+        return self._on_board & ~(self._black | self._white)
+
+    def neighbors(self, mask: int) -> int:
+        """ Points orthogonally adjacent to any point of `mask`. """
+        return ((mask << 1) | (mask >> 1) | (mask << self._stride) | (mask >> self._stride)) & self._on_board
+
+    def flood(self, seed: int, within: int) -> int:
+        """ All points of `within` connected to `seed` through `within`. """
+        region = seed
+        while True:
+            grown = (region | self.neighbors(region)) & within
+            if grown == region:
+                return region
+            region = grown
+
+    def liberties(self, string: int) -> int:
+        return self.neighbors(string) & self.empty()
+
+    def place_stone(self, player: Player, point: Point):
+        assert self.is_on_grid(point)
+        bit = self.bit(point)
+        if not self.empty() & bit:
+            print(f"Illegal play on {str(point)}")
+        assert self.empty() & bit
+
+        if player is Player.BLACK:
+            self._black |= bit
+        else:
+            self._white |= bit
+        self._hash ^= self._codes(player)[self.index(point)]
+        self._atari_cache = {}
+
+        other = player.other
+        opponent = self.stones(other)
+        captured = 0
+        for neighbor_bit in iter_bits(self.neighbors(bit) & opponent):  # 敵の色の隣接する連を調べる
+            if (1 << neighbor_bit) & captured:
+                continue
+            string = self.flood(1 << neighbor_bit, opponent)
+            if not self.liberties(string):
+                captured |= string
+        if captured:
+            if other is Player.BLACK:
+                self._black = opponent & ~captured
+            else:
+                self._white = opponent & ~captured
+            codes = self._codes(other)
+            for i in iter_bits(captured):
+                self._hash ^= codes[i]
+
+    def _atari(self, player: Player) -> Dict[int, int]:
+        """ Stones of `player` in atari, keyed by the index of their last liberty.
+
+        Computed once per position, so legality checks of every empty point cost a dict lookup.
+        """
+        if player not in self._atari_cache:
+            atari: Dict[int, int] = {}
+            stones = self.stones(player)
+            remaining = stones
+            while remaining:
+                string = self.flood(remaining & -remaining, stones)
+                remaining &= ~string
+                liberties = self.liberties(string)
+                if liberties and not liberties & (liberties - 1):
+                    i = liberties.bit_length() - 1
+                    atari[i] = atari.get(i, 0) | string
+            self._atari_cache[player] = atari
+        return self._atari_cache[player]
+
+    def is_on_grid(self, point: Point) -> bool:
+        return 1 <= point.row <= self.num_rows and 1 <= point.col <= self.num_cols
+
+    def get_player_at(self, point: Point) -> Optional[Player]:
+        if not self.is_on_grid(point):
+            return None
+        bit = self.bit(point)
+        if self._black & bit:
+            return Player.BLACK
+        if self._white & bit:
+            return Player.WHITE
+        return None
+
+    def get_go_string(self, point: Point) -> Optional[GoString]:
+        player = self.get_player_at(point)
+        if player is None:
+            return None
+        string = self.flood(self.bit(point), self.stones(player))
+        stones = [self.point(i) for i in iter_bits(string)]
+        liberties = [self.point(i) for i in iter_bits(self.liberties(string))]
+        return GoString(player, stones, liberties)
+
+    def is_self_capture(self, player: Player, point: Point) -> bool:
+        i = self.index(point)
+        neighbors = self.neighbors(1 << i)
+        if neighbors & self.empty():
+            return False
+        if i in self._atari(player.other):  # 敵の連を取る手は自殺手ではない
+            return False
+        # Self-capture only if every friendly neighbor string has this point as its last liberty.
+        return not neighbors & self.stones(player) & ~self._atari(player).get(i, 0)
+
+    def hash_after(self, player: Player, point: Point) -> int:
+        i = self.index(point)
+        next_hash = self._hash ^ self._codes(player)[i]
+        codes = self._codes(player.other)
+        for j in iter_bits(self._atari(player.other).get(i, 0)):
+            next_hash ^= codes[j]
+        return next_hash
+
+    def empty_points(self) -> List[Point]:
+        return [self.point(i) for i in iter_bits(self.empty())]
+
+    def playable_points(self, player: Player) -> List[Point]:
+        """ Empty points where `player` would not self-capture, in raster order. Ko is not considered. """
+        return [self.point(i) for i in self._playable_indices(player)]
+
+    def playable_moves(self, player: Player) -> List[Move]:
+        """ The moves at playable_points(), taken from a table shared by all boards of this size. """
+        moves = _move_table(self.num_rows, self.num_cols)
+        return [moves[i] for i in self._playable_indices(player)]
+
+    def _playable_indices(self, player: Player) -> List[int]:
+        empty = self.empty()
+        safe = empty & self.neighbors(empty)  # a point next to an empty point always has a liberty
+        return [i for i in iter_bits(empty) if (1 << i) & safe or not self.is_self_capture(player, self.point(i))]
+
+    def capturing_points(self, player: Player) -> List[Point]:
+        """ Empty points where `player` would capture a string, in no particular order. """
+        return [self.point(i) for i in self._atari(player.other)]
+
+    def _bits_array(self, mask: int) -> np.ndarray:
+        num_bits = self.num_rows * self._stride
+        data = np.frombuffer(mask.to_bytes((num_bits + 7) // 8, "little"), dtype=np.uint8)
+        return np.unpackbits(data, bitorder="little")[:num_bits].reshape(self.num_rows, self._stride)
+
+    def num_stones(self, player: Player) -> int:
+        return bin(self.stones(player)).count("1")
+
+    def _view(self, stones: np.ndarray) -> np.ndarray:
+        return read_only_view(stones.reshape(self.num_rows, self._stride)[:, : self.num_cols])
+
+    def stone_bytes(self) -> bytes:
+        """ Stones row by row as in as_array(). """
+        return self.as_array().tobytes()
+
+    def as_array(self) -> np.ndarray:
+        """ Stones as a read-only (num_rows, num_cols) int8 array, 0 empty, 1 black, 2 white, row 1 first.
+
+        The same array is returned for every position and filled from the two ints when it is asked for, so
+        it is not a snapshot, and it only follows moves made since through a new call: copy it to keep a
+        position. Moves and copies never touch it.
+        """
+        if self._stones is None:
+            cells = np.zeros(self.num_rows * self._stride, dtype=np.int8)
+            self._stones = (cells, self._view(cells))
+        cells, view = self._stones
+        if self._stones_hash != self._hash:
+            cells[:] = (self._bits_array(self._black) + 2 * self._bits_array(self._white)).ravel()
+            self._stones_hash = self._hash
+        return view
+
+    def string_array(self) -> np.ndarray:
+        """ Read-only id of the string of every stone, the dense index `(row - 1) * num_cols + (col - 1)`
+        of its first stone in raster order, -1 on empty points. """
+        return self._string_planes()[1]
+
+    def liberty_array(self) -> np.ndarray:
+        """ Read-only liberty count of the string of every stone, 0 on empty points. """
+        return self._string_planes()[2]
+
+    def _string_planes(self) -> Tuple[int, np.ndarray, np.ndarray]:
+        # Labelled from the stone array once per position; the hash tells when the position changed.
+        # Strings only exist here as flood fills, so keeping the planes up to date would cost every move
+        # and every rollback a fill of all the strings it touches, which searches never read.
+        if self._planes is None or self._planes[0] != self._hash:
+            ids, libs = string_planes(self.as_array()[None])
+            self._planes = (self._hash, read_only_view(ids[0]), read_only_view(libs[0]))
+        return self._planes
+
+    def zobrist_hash(self) -> int:
+        return self._hash
+
+
+class GameState(goboard.GameState):
+    @classmethod
+    def new_game(cls, board_size: Union[int, Tuple[int, int]]) -> GameState:
+        """ Empty board of board_size x board_size points, or of (num_rows, num_cols). """
+        num_rows, num_cols = (board_size, board_size) if isinstance(board_size, int) else board_size
+        board = Board(num_rows, num_cols)
+        return cls(board, Player.BLACK, None, None)
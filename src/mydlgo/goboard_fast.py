@@ -0,0 +1,823 @@
+"""
+Array backed board engine.
+
+The board is a padded 1-D list of (num_rows + 2) * (num_cols + 2) cells. The outermost ring holds
+BORDER sentinels, so neighbor lookups never need a bounds check. Every stone stores the index of the
+head stone of its string, the strings are kept as circular linked lists through `_next`, and the head
+stone keeps the size, the exact liberty count and the first stone in raster order of the string.
+"""
+from __future__ import annotations
+from array import array
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+import numpy as np
+
+from . import goboard
+from . import zobrist
+from .goboard import GoString, Move, PointIndex, PointStatus, read_only_view  # noqa;
+from .gotypes import Player, Point
+from .scoring import evaluate_territory
+
+EMPTY = 0
+BLACK = 1
+WHITE = 2
+BORDER = 3
+
+COLOR_OF = {Player.BLACK: BLACK, Player.WHITE: WHITE}
+PLAYER_OF: List[Optional[Player]] = [None, Player.BLACK, Player.WHITE, None]
+
+# Old value of an undo log entry for a dict key that did not exist yet.
+_MISSING = object()
+
+_HASH_CODES: Dict[Tuple[int, int], Tuple[List[int], ...]] = {}
+
+
+def _hash_codes(num_rows: int, num_cols: int) -> Tuple[List[int], ...]:
+    """ Zobrist codes indexed by [color][array index], shared between all boards of the same size. """
+    key = (num_rows, num_cols)
+    if key not in _HASH_CODES:
+        stride = num_cols + 2
+        size = (num_rows + 2) * stride
+        black = [0] * size
+        white = [0] * size
+        codes = zobrist.hash_codes(num_rows, num_cols)
+        for r in range(1, num_rows + 1):
+            for c in range(1, num_cols + 1):
+                code = ((r - 1) * num_cols + c - 1) * 3
+                black[r * stride + c] = codes[code + BLACK]
+                white[r * stride + c] = codes[code + WHITE]
+        _HASH_CODES[key] = ([0] * size, black, white)
+    return _HASH_CODES[key]
+
+
+_POINTS: Dict[Tuple[int, int], List[Point]] = {}
+
+
+def _point_table(num_rows: int, num_cols: int) -> List[Point]:
+    """ Point of every array index, so converting indices back to points allocates nothing. """
+    key = (num_rows, num_cols)
+    if key not in _POINTS:
+        stride = num_cols + 2
+        _POINTS[key] = [Point(i // stride, i % stride) for i in range((num_rows + 2) * stride)]
+    return _POINTS[key]
+
+
+class RegionMap:
+    """ Empty regions of a board with the area they add to each color, kept up to date move by move.
+
+    Every empty point carries the id of its region, and every region its size and the number of
+    (region point, neighbor stone) pairs of each color. A region is territory of a color when only that
+    color borders it, so the territory totals change only for the regions a move touches. Placing a
+    stone shrinks one region, and splits it only when the empty points around the stone are not
+    connected through the diagonals; captures merge the freed points with the regions around them.
+    """
+
+    def __init__(self, board: Board):
+        self._color = board._color
+        self._stride = board._stride
+        self.region = [0] * len(board._color)
+        self.size: Dict[int, int] = {}
+        self.edges: Dict[int, List[int]] = {}  # edge counts indexed by color
+        self.territory = [0, 0, 0]  # dame, black and white territory
+        self._next_id = 0
+        self.log: Optional[list] = None  # the board's undo log while a checkpoint is open
+        visited: Set[int] = set()
+        for i, c in enumerate(board._color):
+            if c == EMPTY and i not in visited:
+                self._fill(i, visited)
+
+    def copy(self, board: Board) -> RegionMap:
+        other = RegionMap.__new__(RegionMap)
+        other._color = board._color
+        other._stride = self._stride
+        other.region = self.region[:]
+        other.size = self.size.copy()
+        other.edges = {r: edges[:] for r, edges in self.edges.items()}
+        other.territory = self.territory[:]
+        other._next_id = self._next_id
+        other.log = None
+        return other
+
+    def _save(self, container, key):
+        """ Log the value at container[key], if any, so that Board.rollback() can put it back. """
+        if self.log is not None:
+            value = container.get(key, _MISSING) if isinstance(container, dict) else container[key]
+            self.log.append((container, key, value))
+
+    def _owner(self, r: int) -> int:
+        edges = self.edges[r]
+        if edges[BLACK] and not edges[WHITE]:
+            return BLACK
+        if edges[WHITE] and not edges[BLACK]:
+            return WHITE
+        return EMPTY
+
+    def _drop(self, r: int):
+        owner = self._owner(r)
+        self._save(self.territory, owner)
+        self._save(self.size, r)
+        self._save(self.edges, r)
+        self.territory[owner] -= self.size.pop(r)
+        del self.edges[r]
+
+    def _fill(self, start: int, visited: Set[int]):
+        """ Label the region of `start` with a new id and count it. """
+        color = self._color
+        stride = self._stride
+        r = self._next_id
+        self._next_id += 1
+        edges = [0, 0, 0, 0]
+        visited.add(start)
+        stack = [start]
+        size = 0
+        while stack:
+            i = stack.pop()
+            self._save(self.region, i)
+            self.region[i] = r
+            size += 1
+            for n in (i - stride, i + stride, i - 1, i + 1):
+                c = color[n]
+                if c == EMPTY:
+                    if n not in visited:
+                        visited.add(n)
+                        stack.append(n)
+                else:
+                    edges[c] += 1
+        self._save(self.size, r)
+        self._save(self.edges, r)
+        self.size[r] = size
+        self.edges[r] = edges
+        owner = self._owner(r)
+        self._save(self.territory, owner)
+        self.territory[owner] += size
+
+    def place(self, idx: int, c: int):
+        """ Update after a stone of color `c` was placed at `idx`, before its captures are removed. """
+        color = self._color
+        stride = self._stride
+        r = self.region[idx]
+        edges = self.edges[r]
+        owner = self._owner(r)
+        self._save(self.territory, owner)
+        self.territory[owner] -= self.size[r]
+        self._save(self.size, r)
+        self.size[r] -= 1
+        self._save(self.edges, r)
+        if self.log is not None:
+            self.log.extend((edges, k, edges[k]) for k in range(len(edges)))
+        empties = []
+        for n in (idx - stride, idx + stride, idx - 1, idx + 1):
+            nc = color[n]
+            if nc == EMPTY:
+                empties.append(n)
+                edges[c] += 1
+            else:
+                edges[nc] -= 1  # `idx` no longer borders it
+        if not empties:
+            del self.size[r]
+            del self.edges[r]
+            return
+        if len(empties) > 1 and self._may_split(idx):
+            self._split(r, empties)
+        owner = self._owner(r)
+        self._save(self.territory, owner)
+        self.territory[owner] += self.size[r]
+
+    def _may_split(self, idx: int) -> bool:
+        """ Whether the empty orthogonal neighbors of `idx` fall into more than one run of empty points
+        around it, counting the diagonals. """
+        stride = self._stride
+        ring = (-stride, 1 - stride, 1, 1 + stride, stride, stride - 1, -1, -1 - stride)
+        empty = [self._color[idx + off] == EMPTY for off in ring]
+        if all(empty):
+            return False
+        start = empty.index(False)
+        runs = 0
+        in_run = orthogonal = False
+        for k in range(1, 9):  # ends on `start`, which closes the last run
+            j = (start + k) % 8
+            if empty[j]:
+                in_run = True
+                orthogonal = orthogonal or j % 2 == 0
+            elif in_run:
+                runs += orthogonal
+                in_run = orthogonal = False
+        return runs > 1
+
+    def _split(self, r: int, seeds: List[int]):
+        """ Move the parts of region `r` that `seeds` no longer connect to regions of their own.
+
+        One breadth-first search runs from every seed, a step each in turn. Searches that meet are
+        joined, and a group of searches that runs out of points has walked around a closed part of the
+        region. So the work is bounded by the size of the smaller parts, and it stops right away when
+        the seeds are still connected close to the new stone.
+        """
+        color = self._color
+        stride = self._stride
+        k = len(seeds)
+        group = list(range(k))
+
+        def find(a: int) -> int:
+            while group[a] != a:
+                a = group[a]
+            return a
+
+        owner = {seed: i for i, seed in enumerate(seeds)}
+        queues = [[seed] for seed in seeds]
+        heads = [0] * k
+        closed = [False] * k
+        live = k
+        while live > 1:
+            for i in range(k):
+                queue = queues[i]
+                if closed[i] or heads[i] == len(queue):
+                    continue
+                cell = queue[heads[i]]
+                heads[i] += 1
+                for n in (cell - stride, cell + stride, cell - 1, cell + 1):
+                    if color[n] != EMPTY:
+                        continue
+                    o = owner.get(n)
+                    if o is None:
+                        owner[n] = i
+                        queue.append(n)
+                    elif find(o) != find(i):
+                        group[find(o)] = find(i)
+                        live -= 1
+            for i in range(k):
+                if live == 1:
+                    return
+                if closed[i] or find(i) != i:
+                    continue
+                members = [j for j in range(k) if find(j) == i]
+                if all(heads[j] == len(queues[j]) for j in members):
+                    self._split_off(r, [cell for j in members for cell in queues[j]])
+                    for j in members:
+                        closed[j] = True
+                    live -= 1
+
+    def _split_off(self, r: int, cells: List[int]):
+        color = self._color
+        stride = self._stride
+        new = self._next_id
+        self._next_id += 1
+        edges = [0, 0, 0, 0]
+        for i in cells:
+            self._save(self.region, i)
+            self.region[i] = new
+            for n in (i - stride, i + stride, i - 1, i + 1):
+                if color[n] != EMPTY:
+                    edges[color[n]] += 1
+        for key in (new, r):
+            self._save(self.size, key)
+            self._save(self.edges, key)
+        self.size[new] = len(cells)
+        self.edges[new] = edges
+        self.size[r] -= len(cells)
+        self.edges[r] = [a - b for a, b in zip(self.edges[r], edges)]
+        owner = self._owner(new)
+        self._save(self.territory, owner)
+        self.territory[owner] += len(cells)
+
+    def capture(self, cells: List[int]):
+        """ Update after the stones at `cells` were removed. """
+        color = self._color
+        stride = self._stride
+        freed = set(cells)
+        touched = {
+            self.region[n]
+            for i in cells
+            for n in (i - stride, i + stride, i - 1, i + 1)
+            if color[n] == EMPTY and n not in freed
+        }
+        for r in touched:
+            self._drop(r)
+        visited: Set[int] = set()
+        for i in cells:
+            if i not in visited:
+                self._fill(i, visited)
+
+
+class Board:
+    def __init__(self, num_rows: int, num_cols: int):
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self._stride = num_cols + 2
+        size = (num_rows + 2) * self._stride
+
+        # One byte per cell, so that as_array() can view the colors without a copy kept next to them.
+        self._color = bytearray([BORDER]) * size
+        for r in range(1, num_rows + 1):
+            start = r * self._stride
+            self._color[start + 1 : start + num_cols + 1] = bytes(num_cols)
+        self._head = [0] * size  # index of the head stone of the string
+        self._next = [0] * size  # next stone of the same string (circular)
+        self._size = [0] * size  # number of stones, valid on head stones only
+        self._libs = [0] * size  # number of liberties, valid on head stones only
+        self._first = [0] * size  # dense index of the first stone in raster order, valid on head stones only
+        self._mark = [0] * size  # scratch marks used while counting liberties
+        self._generation = 0
+        self._hash = zobrist.EMPTY_BOARD
+        self._codes = _hash_codes(num_rows, num_cols)
+        self._points = _point_table(num_rows, num_cols)
+        self._undo: List[tuple] = []
+        self._log: Optional[list] = None  # (container, key, old value) of every write since the checkpoint
+        self._marked: Optional[Set[int]] = None  # indices marked for the PointIndex since then
+        self._stones_view: Optional[np.ndarray] = None
+        # String id and liberty count of every stone, kept once string_array() or liberty_array() asked.
+        self._planes: Optional[Tuple[array, array]] = None
+        self._plane_views: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._counts = [0, 0, 0]  # stones by color
+        self._regions: Optional[RegionMap] = None
+        self._index = PointIndex((i for i in range(size) if self._color[i] == EMPTY), self._points)
+
+    def __deepcopy__(self, memo) -> Board:
+        other = Board.__new__(Board)
+        other.num_rows = self.num_rows
+        other.num_cols = self.num_cols
+        other._stride = self._stride
+        other._color = self._color[:]
+        other._head = self._head[:]
+        other._next = self._next[:]
+        other._size = self._size[:]
+        other._libs = self._libs[:]
+        other._first = self._first[:]
+        other._mark = [0] * len(self._mark)
+        other._generation = 0
+        other._hash = self._hash
+        other._codes = self._codes
+        other._points = self._points
+        other._undo = []
+        other._log = None
+        other._marked = None
+        other._stones_view = None
+        other._planes = (self._planes[0][:], self._planes[1][:]) if self._planes is not None else None
+        other._plane_views = None
+        other._counts = self._counts[:]
+        other._regions = self._regions.copy(other) if self._regions is not None else None
+        other._index = self._index.copy()
+        return other
+
+    def checkpoint(self):
+        """ Start logging the changes of every move so that the next rollback() can undo them. A move
+        logs only the cells it writes, so push() and pop() cost the size of the move, not of the board. """
+        self._undo.append((self._hash, self._counts[:], [], set(), self._regions, self._planes is not None))
+        self._start_log()
+
+    def rollback(self):
+        """ Undo every change since the matching checkpoint(). """
+        board_hash, self._counts, log, marked, regions, had_planes = self._undo.pop()
+        # Written back in place, so that the views handed out by as_array() stay valid.
+        for container, key, value in reversed(log):
+            if value is _MISSING:
+                del container[key]
+            else:
+                container[key] = value
+        self._index.pending |= marked
+        self._hash = board_hash
+        self._regions = regions  # dropped if tracking started after the checkpoint
+        if self._planes is not None and not had_planes:
+            self._write_planes()
+        self._start_log()
+
+    def _start_log(self):
+        self._log, self._marked = (self._undo[-1][2], self._undo[-1][3]) if self._undo else (None, None)
+        if self._regions is not None:
+            self._regions.log = self._log
+
+    def index(self, point: Point) -> int:
+        return point.row * self._stride + point.col
+
+    def point(self, index: int) -> Point:
+        return self._points[index]
+
+    def place_stone(self, player: Player, point: Point):
+        assert self.is_on_grid(point)
+        stride = self._stride
+        idx = point.row * stride + point.col
+        color = self._color
+        head = self._head
+        libs = self._libs
+        if color[idx] != EMPTY:
+            print(f"Illegal play on {str(point)}")
+        assert color[idx] == EMPTY
+
+        c = COLOR_OF[player]
+        log = self._log
+        if log is not None:
+            # The string arrays of the new stone matter again if an older move captured a string there.
+            log.extend(
+                (
+                    (color, idx, EMPTY),
+                    (head, idx, head[idx]),
+                    (self._next, idx, self._next[idx]),
+                    (self._size, idx, self._size[idx]),
+                    (libs, idx, libs[idx]),
+                    (self._first, idx, self._first[idx]),
+                )
+            )
+        color[idx] = c
+        self._counts[c] += 1
+        if self._regions is not None:
+            self._regions.place(idx, c)
+        head[idx] = idx
+        self._next[idx] = idx
+        self._size[idx] = 1
+        self._first[idx] = (point.row - 1) * self.num_cols + point.col - 1
+        self._hash ^= self._codes[c][idx]
+
+        # Only the new stone, its neighbors, the captured points and the liberties of strings whose
+        # liberty count crossed the atari threshold can change how the PointIndex sees them.
+        dirty = {idx}
+        adjacent_same: List[int] = []
+        adjacent_opposite: List[int] = []
+        for n in (idx - stride, idx + stride, idx - 1, idx + 1):
+            nc = color[n]
+            if nc == EMPTY:
+                dirty.add(n)
+            elif nc == c:
+                if head[n] not in adjacent_same:
+                    adjacent_same.append(head[n])
+            elif nc != BORDER and head[n] not in adjacent_opposite:
+                adjacent_opposite.append(head[n])
+        libs[idx] = len(dirty) - 1
+        if adjacent_same:  # 同じ色の隣接する連をマージする
+            levels = [min(libs[h], 2) for h in adjacent_same]
+            self._join(idx, adjacent_same)
+            if any(level != min(libs[head[idx]], 2) for level in levels):
+                dirty.update(self._liberty_indices(head[idx]))
+
+        captured: List[int] = []
+        for h in adjacent_opposite:  # 敵の色の隣接する連の呼吸点を減らす
+            if log is not None:
+                log.append((libs, h, libs[h]))
+            libs[h] -= 1
+            if libs[h] == 0:
+                captured.append(h)
+                continue
+            if libs[h] == 1:
+                dirty.update(self._liberty_indices(h))
+            if self._planes is not None:
+                self._write_string(h)
+        if self._planes is not None and not captured:  # otherwise _remove_string writes it
+            self._write_string(head[idx])
+
+        freed: List[int] = []
+        for h in captured:
+            stones, relieved = self._remove_string(h)
+            freed.extend(stones)
+            dirty.update(stones)
+            for relieved_head in relieved:
+                dirty.update(self._liberty_indices(relieved_head))
+        if freed and self._regions is not None:
+            self._regions.capture(freed)
+        self._index.pending |= dirty
+        if self._marked is not None:
+            self._marked |= dirty
+
+    def _liberty_indices(self, h: int) -> List[int]:
+        color = self._color
+        stride = self._stride
+        liberties = []
+        s = h
+        while True:
+            for n in (s - stride, s + stride, s - 1, s + 1):
+                if color[n] == EMPTY:
+                    liberties.append(n)
+            s = self._next[s]
+            if s == h:
+                break
+        return liberties
+
+    def _write_string(self, h: int):
+        """ Copy the id and the liberty count of the string headed by `h` to the planes of its stones. """
+        string_id = self._first[h]
+        num_libs = self._libs[h]
+        assert self._planes is not None
+        ids, string_libs = self._planes
+        nxt = self._next
+        log = self._log
+        s = h
+        while True:
+            if log is not None:
+                log.append((ids, s, ids[s]))
+                log.append((string_libs, s, string_libs[s]))
+            ids[s] = string_id
+            string_libs[s] = num_libs
+            s = nxt[s]
+            if s == h:
+                break
+
+    def _join(self, idx: int, heads: List[int]):
+        """ Merge the new stone at `idx` and its friendly neighbor strings into the largest of them.
+
+        Only the stones of the smaller strings are visited: an empty point next to them is a new liberty
+        unless it already touches the largest string.
+        """
+        color = self._color
+        head = self._head
+        nxt = self._next
+        mark = self._mark
+        stride = self._stride
+        c = color[idx]
+        big = max(heads, key=self._size.__getitem__)
+        log = self._log
+        if log is not None:
+            log.extend(((self._first, big, self._first[big]), (self._size, big, self._size[big])))
+            log.append((self._libs, big, self._libs[big]))
+        self._first[big] = min(self._first[h] for h in [idx] + heads)
+
+        self._generation += 1
+        gen = self._generation
+        libs = self._libs[big] - 1  # `idx` was a liberty of the largest string
+        smaller = [idx] + [h for h in heads if h != big]
+        for h in smaller:
+            s = h
+            while True:
+                for q in (s - stride, s + stride, s - 1, s + 1):
+                    if color[q] != EMPTY or mark[q] == gen:
+                        continue
+                    mark[q] = gen
+                    for m in (q - stride, q + stride, q - 1, q + 1):
+                        if color[m] == c and head[m] == big:
+                            break
+                    else:
+                        libs += 1
+                s = nxt[s]
+                if s == h:
+                    break
+
+        for h in smaller:
+            s = h
+            while True:
+                if log is not None:
+                    log.append((head, s, head[s]))
+                head[s] = big
+                s = nxt[s]
+                if s == h:
+                    break
+            if log is not None:
+                log.extend(((nxt, big, nxt[big]), (nxt, h, nxt[h])))
+            nxt[big], nxt[h] = nxt[h], nxt[big]
+            self._size[big] += self._size[h]
+        self._libs[big] = libs
+
+    def _remove_string(self, h: int) -> Tuple[List[int], List[int]]:
+        """ Remove the string headed by `h`.
+
+        Returns its stones and the heads of the neighbor strings that had at most one liberty before.
+        """
+        color = self._color
+        head = self._head
+        libs = self._libs
+        stride = self._stride
+        string_color = color[h]
+        codes = self._codes[string_color]
+        log = self._log
+
+        stones = []
+        s = h
+        while True:
+            stones.append(s)
+            if log is not None:
+                log.append((color, s, string_color))
+            color[s] = EMPTY
+            self._hash ^= codes[s]
+            s = self._next[s]
+            if s == h:
+                break
+        self._counts[string_color] -= len(stones)
+
+        relieved: List[int] = []
+        neighbors: Set[int] = set()
+        for s in stones:  # 取り除いた石に隣接する連の呼吸点を増やす
+            seen: List[int] = []
+            for n in (s - stride, s + stride, s - 1, s + 1):
+                if color[n] in (BLACK, WHITE):
+                    nh = head[n]
+                    if nh not in seen:
+                        seen.append(nh)
+                        if libs[nh] < 2 and nh not in relieved:
+                            relieved.append(nh)
+                        if log is not None:
+                            log.append((libs, nh, libs[nh]))
+                        libs[nh] += 1
+            neighbors.update(seen)
+        if self._planes is not None:
+            ids, string_libs = self._planes
+            for s in stones:
+                if log is not None:
+                    log.extend(((ids, s, ids[s]), (string_libs, s, string_libs[s])))
+                ids[s] = -1
+                string_libs[s] = 0
+            for nh in neighbors:
+                self._write_string(nh)
+        return stones, relieved
+
+    def is_on_grid(self, point: Point) -> bool:
+        return 1 <= point.row <= self.num_rows and 1 <= point.col <= self.num_cols
+
+    def get_player_at(self, point: Point) -> Optional[Player]:
+        if not self.is_on_grid(point):
+            return None
+        return PLAYER_OF[self._color[point.row * self._stride + point.col]]
+
+    def get_go_string(self, point: Point) -> Optional[GoString]:
+        if not self.is_on_grid(point):
+            return None
+        idx = point.row * self._stride + point.col
+        player = PLAYER_OF[self._color[idx]]
+        if player is None:
+            return None
+
+        stride = self._stride
+        stones = []
+        liberties = set()
+        h = self._head[idx]
+        s = h
+        while True:
+            stones.append(self.point(s))
+            for n in (s - stride, s + stride, s - 1, s + 1):
+                if self._color[n] == EMPTY:
+                    liberties.add(self.point(n))
+            s = self._next[s]
+            if s == h:
+                break
+        return GoString(player, stones, liberties)
+
+    def is_self_capture(self, player: Player, point: Point) -> bool:
+        """ Whether playing at the empty `point` would leave the new string without liberties. """
+        return self._is_self_capture(COLOR_OF[player], point.row * self._stride + point.col)
+
+    def _is_self_capture(self, c: int, idx: int) -> bool:
+        for n in (idx - self._stride, idx + self._stride, idx - 1, idx + 1):
+            nc = self._color[n]
+            if nc == EMPTY:
+                return False
+            if nc == BORDER:
+                continue
+            num_libs = self._libs[self._head[n]]
+            if (nc == c and num_libs > 1) or (nc != c and num_libs == 1):
+                return False
+        return True
+
+    def hash_after(self, player: Player, point: Point) -> int:
+        """ Zobrist hash of the board after `player` plays at `point`, without placing the stone. """
+        idx = point.row * self._stride + point.col
+        c = COLOR_OF[player]
+        opp = BLACK + WHITE - c
+        next_hash = self._hash ^ self._codes[c][idx]
+        codes = self._codes[opp]
+        captured: List[int] = []
+        for n in (idx - self._stride, idx + self._stride, idx - 1, idx + 1):
+            if self._color[n] != opp:
+                continue
+            h = self._head[n]
+            if self._libs[h] != 1 or h in captured:
+                continue
+            captured.append(h)
+            s = h
+            while True:
+                next_hash ^= codes[s]
+                s = self._next[s]
+                if s == h:
+                    break
+        return next_hash
+
+    def num_liberties(self, point: Point) -> int:
+        """ Liberty count of the string at `point` without building a GoString. """
+        idx = point.row * self._stride + point.col
+        if self._color[idx] not in (BLACK, WHITE):
+            return 0
+        return self._libs[self._head[idx]]
+
+    def empty_points(self) -> List[Point]:
+        self._index.refresh(self._status)
+        points = self._points
+        return [points[i] for i in self._index.empty]
+
+    def playable_points(self, player: Player) -> List[Point]:
+        """ Empty points where `player` would not self-capture, in raster order. Ko is not considered. """
+        self._index.refresh(self._status)
+        points = self._points
+        return [points[i] for i in self._index.playable[COLOR_OF[player] - 1]]
+
+    def playable_moves(self, player: Player) -> List[Move]:
+        """ The moves at playable_points(), made once when a point becomes playable rather than on every call. """
+        self._index.refresh(self._status)
+        return self._index.moves[COLOR_OF[player] - 1][:]
+
+    def capturing_points(self, player: Player) -> List[Point]:
+        """ Empty points where `player` would capture a string, in no particular order. """
+        self._index.refresh(self._status)
+        points = self._points
+        return [points[i] for i in self._index.capturing[COLOR_OF[player] - 1]]
+
+    def _status(self, idx: int) -> PointStatus:
+        color = self._color
+        if color[idx] != EMPTY:
+            return None
+        liberty = False
+        safe = [False, False, False]  # by color, next to a friendly string with another liberty
+        captures = [False, False, False]
+        for n in (idx - self._stride, idx + self._stride, idx - 1, idx + 1):
+            nc = color[n]
+            if nc == EMPTY:
+                liberty = True
+            elif nc != BORDER:
+                if self._libs[self._head[n]] > 1:
+                    safe[nc] = True
+                else:
+                    captures[BLACK + WHITE - nc] = True
+        return (
+            (liberty or safe[BLACK] or captures[BLACK], liberty or safe[WHITE] or captures[WHITE]),
+            (captures[BLACK], captures[WHITE]),
+        )
+
+    def _interior(self, cells: np.ndarray) -> np.ndarray:
+        return read_only_view(cells.reshape(self.num_rows + 2, self._stride)[1:-1, 1:-1])
+
+    def stone_bytes(self) -> bytes:
+        """ Stones row by row as in as_array(), without NumPy. """
+        starts = range(self._stride + 1, (self.num_rows + 1) * self._stride, self._stride)
+        return b"".join(self._color[start : start + self.num_cols] for start in starts)
+
+    def as_array(self) -> np.ndarray:
+        """ Stones as a read-only (num_rows, num_cols) int8 array, 0 empty, 1 black, 2 white, row 1 first.
+
+        The array is a view that place_stone() and rollback() keep up to date, so it is not a snapshot:
+        copy it to keep a position.
+        """
+        if self._stones_view is None:
+            self._stones_view = self._interior(np.frombuffer(self._color, dtype=np.int8))
+        return self._stones_view
+
+    def string_array(self) -> np.ndarray:
+        """ Read-only id of the string of every stone, the dense index `(row - 1) * num_cols + (col - 1)`
+        of its first stone in raster order, -1 on empty points. A view like as_array(). """
+        return self._track_planes()[0]
+
+    def liberty_array(self) -> np.ndarray:
+        """ Read-only liberty count of the string of every stone, 0 on empty points. A view like as_array(). """
+        return self._track_planes()[1]
+
+    def _track_planes(self) -> Tuple[np.ndarray, np.ndarray]:
+        """ Keep the string planes up to date from now on, like track_regions(). Every move then rewrites the
+        strings whose liberties it changes, which boards that never read the planes, like searches, skip. """
+        if self._planes is None:
+            size = len(self._color)
+            self._planes = (array("i", [-1]) * size, array("i", [0]) * size)
+            self._write_planes()
+        if self._plane_views is None:
+            ids, libs = self._planes
+            self._plane_views = (
+                self._interior(np.frombuffer(ids, dtype=np.int32)),
+                self._interior(np.frombuffer(libs, dtype=np.int32)),
+            )
+        return self._plane_views
+
+    def _write_planes(self):
+        ids, libs = self._planes
+        for i, c in enumerate(self._color):
+            if c == EMPTY:
+                ids[i] = -1
+                libs[i] = 0
+            elif c != BORDER and self._head[i] == i:
+                self._write_string(i)
+
+    def num_stones(self, player: Player) -> int:
+        return self._counts[COLOR_OF[player]]
+
+    def track_regions(self):
+        """ Keep a RegionMap up to date from now on, so area_scores() costs nothing. Worth it for boards
+        that are played to the end and scored, like playouts; it slows place_stone down a little. """
+        if self._regions is None:
+            self._regions = RegionMap(self)
+            self._regions.log = self._log
+
+    @property
+    def tracks_regions(self) -> bool:
+        return self._regions is not None
+
+    def area_scores(self) -> Tuple[int, int]:
+        """ Stones plus territory of black and white, as scoring.evaluate_territory counts them. """
+        if self._regions is None:
+            scored = evaluate_territory(self)
+            return (
+                scored.num_black_stones + scored.num_black_territory,
+                scored.num_white_stones + scored.num_white_territory,
+            )
+        counts = self._regions.territory
+        return self._counts[BLACK] + counts[BLACK], self._counts[WHITE] + counts[WHITE]
+
+    def zobrist_hash(self) -> int:
+        return self._hash
+
+
+class GameState(goboard.GameState):
+    @classmethod
+    def new_game(cls, board_size: Union[int, Tuple[int, int]]) -> GameState:
+        """ Empty board of board_size x board_size points, or of (num_rows, num_cols). """
+        num_rows, num_cols = (board_size, board_size) if isinstance(board_size, int) else board_size
+        board = Board(num_rows, num_cols)
+        return cls(board, Player.BLACK, None, None)
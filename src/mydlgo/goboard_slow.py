@@ -1,9 +1,12 @@
 from __future__ import annotations
-from typing import Dict, List, Set, Tuple, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Set, Tuple, Optional, Union
 import copy
 
 from .gotypes import Player, Point
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class Move:
     def __init__(self, point: Optional[Point] = None, is_pass=False, is_resign=False):
@@ -114,6 +117,19 @@ class Board:
             return None
         return string
 
+    def stone_bytes(self) -> bytes:
+        """ Stones row by row as in as_array(), without NumPy. """
+        stones = bytearray(self.num_rows * self.num_cols)
+        for point, string in self._grid.items():
+            stones[(point.row - 1) * self.num_cols + point.col - 1] = string.color.value
+        return bytes(stones)
+
+    def as_array(self) -> np.ndarray:
+        """ Stones as a (num_rows, num_cols) int8 array, 0 empty, 1 black, 2 white, row 1 first. """
+        import numpy as np
+
+        return np.frombuffer(self.stone_bytes(), dtype=np.int8).reshape(self.num_rows, self.num_cols).copy()
+
     def _remove_string(self, string: GoString):
         for point in string.stones:
             for neighbor in point.neighbors():
@@ -197,3 +213,16 @@ class GameState:
             and not self.is_move_self_capture(self.next_player, move)
             and not self.does_move_violate_ko(self.next_player, move)
         )
+
+    def legal_moves(self) -> List[Move]:
+        moves: List[Move] = []
+        if not self.is_over():
+            for row in range(1, self.board.num_rows + 1):
+                for col in range(1, self.board.num_cols + 1):
+                    move = Move.play(Point(row, col))
+                    if self.is_valid_move(move):
+                        moves.append(move)
+        moves.append(Move.pass_turn())
+        moves.append(Move.resign())
+
+        return moves
@@ -7,8 +7,8 @@ from typing import Any, Optional, Union
 See: http://www.lysator.liu.se/~gunnar/gtp/gtp2-spec-draft2/gtp2-spec.html
 """
 
-COLS = ["A", "B", "C", "D", "E", "F", "G", "H", "J", "K", "L", "M", "N", "O", "P", "Q", "R", "S", "T"]
-MAX_ROW = 19
+COLS = list("ABCDEFGHJKLMNOPQRSTUVWXYZ")
+MAX_ROW = 25
 
 
 class CommandType(Enum):
@@ -84,7 +84,7 @@ class Command:
     @staticmethod
     def boardsize(size: int, id: Optional[int] = None) -> Command:
         if size < 1 or MAX_ROW < size:
-            raise ValueError(f"Board size is too big, must be 1 <= 19: {size}")
+            raise ValueError(f"Board size must be between 1 and {MAX_ROW}: {size}")
         return Command(CommandType.BOARDSIZE, id, arg=size)
 
     @staticmethod
@@ -0,0 +1,2 @@
+from .mcts import *  # noqa;
+from .flat import *  # noqa;
@@ -0,0 +1,115 @@
+"""
+Flat Monte Carlo move evaluation.
+
+Every root move is scored by the fraction of random games won after playing it. The playouts follow
+RandomBot's policy (a random legal move that does not fill one of our own eyes) and are scored with
+`scoring.compute_game_result`. They run in rounds of equal batches of playouts handed out to worker
+processes. The number of batches in a round is a multiple of the number of workers, so every worker
+gets the same amount of work, and the batches are spread over the root moves still in contention:
+after every round the moves that are clearly worse than the best one are pruned.
+"""
+from __future__ import annotations
+import math
+import os
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+from mydlgo.agent import Agent
+from mydlgo.goboard import GameState, Move
+from mydlgo.minimax.parallel import RootSplitter
+from .mcts import random_playout
+
+__all__ = ["FlatMCAgent"]
+
+
+def _playout_batch(next_state: GameState, num_playouts: int, seed: str) -> Tuple[int, float, int]:
+    """ Wins of the player who just moved in `num_playouts` playouts, with the time they took and
+    the id of the worker process. """
+    # Every root move leads to a different board, so each gets its own random stream; `seed` tells
+    # apart the batches of one root move in a round.
+    rng = random.Random("%s:%d" % (seed, next_state.board.zobrist_hash()))
+    assert next_state.previous_state is not None
+    player = next_state.previous_state.next_player
+    start = time.perf_counter()
+    wins = sum(1 for _ in range(num_playouts) if random_playout(next_state, rng) == player)
+    return wins, time.perf_counter() - start, os.getpid()
+
+
+class FlatMCAgent(Agent):
+    def __init__(
+        self,
+        num_playouts: int = 1000,
+        batch_size: int = 16,
+        num_workers: Optional[int] = 1,
+        prune_sigma: float = 2.0,
+        seed: Optional[int] = None,
+    ):
+        """ Spend about `num_playouts` playouts per move in batches of `batch_size`.
+
+        A round has at least one batch per root move still in contention, rounded up to a multiple
+        of `num_workers`. A root move is pruned when its win rate plus `prune_sigma` standard errors is
+        below the best win rate minus `prune_sigma` standard errors. `num_workers` None uses every CPU.
+        With a `seed` every batch is seeded by the seed, the round, its index among the batches of its
+        root move and the Zobrist hash of the position after the move, so the chosen move is
+        reproducible for a given number of workers.
+        """
+        Agent.__init__(self)
+        self.num_playouts = num_playouts
+        self.batch_size = batch_size
+        self.prune_sigma = prune_sigma
+        self.seed = seed
+        self._splitter = RootSplitter(num_workers)
+        self.num_workers = self._splitter.num_workers
+        self.last_playouts = 0
+        self.last_playouts_per_second = 0.0
+        self.last_worker_stats: Dict[int, Tuple[int, float]] = {}
+
+    def select_move(self, game_state: GameState) -> Move:
+        candidates = [move for move in game_state.legal_moves() if not move.is_resign]
+        wins = {move: 0 for move in candidates}
+        visits = {move: 0 for move in candidates}
+        worker_stats: Dict[int, Tuple[int, float]] = {}
+        seed = self.seed if self.seed is not None else random.getrandbits(32)
+
+        start = time.perf_counter()
+        total = 0
+        round_number = 0
+        while len(candidates) > 1 and total < self.num_playouts:
+            round_seed = "%d:%d" % (seed, round_number)
+            tasks = [(move, (self.batch_size, "%s:%d" % (round_seed, i))) for move, i in self._plan_round(candidates)]
+            results = self._splitter.map(game_state, tasks, _playout_batch)
+            for (move, _), (move_wins, seconds, pid) in zip(tasks, results):
+                wins[move] += move_wins
+                visits[move] += self.batch_size
+                playouts, busy = worker_stats.get(pid, (0, 0.0))
+                worker_stats[pid] = (playouts + self.batch_size, busy + seconds)
+            total += self.batch_size * len(tasks)
+            round_number += 1
+            candidates = self._prune(candidates, wins, visits)
+
+        self.last_playouts = total
+        self.last_playouts_per_second = total / max(time.perf_counter() - start, 1e-9)
+        self.last_worker_stats = worker_stats
+        return max(candidates, key=lambda move: wins[move] / visits[move] if visits[move] else 0.0)
+
+    def _plan_round(self, candidates: List[Move]) -> List[Tuple[Move, int]]:
+        """ The batches of a round as (root move, index among the batches of that move). """
+        num_batches = -(-len(candidates) // self.num_workers) * self.num_workers
+        return [(candidates[i % len(candidates)], i // len(candidates)) for i in range(num_batches)]
+
+    def _prune(self, candidates: List[Move], wins: Dict[Move, int], visits: Dict[Move, int]) -> List[Move]:
+        def bounds(move: Move) -> Tuple[float, float]:
+            rate = wins[move] / visits[move]
+            error = self.prune_sigma * math.sqrt(max(rate * (1 - rate), 1e-6) / visits[move])
+            return rate - error, rate + error
+
+        best_lower = max(bounds(move)[0] for move in candidates)
+        return [move for move in candidates if bounds(move)[1] >= best_lower]
+
+    def worker_playouts_per_second(self) -> Dict[int, float]:
+        """ Playouts per second of busy time of each worker process in the last search. """
+        return {pid: playouts / seconds for pid, (playouts, seconds) in self.last_worker_stats.items() if seconds}
+
+    def close(self):
+        self._splitter.close()
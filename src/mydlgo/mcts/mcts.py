@@ -0,0 +1,169 @@
+from __future__ import annotations
+import copy
+import math
+import random
+import time
+from typing import Dict, List, Optional
+
+from mydlgo.agent import Agent
+from mydlgo.agent.helpers import is_point_an_eye
+from mydlgo.goboard import GameState, Move
+from mydlgo.gotypes import Player
+from mydlgo.scoring import compute_game_result
+
+__all__ = ["MCTSNode", "MCTSAgent", "random_playout"]
+
+
+def random_playout(game_state: GameState, rng=random, max_moves: Optional[int] = None) -> Player:
+    """ Finish the game with random moves that do not fill our own eyes and return the winner.
+
+    The playout works on a copy of the board without creating a GameState per move, so only simple
+    ko is checked, against the position before the last move.
+    """
+    if game_state.is_over():
+        winner = game_state.winner()
+        assert winner is not None
+        return winner
+    board = copy.deepcopy(game_state.board)
+    player = game_state.next_player
+    if max_moves is None:
+        max_moves = 3 * board.num_rows * board.num_cols
+    ko_hash = game_state.previous_state._hash if game_state.previous_state is not None else None
+    last_move = game_state.last_move
+    passes = 1 if last_move is not None and last_move.is_pass else 0
+
+    for _ in range(max_moves):
+        if passes == 2:
+            break
+        candidates = board.playable_points(player)
+        point = None
+        while candidates:
+            i = rng.randrange(len(candidates))
+            candidate = candidates[i]
+            if is_point_an_eye(board, candidate, player) or board.hash_after(player, candidate) == ko_hash:
+                candidates[i] = candidates[-1]
+                candidates.pop()
+                continue
+            point = candidate
+            break
+        ko_hash = board.zobrist_hash()
+        if point is None:
+            passes += 1
+        else:
+            passes = 0
+            board.place_stone(player, point)
+        player = player.other
+    return compute_game_result(game_state.__class__(board, player, None, None)).winner
+
+
+class MCTSNode:
+    def __init__(self, game_state: GameState, parent: Optional[MCTSNode] = None, move: Optional[Move] = None):
+        self.game_state = game_state
+        self.parent = parent
+        self.move = move
+        self.win_counts: Dict[Player, int] = {Player.BLACK: 0, Player.WHITE: 0}
+        self.num_rollouts = 0
+        self.children: List[MCTSNode] = []
+        # Resigning is never worth exploring.
+        self.unvisited_moves = [move for move in game_state.legal_moves() if not move.is_resign]
+
+    def add_random_child(self, rng=random) -> MCTSNode:
+        index = rng.randrange(len(self.unvisited_moves))
+        new_move = self.unvisited_moves.pop(index)
+        new_game_state = self.game_state.apply_move(new_move)
+        new_node = MCTSNode(new_game_state, self, new_move)
+        self.children.append(new_node)
+        return new_node
+
+    def record_win(self, winner: Player):
+        self.win_counts[winner] += 1
+        self.num_rollouts += 1
+
+    def can_add_child(self) -> bool:
+        return len(self.unvisited_moves) > 0
+
+    def is_terminal(self) -> bool:
+        return self.game_state.is_over()
+
+    def winning_frac(self, player: Player) -> float:
+        return self.win_counts[player] / self.num_rollouts
+
+
+class MCTSAgent(Agent):
+    def __init__(
+        self,
+        num_rounds: int = 1000,
+        temperature: float = 0.0,
+        exploration: float = 1.4,
+        time_budget: Optional[float] = None,
+        max_playout_moves: Optional[int] = None,
+        seed: Optional[int] = None,
+    ):
+        """ UCT search with `num_rounds` playouts per move, or as many as `time_budget` seconds allow.
+
+        `exploration` is the UCT constant. With `temperature` 0 the most visited move is played,
+        otherwise a move is drawn with probability proportional to visits ** (1 / temperature).
+        """
+        Agent.__init__(self)
+        self.num_rounds = num_rounds
+        self.temperature = temperature
+        self.exploration = exploration
+        self.time_budget = time_budget
+        self.max_playout_moves = max_playout_moves
+        self._random = random.Random(seed) if seed is not None else random
+        self.last_playouts = 0
+        self.last_playouts_per_second = 0.0
+
+    def select_move(self, game_state: GameState) -> Move:
+        root = MCTSNode(game_state)
+        start = time.perf_counter()
+        deadline = None if self.time_budget is None else start + self.time_budget
+        rounds = 0
+        while rounds < self.num_rounds or deadline is not None:
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+            node = root
+            while not node.can_add_child() and not node.is_terminal() and node.children:
+                node = self.select_child(node)
+            if node.can_add_child():
+                node = node.add_random_child(self._random)
+            winner = random_playout(node.game_state, self._random, self.max_playout_moves)
+            visited: Optional[MCTSNode] = node
+            while visited is not None:
+                visited.record_win(winner)
+                visited = visited.parent
+            rounds += 1
+
+        self.last_playouts = rounds
+        self.last_playouts_per_second = rounds / max(time.perf_counter() - start, 1e-9)
+        if not root.children:
+            return Move.pass_turn()
+        return self.choose_move(root)
+
+    def select_child(self, node: MCTSNode) -> MCTSNode:
+        """ The child with the best UCT score for the player to move at `node`. """
+        total_rollouts = sum(child.num_rollouts for child in node.children)
+        log_rollouts = math.log(total_rollouts)
+        player = node.game_state.next_player
+
+        best_score = -1.0
+        best_child = node.children[0]
+        for child in node.children:
+            win_percentage = child.winning_frac(player)
+            exploration_factor = math.sqrt(log_rollouts / child.num_rollouts)
+            uct_score = win_percentage + self.exploration * exploration_factor
+            if uct_score > best_score:
+                best_score = uct_score
+                best_child = child
+        return best_child
+
+    def choose_move(self, root: MCTSNode) -> Move:
+        if self.temperature <= 0:
+            player = root.game_state.next_player
+            best = max(root.children, key=lambda child: (child.num_rollouts, child.winning_frac(player)))
+        else:
+            weights = [child.num_rollouts ** (1.0 / self.temperature) for child in root.children]
+            best = self._random.choices(root.children, weights=weights)[0]
+        # Only the root has no move.
+        assert best.move is not None
+        return best.move
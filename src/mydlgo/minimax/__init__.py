@@ -1,3 +1,7 @@
 from .depthprune import *  # noqa;
 from .alphabeta import *  # noqa;
+from .negamax import *  # noqa;
+from .transposition import *  # noqa;
+from .ordering import *  # noqa;
+from .parallel import *  # noqa;
 from .minimax_ttt import *  # noqa;
@@ -1,9 +1,13 @@
 import random
-from typing import List, Callable
+import time
+from typing import List, Callable, Optional, Tuple
 
 from mydlgo.agent import Agent
 from mydlgo.goboard import GameState, Move
 from mydlgo.gotypes import Player
+from .ordering import SearchContext, SearchTimeout
+from .parallel import RootSplitter, worker_table
+from .transposition import EXACT, LOWER, UPPER, TranspositionTable, principal_variation, resume_search
 
 
 MAX_SCORE = 999999
@@ -11,55 +15,195 @@ MIN_SCORE = -999999
 
 
 def alpha_beta_result(
-    game_state: GameState, max_depth: int, best_black: int, best_white: int, eval_fn: Callable
+    game_state: GameState,
+    max_depth: int,
+    best_black: int,
+    best_white: int,
+    eval_fn: Callable,
+    tt: Optional[TranspositionTable] = None,
+    context: Optional[SearchContext] = None,
 ) -> int:
     if game_state.is_over():
         return MAX_SCORE if game_state.winner() == game_state.next_player else MIN_SCORE
 
     if max_depth == 0:
         return eval_fn(game_state)
+    if context is not None:
+        context.visit()
+
+    # The window of this node, seen from the player to move.
+    if game_state.next_player == Player.WHITE:
+        alpha, beta = best_white, -best_black
+    else:
+        alpha, beta = best_black, -best_white
+
+    moves = game_state.legal_moves()
+    hash_move = None
+    if tt is not None:
+        key = tt.key(game_state)
+        entry = tt.probe(key)
+        if tt.cutoff(entry, max_depth, alpha, beta):
+            assert entry is not None
+            return entry.value
+        if entry is not None:
+            hash_move = entry.best_move
+    if context is not None:
+        ply = context.ply(max_depth)
+        moves = context.order_moves(moves, game_state.next_player, ply, hash_move)
+    elif hash_move is not None and hash_move in moves:
+        # Search the move that was best last time first, it is the most likely to cut off.
+        moves.remove(hash_move)
+        moves.insert(0, hash_move)
 
     best_so_far = MIN_SCORE
-    for candidate_move in game_state.legal_moves():
-        next_state = game_state.apply_move(candidate_move)
-        opponent_best_result = alpha_beta_result(next_state, max_depth - 1, best_black, best_white, eval_fn)
+    best_move = None
+    for candidate_move in moves:
+        next_state = game_state.push(candidate_move)
+        try:
+            opponent_best_result = alpha_beta_result(
+                next_state, max_depth - 1, best_black, best_white, eval_fn, tt, context
+            )
+        finally:
+            # A search that runs out of time unwinds through here and must leave the board as it was.
+            next_state.pop()
         our_result = -opponent_best_result
 
         if our_result > best_so_far:
             best_so_far = our_result
+            best_move = candidate_move
         if game_state.next_player == Player.WHITE:
             if best_so_far > best_white:
                 best_white = best_so_far
             outcome_for_black = -best_so_far
             if outcome_for_black < best_black:
-                return best_so_far
+                if context is not None:
+                    context.record_cutoff(candidate_move, game_state.next_player, ply, max_depth)
+                break
         elif game_state.next_player == Player.BLACK:
             if best_so_far > best_black:
                 best_black = best_so_far
             outcome_for_white = -best_so_far
             if outcome_for_white < best_white:
-                return best_so_far
+                if context is not None:
+                    context.record_cutoff(candidate_move, game_state.next_player, ply, max_depth)
+                break
+
+    if tt is not None:
+        if best_so_far >= beta:
+            flag = LOWER
+        elif best_so_far <= alpha:
+            flag = UPPER
+        else:
+            flag = EXACT
+        tt.store(key, max_depth, flag, best_so_far, best_move)
     return best_so_far
 
 
+def _root_score(next_state: GameState, max_depth: int, eval_fn: Callable, tt_size: Optional[int]) -> int:
+    """ Full-window score of a root move, searched by a worker of the parallel search with a table of
+    `tt_size` slots, or without one if it is None. """
+    tt = worker_table(tt_size) if tt_size is not None else None
+    return -alpha_beta_result(next_state, max_depth, MIN_SCORE, MIN_SCORE, eval_fn, tt)
+
+
 class AlphaBetaAgent(Agent):
-    def __init__(self, max_depth: int, eval_fn: Callable):
+    def __init__(
+        self,
+        max_depth: int,
+        eval_fn: Callable,
+        tt: Optional[TranspositionTable] = None,
+        time_budget: Optional[float] = None,
+        num_workers: int = 1,
+        seed: Optional[int] = None,
+        cache: bool = True,
+        max_cache_age: int = 4,
+    ):
+        """ With a `time_budget` in seconds the agent deepens the search one ply at a time, up to
+        `max_depth`, and plays the best move of the deepest search that fits in the budget.
+
+        With `num_workers` > 1 the root moves of the fixed-depth search are scored in parallel
+        processes. `seed` makes the choice between equally good moves reproducible.
+
+        With `cache` the transposition table is kept from one move to the next, dropping entries
+        more than `max_cache_age` plies old, and the principal line of the previous search is
+        searched first when the opponent played the reply it predicted. The parallel search gives
+        every root move a table of the same size in its worker instead, so this one stays empty.
+        """
+        if num_workers > 1 and time_budget is not None:
+            raise ValueError("The parallel search does not support a time budget")
         Agent.__init__(self)
         self.max_depth = max_depth
         self.eval_fn = eval_fn
+        if tt is None and (cache or time_budget is not None):
+            tt = TranspositionTable()
+        self.tt = tt
+        self.max_cache_age = max_cache_age
+        self._principal_line: List[Move] = []
+        self.time_budget = time_budget
+        self.last_depth: Optional[int] = None
+        self.last_nodes = 0
+        self._splitter = RootSplitter(num_workers) if num_workers > 1 else None
+        self._random = random.Random(seed) if seed is not None else random
+
+    def close(self):
+        if self._splitter is not None:
+            self._splitter.close()
 
     def select_move(self, game_state: GameState):
+        moves = game_state.legal_moves()
+        if self.tt is not None:
+            first_move = resume_search(self.tt, game_state, self._principal_line, self.max_cache_age)
+            if first_move is not None and first_move in moves:
+                moves.remove(first_move)
+                moves.insert(0, first_move)
+
+        move = self._select_move(game_state, moves)
+        if self.tt is not None:
+            next_state = game_state.push(move)
+            self._principal_line = [move] + principal_variation(self.tt, next_state, self.max_depth + 1)
+            next_state.pop()
+        return move
+
+    def _select_move(self, game_state: GameState, moves: List[Move]) -> Move:
+        if self.time_budget is not None:
+            return self._iterative_deepening(game_state, moves)
+        if self._splitter is not None:
+            tt_size = self.tt.size if self.tt is not None else None
+            scores = self._splitter.scores(game_state, moves, _root_score, self.max_depth, self.eval_fn, tt_size)
+            best_score = max(scores)
+            return self._random.choice([move for move, score in zip(moves, scores) if score == best_score])
+
+        best_moves = self._search_root(game_state, moves, self.max_depth, None, [])
+        # For variety, randomly select among all equally good moves.
+        return self._random.choice(best_moves)
+
+    def _search_root(
+        self,
+        game_state: GameState,
+        moves: List[Move],
+        depth: int,
+        context: Optional[SearchContext],
+        scores: List[Tuple[Move, int]],
+    ) -> List[Move]:
+        """ The equally good best moves. The score of every move is appended to `scores` as soon as it
+        is known, so they are still there if the search times out. """
         best_moves: List[Move] = []
         best_score = MIN_SCORE
         best_black = MIN_SCORE
         best_white = MIN_SCORE
-        for possible_move in game_state.legal_moves():
-            next_state = game_state.apply_move(possible_move)
+        for possible_move in moves:
+            next_state = game_state.push(possible_move)
             # Since our opponent plays next, figure out their best
             # possible outcome from there.
-            opponent_best_outcome = alpha_beta_result(next_state, self.max_depth, best_black, best_white, self.eval_fn)
+            try:
+                opponent_best_outcome = alpha_beta_result(
+                    next_state, depth, best_black, best_white, self.eval_fn, self.tt, context
+                )
+            finally:
+                next_state.pop()
             # Our outcome is the opposite of our opponent's outcome.
             our_best_outcome = -opponent_best_outcome
+            scores.append((possible_move, our_best_outcome))
             if len(best_moves) == 0 or our_best_outcome > best_score:
                 # This is the best move so far.
                 best_moves = [possible_move]
@@ -71,5 +215,27 @@ class AlphaBetaAgent(Agent):
             elif our_best_outcome == best_score:
                 # This is as good as our previous best move.
                 best_moves.append(possible_move)
-        # For variety, randomly select among all equally good moves.
-        return random.choice(best_moves)
+        return best_moves
+
+    def _iterative_deepening(self, game_state: GameState, moves: List[Move]) -> Move:
+        assert self.time_budget is not None
+        context = SearchContext(time.perf_counter() + self.time_budget)
+        best_moves = moves[:1]
+        for depth in range(self.max_depth + 1):
+            context.depth = depth
+            scores: List[Tuple[Move, int]] = []
+            try:
+                best_moves = self._search_root(game_state, moves, depth, context, scores)
+            except SearchTimeout:
+                # The first move searched is the previous best, so a partial iteration can only
+                # replace it by a move that has been shown to be better.
+                if scores:
+                    top = max(score for _, score in scores)
+                    if scores[0][1] < top:
+                        best_moves = [move for move, score in scores if score == top]
+                break
+            self.last_depth = depth
+            # Principal variation first in the next iteration: sort the root moves by their score.
+            moves = [move for move, _ in sorted(scores, key=lambda item: -item[1])]
+        self.last_nodes = context.nodes
+        return self._random.choice(best_moves)
@@ -1,47 +1,119 @@
 import random
-from typing import List, Callable
+from typing import List, Callable, Optional
 
 from mydlgo.agent import Agent
 from mydlgo.goboard import GameState, Move
+from .parallel import RootSplitter, worker_table
+from .transposition import EXACT, TranspositionTable, principal_variation, resume_search
 
 
 MAX_SCORE = 999999
 MIN_SCORE = -999999
 
 
-def best_result(game_state: GameState, max_depth: int, eval_fn: Callable):
+def best_result(game_state: GameState, max_depth: int, eval_fn: Callable, tt: Optional[TranspositionTable] = None):
     if game_state.is_over():
         return MAX_SCORE if game_state.winner() == game_state.next_player else MIN_SCORE
 
     if max_depth == 0:
         return eval_fn(game_state)
 
+    if tt is not None:
+        # Every stored score is exact, so an entry at least as deep as this search answers it.
+        key = tt.key(game_state)
+        entry = tt.probe(key)
+        if tt.cutoff(entry, max_depth, MIN_SCORE, MAX_SCORE):
+            assert entry is not None
+            return entry.value
+
     best_so_far = MIN_SCORE
+    best_move = None
     for candidate_move in game_state.legal_moves():
-        next_state = game_state.apply_move(candidate_move)
-        opponent_best_result = best_result(next_state, max_depth - 1, eval_fn)
+        next_state = game_state.push(candidate_move)
+        opponent_best_result = best_result(next_state, max_depth - 1, eval_fn, tt)
+        next_state.pop()
         our_result = -1 * opponent_best_result
-        if our_result > best_so_far:
+        if our_result > best_so_far or best_move is None:
             best_so_far = our_result
+            best_move = candidate_move
+
+    if tt is not None:
+        tt.store(key, max_depth, EXACT, best_so_far, best_move)
     return best_so_far
 
 
+def _root_score(next_state: GameState, max_depth: int, eval_fn: Callable, tt_size: Optional[int]) -> int:
+    """ Score of a root move, searched by a worker of the parallel search with a table of `tt_size`
+    slots, or without one if it is None. """
+    tt = worker_table(tt_size) if tt_size is not None else None
+    return -1 * best_result(next_state, max_depth, eval_fn, tt)
+
+
 class DepthPrunedAgent(Agent):
-    def __init__(self, max_depth: int, eval_fn: Callable):
+    def __init__(
+        self,
+        max_depth: int,
+        eval_fn: Callable,
+        num_workers: int = 1,
+        seed: Optional[int] = None,
+        tt: Optional[TranspositionTable] = None,
+        cache: bool = True,
+        max_cache_age: int = 4,
+    ):
+        """ With `num_workers` > 1 the root moves are scored in parallel processes. `seed` makes the
+        choice between equally good moves reproducible.
+
+        With `cache` the scores of searched positions are kept from one move to the next in a
+        transposition table, dropping entries more than `max_cache_age` plies old. The parallel search
+        gives every root move a table of the same size in its worker instead.
+        """
         Agent.__init__(self)
         self.max_depth = max_depth
         self.eval_fn = eval_fn
+        if tt is None and cache:
+            tt = TranspositionTable()
+        self.tt = tt
+        self.max_cache_age = max_cache_age
+        self._principal_line: List[Move] = []
+        self._splitter = RootSplitter(num_workers) if num_workers > 1 else None
+        self._random = random.Random(seed) if seed is not None else random
+
+    def close(self):
+        if self._splitter is not None:
+            self._splitter.close()
 
     def select_move(self, game_state: GameState) -> Move:
+        moves = game_state.legal_moves()
+        if self.tt is not None:
+            first_move = resume_search(self.tt, game_state, self._principal_line, self.max_cache_age)
+            if first_move is not None and first_move in moves:
+                moves.remove(first_move)
+                moves.insert(0, first_move)
+
+        move = self._select_move(game_state, moves)
+        if self.tt is not None:
+            next_state = game_state.push(move)
+            self._principal_line = [move] + principal_variation(self.tt, next_state, self.max_depth + 1)
+            next_state.pop()
+        return move
+
+    def _select_move(self, game_state: GameState, moves: List[Move]) -> Move:
+        if self._splitter is not None:
+            tt_size = self.tt.size if self.tt is not None else None
+            scores = self._splitter.scores(game_state, moves, _root_score, self.max_depth, self.eval_fn, tt_size)
+            best_score = max(scores)
+            return self._random.choice([move for move, score in zip(moves, scores) if score == best_score])
+
         best_moves: List[Move] = []
         best_score = None
         # Loop over all legal moves.
-        for possible_move in game_state.legal_moves():
+        for possible_move in moves:
             # Calculate the game state if we select this move.
-            next_state = game_state.apply_move(possible_move)
+            next_state = game_state.push(possible_move)
             # Since our opponent plays next, figure out their best
             # possible outcome from there.
-            opponent_best_outcome = best_result(next_state, self.max_depth, self.eval_fn)
+            opponent_best_outcome = best_result(next_state, self.max_depth, self.eval_fn, self.tt)
+            next_state.pop()
             # Our outcome is the opposite of our opponent's outcome.
             our_best_outcome = -1 * opponent_best_outcome
             if (not best_moves) or our_best_outcome > best_score:
@@ -52,4 +124,4 @@ class DepthPrunedAgent(Agent):
                 # This is as good as our previous best move.
                 best_moves.append(possible_move)
         # For variety, randomly select among all equally good moves.
-        return random.choice(best_moves)
+        return self._random.choice(best_moves)
@@ -0,0 +1,193 @@
+"""
+Negamax alpha-beta with principal variation search.
+
+Scores are always from the point of view of the player to move, like `eval_fn(game_state)`. They are
+typed as floats since an `Evaluator` returns floats, but are expected to take integer values so that
+(alpha, alpha + 1) is a null window.
+
+When `eval_fn` is an `Evaluator`, the children of a node one ply above the leaves are evaluated
+together in one batch instead of one at a time.
+"""
+import time
+from typing import Callable, List, Optional, Tuple
+
+from mydlgo.agent import Agent
+from mydlgo.eval import EvaluationQueue, Evaluator
+from mydlgo.goboard import GameState, Move
+from .ordering import SearchContext, SearchTimeout
+from .transposition import EXACT, LOWER, UPPER, TranspositionTable
+
+__all__ = ["negamax", "NegamaxAgent"]
+
+MAX_SCORE = 999999
+MIN_SCORE = -999999
+INFINITY = MAX_SCORE + 1
+
+
+def negamax(
+    game_state: GameState,
+    depth: int,
+    alpha: float,
+    beta: float,
+    eval_fn: Callable,
+    tt: Optional[TranspositionTable] = None,
+    context: Optional[SearchContext] = None,
+    ply: int = 0,
+    pvs: bool = True,
+) -> float:
+    """ Fail-soft score of `game_state` searched `depth` plies deep with the window (alpha, beta).
+
+    Without `pvs` every move is searched with the full window, which is only useful to measure what
+    the null windows save.
+    """
+    if game_state.is_over():
+        return MAX_SCORE if game_state.winner() == game_state.next_player else MIN_SCORE
+
+    if depth == 0:
+        return eval_fn(game_state)
+    if context is not None:
+        context.visit()
+
+    original_alpha = alpha
+    hash_move = None
+    if tt is not None:
+        key = tt.key(game_state)
+        entry = tt.probe(key)
+        if tt.cutoff(entry, depth, alpha, beta):
+            assert entry is not None
+            return entry.value
+        if entry is not None:
+            hash_move = entry.best_move
+
+    moves = game_state.legal_moves()
+    if context is not None:
+        moves = context.order_moves(moves, game_state.next_player, ply, hash_move)
+    elif hash_move is not None and hash_move in moves:
+        moves.remove(hash_move)
+        moves.insert(0, hash_move)
+
+    if depth == 1 and isinstance(eval_fn, Evaluator):
+        frontier_score, frontier_move = _search_frontier(game_state, moves, eval_fn)
+        if tt is not None:
+            tt.store(key, depth, EXACT, frontier_score, frontier_move)
+        return frontier_score
+
+    best_score: float = -INFINITY
+    best_move = None
+    for i, move in enumerate(moves):
+        child = game_state.push(move)
+        try:
+            if i == 0 or not pvs:
+                score = -negamax(child, depth - 1, -beta, -alpha, eval_fn, tt, context, ply + 1, pvs)
+            else:
+                # Prove with a null window that the move is no better than the first one, and only
+                # search it properly when that fails.
+                score = -negamax(child, depth - 1, -alpha - 1, -alpha, eval_fn, tt, context, ply + 1, pvs)
+                if alpha < score < beta:
+                    score = -negamax(child, depth - 1, -beta, -score, eval_fn, tt, context, ply + 1, pvs)
+        finally:
+            child.pop()
+
+        if score > best_score:
+            best_score = score
+            best_move = move
+        if score > alpha:
+            alpha = score
+        if alpha >= beta:
+            if context is not None:
+                context.record_cutoff(move, game_state.next_player, ply, depth)
+            break
+
+    if tt is not None:
+        if best_score <= original_alpha:
+            flag = UPPER
+        elif best_score >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        tt.store(key, depth, flag, best_score, best_move)
+    return best_score
+
+
+def _search_frontier(game_state: GameState, moves: List[Move], evaluator: Evaluator) -> Tuple[float, Move]:
+    """ Exact score and best move of a node whose children are leaves, evaluated in one batch. """
+    queue = EvaluationQueue(evaluator, batch_size=len(moves))
+    values = [0.0] * len(moves)
+    pending = []
+    for i, move in enumerate(moves):
+        child = game_state.push(move)
+        try:
+            if child.is_over():
+                values[i] = MIN_SCORE if child.winner() == child.next_player else MAX_SCORE
+            else:
+                pending.append((i, queue.put(child)))
+        finally:
+            child.pop()
+    for i, evaluation in pending:
+        values[i] = -evaluation.value
+    best = max(range(len(moves)), key=values.__getitem__)
+    return values[best], moves[best]
+
+
+class NegamaxAgent(Agent):
+    def __init__(
+        self,
+        max_depth: int,
+        eval_fn: Callable,
+        tt: Optional[TranspositionTable] = None,
+        time_budget: Optional[float] = None,
+        aspiration_window: int = 2,
+        pvs: bool = True,
+    ):
+        """ Iterative deepening up to `max_depth` plies, or as deep as `time_budget` seconds allow.
+
+        From the second iteration on, the search starts with the window of `aspiration_window` around
+        the previous score and reopens the side that fails. The best move is read back from the
+        transposition table, so unlike AlphaBetaAgent the choice between equal moves is not random.
+        `pvs` turns the null-window searches of principal variation search on or off.
+        """
+        Agent.__init__(self)
+        self.max_depth = max_depth
+        self.eval_fn = eval_fn
+        self.tt = tt if tt is not None else TranspositionTable()
+        self.time_budget = time_budget
+        self.aspiration_window = aspiration_window
+        self.pvs = pvs
+        self.last_depth: Optional[int] = None
+        self.last_score: Optional[float] = None
+        self.last_nodes = 0
+
+    def select_move(self, game_state: GameState) -> Move:
+        deadline = None if self.time_budget is None else time.perf_counter() + self.time_budget
+        context = SearchContext(deadline)
+        self.tt.new_search()
+        key = self.tt.key(game_state)
+
+        best_move = game_state.legal_moves()[0]
+        score: Optional[float] = None
+        alpha: float
+        beta: float
+        for depth in range(1, self.max_depth + 1):
+            if score is None:
+                alpha, beta = -INFINITY, INFINITY
+            else:
+                alpha, beta = score - self.aspiration_window, score + self.aspiration_window
+            try:
+                while True:
+                    result = negamax(game_state, depth, alpha, beta, self.eval_fn, self.tt, context, 0, self.pvs)
+                    if result <= alpha:
+                        alpha = -INFINITY
+                    elif result >= beta:
+                        beta = INFINITY
+                    else:
+                        break
+            except SearchTimeout:
+                break
+            score = result
+            entry = self.tt.probe(key)
+            if entry is not None and entry.best_move is not None:
+                best_move = entry.best_move
+            self.last_depth = depth
+            self.last_score = score
+        self.last_nodes = context.nodes
+        return best_move
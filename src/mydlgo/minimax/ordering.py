@@ -0,0 +1,70 @@
+"""
+Move ordering and time control shared by the minimax searches.
+"""
+from __future__ import annotations
+import time
+from typing import Dict, List, Optional, Tuple
+
+from mydlgo.goboard import Move
+from mydlgo.gotypes import Player, Point
+
+__all__ = ["SearchTimeout", "SearchContext"]
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class SearchContext:
+    """ State carried through one iterative-deepening search: the deadline, the node count, and the
+    killer moves and history scores used to order moves. """
+
+    def __init__(self, deadline: Optional[float] = None, num_killers: int = 2):
+        self.deadline = deadline
+        self.num_killers = num_killers
+        self.nodes = 0
+        self.depth = 0
+        self.killers: Dict[int, List[Move]] = {}
+        self.history: Dict[Tuple[Player, Point], int] = {}
+
+    def visit(self):
+        """ Count a node and raise SearchTimeout once the deadline has passed. """
+        self.nodes += 1
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise SearchTimeout()
+
+    def ply(self, max_depth: int) -> int:
+        """ Distance from the root of a node searched with `max_depth` in the current iteration. """
+        return self.depth - max_depth + 1
+
+    def order_moves(self, moves: List[Move], player: Player, ply: int, hash_move: Optional[Move] = None) -> List[Move]:
+        """ The hash move first, then the killers of this ply, then the other plays by history score.
+        Passing and resigning stay at the end. """
+        first = []
+        if hash_move is not None and hash_move in moves:
+            first.append(hash_move)
+        for killer in self.killers.get(ply, []):
+            if killer not in first and killer in moves:
+                first.append(killer)
+        history = self.history
+        scored = []
+        others = []
+        for move in moves:
+            if move in first:
+                continue
+            if move.point is None:
+                others.append(move)
+            else:
+                scored.append((history.get((player, move.point), 0), move))
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return first + [move for _, move in scored] + others
+
+    def record_cutoff(self, move: Move, player: Player, ply: int, depth: int):
+        if move.point is None:
+            return
+        killers = self.killers.setdefault(ply, [])
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[self.num_killers :]
+        key = (player, move.point)
+        self.history[key] = self.history.get(key, 0) + depth * depth
@@ -0,0 +1,118 @@
+"""
+Root-split parallel search.
+
+Every root move is scored by its own full-window search in a pool of worker processes. The position
+is sent to the workers as a copy of its board with the history needed to play on from it, which is much
+cheaper to pickle than a GameState with its whole chain of earlier states, and is right for boards that
+were set up directly (handicap stones, tests, GTP) rather than reached by playing moves.
+
+Because no bound or table entry is shared between root moves, the score of a move does not depend on
+which worker searched it or in which order, so the result is deterministic.
+"""
+from __future__ import annotations
+import copy
+import multiprocessing
+import multiprocessing.pool
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from mydlgo.goboard import GameState, Move
+from .transposition import TranspositionTable
+
+__all__ = ["RootSplitter", "detached", "worker_table"]
+
+
+def detached(game_state: GameState) -> GameState:
+    """ A copy of `game_state` on its own board, cut off from the states before it.
+
+    It keeps the positions seen so far for the ko checks, and a parent with the last move but no board
+    history of its own, so is_over() and push()/pop() behave as on the original.
+    """
+    board = copy.deepcopy(game_state.board)
+    state = copy.copy(game_state)
+    state.board = board
+    if game_state.previous_state is not None:
+        parent = copy.copy(game_state.previous_state)
+        parent.board = board
+        parent.previous_state = None
+        state.previous_state = parent
+    return state
+
+
+_worker_tt: Optional[TranspositionTable] = None
+
+
+def worker_table(size: int) -> TranspositionTable:
+    """ An empty transposition table of `size` slots for one root move searched by this process.
+
+    The table is allocated once per process and cleared for every root move, so no entry carries over
+    from one root move to the next.
+    """
+    global _worker_tt
+    if _worker_tt is None or _worker_tt.size != size:
+        _worker_tt = TranspositionTable(size)
+    else:
+        _worker_tt.clear()
+    return _worker_tt
+
+
+def _score_root_move(task):
+    game_state, root_move, score_fn, args = task
+    next_state = game_state.push(root_move)
+    try:
+        return score_fn(next_state, *args)
+    finally:
+        next_state.pop()
+
+
+class RootSplitter:
+    def __init__(self, num_workers: Optional[int] = None):
+        """ The worker pool is started on first use and kept until close(). With a single worker the
+        root moves are scored in this process instead. """
+        self.num_workers = num_workers if num_workers is not None else multiprocessing.cpu_count()
+        self._pool: Optional[multiprocessing.pool.Pool] = None
+
+    def __getstate__(self):
+        # A pool cannot be pickled; a copy of the agent sent to another process starts its own.
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
+
+    def scores(self, game_state: GameState, root_moves: List[Move], score_fn: Callable, *args) -> List:
+        """ `score_fn(next_state, *args)` for every root move, in the order of `root_moves`.
+
+        `score_fn` and `args` are pickled, so they must be module-level functions and plain values.
+        """
+        return self.map(game_state, [(root_move, args) for root_move in root_moves], score_fn)
+
+    def map(self, game_state: GameState, tasks: Sequence[Tuple[Move, Tuple]], score_fn: Callable) -> List:
+        """ `score_fn(next_state, *args)` for every (root_move, args) task, in the order of `tasks`.
+
+        Unlike scores(), a root move may come up in several tasks with different arguments.
+        """
+        if self.num_workers == 1:
+            results = []
+            for root_move, args in tasks:
+                next_state = game_state.push(root_move)
+                try:
+                    results.append(score_fn(next_state, *args))
+                finally:
+                    next_state.pop()
+            return results
+
+        root = detached(game_state)
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(self.num_workers)
+        jobs = [(root, root_move, score_fn, args) for root_move, args in tasks]
+        return self._pool.map(_score_root_move, jobs, chunksize=1)
+
+    def __enter__(self) -> RootSplitter:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
@@ -0,0 +1,187 @@
+"""
+Transposition table for the minimax searches.
+
+Positions are keyed on the Zobrist hash of the board, mixed with a constant when white is to play, and
+stored in a fixed number of slots indexed by the low bits of the key. Every entry keeps its full key so
+a probe can tell a hit from a different position sharing the slot (a collision).
+"""
+from __future__ import annotations
+from collections import namedtuple
+from typing import List, Optional
+
+from mydlgo.goboard import GameState, Move
+from mydlgo.gotypes import Player
+
+__all__ = [
+    "EXACT",
+    "LOWER",
+    "UPPER",
+    "TTEntry",
+    "TTStats",
+    "TranspositionTable",
+    "principal_variation",
+    "resume_search",
+]
+
+EXACT = 0
+LOWER = 1  # the search failed high: the value is at least `value`
+UPPER = 2  # the search failed low: the value is at most `value`
+
+WHITE_TO_PLAY = 0x2545F4914F6CDD1D
+
+TTEntry = namedtuple("TTEntry", "key depth flag value best_move generation")
+
+
+class TTStats(namedtuple("TTStats", "probes hits misses collisions cutoffs stores replacements")):
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.probes if self.probes else 0.0
+
+    def __str__(self):
+        return "probes %d, hits %d (%.1f%%), misses %d, collisions %d, cutoffs %d, stores %d, replacements %d" % (
+            self.probes,
+            self.hits,
+            100 * self.hit_rate,
+            self.misses,
+            self.collisions,
+            self.cutoffs,
+            self.stores,
+            self.replacements,
+        )
+
+
+class TranspositionTable:
+    def __init__(self, size: int = 1 << 16):
+        """ `size` is the number of slots and is rounded up to a power of two. """
+        self.size = 1 << max(size - 1, 0).bit_length()
+        self._mask = self.size - 1
+        self._entries: List[Optional[TTEntry]] = [None] * self.size
+        self.generation = 0
+        self.reset_stats()
+
+    @staticmethod
+    def key(game_state: GameState) -> int:
+        key = game_state.board.zobrist_hash()
+        return key ^ WHITE_TO_PLAY if game_state.next_player == Player.WHITE else key
+
+    def new_search(self, ply: Optional[int] = None):
+        """ Mark the entries stored so far as old, so they are the first to be replaced.
+
+        Agents that keep the table between moves pass the game ply, so entries are aged by ply.
+        """
+        self.generation = self.generation + 1 if ply is None else ply
+
+    def evict(self, before: int) -> int:
+        """ Drop the entries stored by searches older than generation `before`. """
+        evicted = 0
+        for i, entry in enumerate(self._entries):
+            if entry is not None and entry.generation < before:
+                self._entries[i] = None
+                evicted += 1
+        return evicted
+
+    def clear(self):
+        self._entries = [None] * self.size
+        self.generation = 0
+
+    def reset_stats(self):
+        self.probes = 0
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+        self.cutoffs = 0
+        self.stores = 0
+        self.replacements = 0
+
+    def stats(self) -> TTStats:
+        return TTStats(
+            self.probes, self.hits, self.misses, self.collisions, self.cutoffs, self.stores, self.replacements
+        )
+
+    def __len__(self) -> int:
+        return sum(1 for entry in self._entries if entry is not None)
+
+    def probe(self, key: int) -> Optional[TTEntry]:
+        self.probes += 1
+        entry = self._entries[key & self._mask]
+        if entry is not None and entry.key == key:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        if entry is not None:
+            self.collisions += 1
+        return None
+
+    def peek(self, key: int) -> Optional[TTEntry]:
+        """ Like probe(), without counting it in the statistics. """
+        entry = self._entries[key & self._mask]
+        return entry if entry is not None and entry.key == key else None
+
+    def store(self, key: int, depth: int, flag: int, value: float, best_move: Optional[Move]):
+        """ Depth-preferred replacement: an entry from the current search is only replaced by the same
+        position or by a search at least as deep. Entries from older searches are always replaced. """
+        i = key & self._mask
+        entry = self._entries[i]
+        if entry is not None and entry.key != key:
+            if entry.generation == self.generation and entry.depth > depth:
+                return
+            self.replacements += 1
+        if entry is not None and entry.key == key and best_move is None:
+            best_move = entry.best_move
+        self.stores += 1
+        self._entries[i] = TTEntry(key, depth, flag, value, best_move, self.generation)
+
+    def cutoff(self, entry: Optional[TTEntry], depth: int, alpha: float, beta: float) -> bool:
+        """ Whether `entry` alone decides a search of `depth` with the window (alpha, beta). """
+        if entry is None or entry.depth < depth:
+            return False
+        if (
+            entry.flag == EXACT
+            or (entry.flag == LOWER and entry.value >= beta)
+            or (entry.flag == UPPER and entry.value <= alpha)
+        ):
+            self.cutoffs += 1
+            return True
+        return False
+
+
+def principal_variation(tt: TranspositionTable, game_state: GameState, max_length: int) -> List[Move]:
+    """ The line of best moves stored in `tt`, starting at `game_state`. """
+    line: List[Move] = []
+    state = game_state
+    seen = set()
+    while len(line) < max_length and not state.is_over():
+        key = tt.key(state)
+        entry = tt.peek(key)
+        if entry is None or entry.best_move is None or key in seen:
+            break
+        if not state.is_valid_move(entry.best_move):
+            break
+        seen.add(key)
+        line.append(entry.best_move)
+        state = state.push(entry.best_move)
+    for _ in line:
+        state = state.pop()
+    return line
+
+
+def resume_search(
+    tt: TranspositionTable, game_state: GameState, previous_line: List[Move], max_age: int
+) -> Optional[Move]:
+    """ Start a search of `game_state` with a table kept from our previous moves.
+
+    Entries more than `max_age` plies old are evicted. If the last two moves of the game are the
+    start of `previous_line`, the principal line of our previous search, the opponent answered as
+    expected and the next move of that line is returned so it can be searched first.
+    """
+    moves = []
+    state: Optional[GameState] = game_state
+    while state is not None and state.last_move is not None:
+        moves.append(state.last_move)
+        state = state.previous_state
+    ply = len(moves)
+    tt.new_search(ply)
+    tt.evict(ply - max_age)
+    if len(previous_line) > 2 and len(moves) >= 2 and [moves[1], moves[0]] == previous_line[:2]:
+        return previous_line[2]
+    return None
@@ -0,0 +1,140 @@
+"""
+Compact binary game records.
+
+A file starts with MAGIC and holds one record after another, each a fixed header followed by the moves:
+
+    board size    uint8
+    komi          int16, in half points
+    winner        uint8, 0 unknown, 1 black, 2 white
+    margin        uint16, in half points, RESIGNED for a win by resignation
+    move count    uint16
+    moves         one byte each up to 15x15, two bytes (little endian) on larger boards
+
+A move is the point index `(row - 1) * board_size + (col - 1)`, or board_size ** 2 for a pass and
+board_size ** 2 + 1 for a resignation. A typical 9x9 game takes about a hundred bytes, and reading it
+back is a struct unpack and a bytes lookup per move instead of parsing text.
+"""
+from __future__ import annotations
+import struct
+from collections import namedtuple
+from typing import BinaryIO, Dict, Iterator, List, cast
+
+from . import goboard_fast
+from .goboard import GameState, Move
+from .gotypes import Point
+
+__all__ = ["GameRecord", "RecordWriter", "read_records", "encode_record", "decode_record", "replay_record"]
+
+GameRecord = namedtuple("GameRecord", "board_size komi result moves")
+
+MAGIC = b"MDGR\x01"
+RESIGNED = 0xFFFF
+
+_HEADER = struct.Struct("<BhBHH")
+_WINNERS = {"B": 1, "W": 2}
+_COLORS = {1: "B", 2: "W"}
+
+
+def _move_width(board_size: int) -> int:
+    return 1 if board_size * board_size + 2 <= 256 else 2
+
+
+def _encode_move(move: Move, board_size: int) -> int:
+    if move.is_pass:
+        return board_size * board_size
+    if move.is_resign:
+        return board_size * board_size + 1
+    assert move.point is not None
+    return (move.point.row - 1) * board_size + (move.point.col - 1)
+
+
+_MOVES: Dict[int, List[Move]] = {}
+
+
+def _move_table(board_size: int) -> List[Move]:
+    """ Move of every code, shared by all records of a size so decoding allocates no moves. """
+    if board_size not in _MOVES:
+        moves = [Move.play(Point(i // board_size + 1, i % board_size + 1)) for i in range(board_size * board_size)]
+        _MOVES[board_size] = moves + [Move.pass_turn(), Move.resign()]
+    return _MOVES[board_size]
+
+
+def encode_record(record: GameRecord) -> bytes:
+    size = record.board_size
+    if record.result[:2] in ("B+", "W+"):
+        winner = _WINNERS[record.result[0]]
+        margin = RESIGNED if record.result[2:] == "R" else int(round(float(record.result[2:]) * 2))
+    else:
+        winner, margin = 0, 0
+    header = _HEADER.pack(size, int(round(record.komi * 2)), winner, margin, len(record.moves))
+    codes = [_encode_move(move, size) for move in record.moves]
+    if _move_width(size) == 1:
+        return header + bytes(codes)
+    return header + struct.pack("<%dH" % len(codes), *codes)
+
+
+def _decode_header(data: bytes, offset: int = 0):
+    size, komi, winner, margin, num_moves = _HEADER.unpack_from(data, offset)
+    if winner == 0:
+        result = "?"
+    elif margin == RESIGNED:
+        result = _COLORS[winner] + "+R"
+    else:
+        result = "%s+%.1f" % (_COLORS[winner], margin / 2)
+    return size, komi / 2, result, num_moves
+
+
+def decode_record(data: bytes) -> GameRecord:
+    size, komi, result, num_moves = _decode_header(data)
+    width = _move_width(size)
+    body = data[_HEADER.size : _HEADER.size + width * num_moves]
+    codes = body if width == 1 else struct.unpack("<%dH" % num_moves, body)
+    table = _move_table(size)
+    return GameRecord(size, komi, result, [table[code] for code in codes])
+
+
+class RecordWriter:
+    def __init__(self, path: str, mode: str = "ab"):
+        """ Stream records to `path`, appending to an existing file by default. """
+        self._file = cast(BinaryIO, open(path, mode))
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+
+    def __enter__(self) -> RecordWriter:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, record: GameRecord):
+        self._file.write(encode_record(record))
+
+    def close(self):
+        self._file.close()
+
+
+def read_records(path: str) -> Iterator[GameRecord]:
+    """ The records of `path` one at a time, without reading the whole file. """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError("%s is not a game record file" % path)
+        while True:
+            header = f.read(_HEADER.size)
+            if not header:
+                return
+            if len(header) < _HEADER.size:
+                raise ValueError("Truncated record in %s" % path)
+            size, _, _, num_moves = _decode_header(header)
+            body = f.read(_move_width(size) * num_moves)
+            if len(body) < _move_width(size) * num_moves:
+                raise ValueError("Truncated record in %s" % path)
+            yield decode_record(header + body)
+
+
+def replay_record(record: GameRecord, game_state_class=goboard_fast.GameState) -> Iterator[GameState]:
+    """ The positions of the game, from the empty board to the final one, built one move at a time. """
+    game = game_state_class.new_game(record.board_size)
+    yield game
+    for move in record.moves:
+        game = game.apply_move(move)
+        yield game
@@ -0,0 +1,135 @@
+"""
+Scoring rules and dead stones.
+
+A ruleset picks area scoring (stones plus territory) or territory scoring (territory plus prisoners),
+the komi and the points white gets for every handicap stone. Territory scoring needs the prisoners,
+which the boards do not keep; they follow from the number of stones each player played and still has
+on the board, counted from the game's `previous_state` chain.
+
+Dead stones are estimated from random playouts of the final position: a stone whose string ends up
+owned by the opponent in most playouts is dead, and is scored as captured.
+"""
+from __future__ import annotations
+import random
+from collections import namedtuple
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .agent.naive_batch import BatchRandomBot
+from .goboard import GameState
+from .goboard_batch import BLACK, WHITE, BatchGameState, area_owners
+from .gotypes import Player
+from .scoring import BLACK_STONES, BLACK_TERRITORY, WHITE_STONES, WHITE_TERRITORY, GameResult, territory_counts
+
+__all__ = [
+    "Ruleset",
+    "AREA",
+    "TERRITORY",
+    "CHINESE",
+    "JAPANESE",
+    "score_game",
+    "estimate_ownership",
+    "dead_stones",
+    "score_with_dead_stones",
+    "score_games",
+]
+
+AREA = "area"
+TERRITORY = "territory"
+
+
+class Ruleset(namedtuple("Ruleset", "scoring komi handicap_compensation")):
+    """ `scoring` is AREA or TERRITORY; white gets `handicap_compensation` points per handicap stone. """
+
+
+CHINESE = Ruleset(AREA, 7.5, 1.0)
+JAPANESE = Ruleset(TERRITORY, 6.5, 0.0)
+
+
+def _stones_played(game_state: GameState) -> Tuple[int, int]:
+    played = {Player.BLACK: 0, Player.WHITE: 0}
+    state = game_state
+    while state.previous_state is not None:
+        assert state.last_move is not None
+        if state.last_move.is_play:
+            played[state.previous_state.next_player] += 1
+        state = state.previous_state
+    return played[Player.BLACK], played[Player.WHITE]
+
+
+def score_game(
+    game_state: GameState, ruleset: Ruleset = CHINESE, dead: Optional[np.ndarray] = None, handicap: int = 0
+) -> GameResult:
+    """ Score the position under `ruleset`, with the stones of the (num_rows, num_cols) mask `dead`
+    removed as captured. `handicap` black stones are expected to have been put on the board before the
+    first move. """
+    stones = game_state.board.as_array()
+    if dead is not None:
+        stones = np.where(dead, 0, stones)
+    counts = territory_counts(stones[None])[0]
+    if ruleset.scoring == AREA:
+        black = counts[BLACK_STONES] + counts[BLACK_TERRITORY]
+        white = counts[WHITE_STONES] + counts[WHITE_TERRITORY]
+    elif ruleset.scoring == TERRITORY:
+        black_played, white_played = _stones_played(game_state)
+        black = counts[BLACK_TERRITORY] + white_played - counts[WHITE_STONES]
+        white = counts[WHITE_TERRITORY] + black_played + handicap - counts[BLACK_STONES]
+    else:
+        raise ValueError("Unknown scoring %r" % ruleset.scoring)
+    return GameResult(int(black), int(white) + handicap * ruleset.handicap_compensation, komi=ruleset.komi)
+
+
+def estimate_ownership(
+    game_states: Sequence[GameState], num_playouts: int = 32, max_moves: Optional[int] = None, seed=None
+) -> np.ndarray:
+    """ (N, num_rows, num_cols) expected owner of every point of each position under area scoring,
+    from 1 for black to -1 for white.
+
+    `num_playouts` random games are played from every position, all of them together on one
+    BatchGameState, each for at most `max_moves` moves, by default twice the number of points. A batch
+    step costs little more for many games than for a few, so scoring the games of a self-play run
+    together is far cheaper than one at a time.
+
+    Without a `seed` the playouts are seeded from the `random` module, so a caller that seeds it, like
+    self-play does for every game, gets the same estimate every time.
+    """
+    batch = BatchGameState.from_game_states(game_states, num_playouts)
+    board = batch.board
+    bot = BatchRandomBot(seed if seed is not None else random.getrandbits(32))
+    if max_moves is None:
+        max_moves = 2 * board.num_rows * board.num_cols
+    for _ in range(max_moves):
+        if batch.is_over().all():
+            break
+        batch.play(bot.select_moves(batch))
+    owners = area_owners(board.cells, board.stride)[:, board.point_cells]
+    owners = owners.reshape(len(game_states), num_playouts, board.num_rows, board.num_cols)
+    return (owners == BLACK).mean(axis=1) - (owners == WHITE).mean(axis=1)
+
+
+def dead_stones(game_state: GameState, ownership: np.ndarray, threshold: float = 0.0) -> np.ndarray:
+    """ (num_rows, num_cols) mask of the stones of strings that the opponent owns by more than
+    `threshold` on average over the string, i.e. with the default, in more playouts than their owner. """
+    board = game_state.board
+    stones = board.as_array()
+    ids = board.string_array().ravel()
+    on_string = ids >= 0
+    size = np.bincount(ids[on_string], minlength=ids.size)
+    total = np.bincount(ids[on_string], weights=ownership.ravel()[on_string], minlength=ids.size)
+    mean = np.zeros(ids.size)
+    mean[on_string] = total[ids[on_string]] / size[ids[on_string]]
+    mean_grid = mean.reshape(stones.shape)
+    return ((stones == BLACK) & (mean_grid < -threshold)) | ((stones == WHITE) & (mean_grid > threshold))
+
+
+def score_with_dead_stones(game_state: GameState, ruleset: Ruleset = CHINESE) -> GameResult:
+    """ score_game with the dead stones estimated from random playouts. """
+    return score_games([game_state], ruleset)[0]
+
+
+def score_games(game_states: Sequence[GameState], ruleset: Ruleset = CHINESE, **kwargs) -> List[GameResult]:
+    """ score_game of every position with its dead stones, estimated for all positions in one batch.
+    `kwargs` go to estimate_ownership. """
+    ownership = estimate_ownership(game_states, **kwargs)
+    return [score_game(state, ruleset, dead_stones(state, own)) for state, own in zip(game_states, ownership)]
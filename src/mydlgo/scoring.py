@@ -1,11 +1,21 @@
 from __future__ import absolute_import
 from collections import namedtuple
-from typing import Dict, List, Set, Tuple, Union, Optional
+from typing import TYPE_CHECKING, Dict, List, Tuple, Union
 
 from .gotypes import Player, Point
 
+if TYPE_CHECKING:
+    import numpy as np
+
 # from .goboard import Board, GameState
 
+# Cells of the padded boards, as in goboard_batch.
+EMPTY = 0
+BLACK = 1
+WHITE = 2
+BORDER = 3
+VISITED = -1
+
 
 class Territory:
     def __init__(self, territory_map: Dict[Point, Union[Player, str]]):  # <1>
@@ -28,6 +38,25 @@ class Territory:
                 self.num_dame += 1
                 self.dame_points.append(point)
 
+    @classmethod
+    def from_counts(
+        cls,
+        num_black_stones: int,
+        num_white_stones: int,
+        num_black_territory: int,
+        num_white_territory: int,
+        num_dame: int,
+        dame_points: List[Point],
+    ) -> "Territory":
+        territory = cls({})
+        territory.num_black_stones = num_black_stones
+        territory.num_white_stones = num_white_stones
+        territory.num_black_territory = num_black_territory
+        territory.num_white_territory = num_white_territory
+        territory.num_dame = num_dame
+        territory.dame_points = dame_points
+        return territory
+
 
 # <1> A `territory_map` splits the board into stones, territory and neutral points (dame).
 # <2> Depending on the status of a point, we increment the respective counter.
@@ -60,76 +89,97 @@ trivially dead groups.
 
 # def evaluate_territory(board: Board) -> Territory:
 def evaluate_territory(board) -> Territory:
-    status: Dict[Point, Union[Player, str]] = {}
-    for r in range(1, board.num_rows + 1):
-        for c in range(1, board.num_cols + 1):
-            p = Point(row=r, col=c)
-            if p in status:  # <1>
-                continue
-            stone = board.get_player_at(p)
-            if stone is not None:  # <2>
-                status[p] = stone  # Add Player color as the holder of the point
-            else:
-                group, neighbors = _collect_region(p, board)
-                if len(neighbors) == 1:  # <3>
-                    neighbor_stone = neighbors.pop()
-                    fill_with = "territory_b" if neighbor_stone == Player.BLACK else "territory_w"
-                else:
-                    fill_with = "dame"  # <4>
-                for pos in group:
-                    status[pos] = fill_with
-    return Territory(status)
-
-
-# <1> Skip the point, if you already visited this as part of a different group.
-# <2> If the point is a stone, add it as status.
-# <3> If a point is completely surrounded by black or white stones, count it as territory.
-# <4> Otherwise the point has to be a neutral point, so we add it to dame.
+    num_cols = board.num_cols
+    stride = num_cols + 2
+    stones = board.stone_bytes()
+    cells = [BORDER] * (stride * (board.num_rows + 2))
+    for row in range(board.num_rows):
+        start = (row + 1) * stride + 1
+        cells[start : start + num_cols] = stones[row * num_cols : (row + 1) * num_cols]
+    counts = [0] * 5
+    counts[BLACK_STONES] = cells.count(BLACK)
+    counts[WHITE_STONES] = cells.count(WHITE)
+    dame_points: List[Point] = []
+    for start, color in enumerate(cells):
+        if color != EMPTY:
+            continue
+        region, borders = _collect_region(start, cells, stride)
+        if borders == BLACK:  # <1>
+            counts[BLACK_TERRITORY] += len(region)
+        elif borders == WHITE:
+            counts[WHITE_TERRITORY] += len(region)
+        else:  # <2>
+            counts[DAME] += len(region)
+            dame_points.extend(Point(i // stride, i % stride) for i in region)
+    return Territory.from_counts(
+        num_black_stones=counts[BLACK_STONES],
+        num_white_stones=counts[WHITE_STONES],
+        num_black_territory=counts[BLACK_TERRITORY],
+        num_white_territory=counts[WHITE_TERRITORY],
+        num_dame=counts[DAME],
+        dame_points=dame_points,
+    )
+
+
+# <1> If a region is completely surrounded by black or white stones, count it as territory.
+# <2> Otherwise its points are neutral points, so we add them to dame.
 # end::scoring_evaluate_territory[]
 
 
 """ _collect_region:
 
-Find the contiguous section of a board containing a point. Also
-identify all the boundary points.
+Find the empty region of the flat padded `cells` containing `start`, without recursion. Visited points
+are overwritten with VISITED, and the colors of the stones around the region are or-ed together, so
+the borders are BLACK, WHITE, or both (BLACK | WHITE) when the region is dame.
 """
 
 
-def _collect_region(
-    # start_pos: Point, board: Board, visited: Dict[Point, bool] = None
-    start_pos: Point,
-    board,
-    visited: Dict[Point, bool] = None,
-) -> Tuple[List[Point], Set[Optional[Player]]]:
-    if visited is None:
-        visited = {}
-    if start_pos in visited:
-        return [], set()
-
-    all_points = [start_pos]
-    all_borders = set()
-    visited[start_pos] = True
-    here = board.get_player_at(start_pos)
-    deltas = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-    for delta_r, delta_c in deltas:
-        next_p = Point(row=start_pos.row + delta_r, col=start_pos.col + delta_c)
-        if not board.is_on_grid(next_p):
-            continue
-        neighbor = board.get_player_at(next_p)
-        if neighbor == here:
-            points, borders = _collect_region(next_p, board, visited)
-            all_points += points
-            all_borders |= borders
-        else:
-            all_borders.add(neighbor)
-    return all_points, all_borders
+def _collect_region(start: int, cells: List[int], stride: int) -> Tuple[List[int], int]:
+    region = [start]
+    cells[start] = VISITED
+    borders = 0
+    for i in region:  # the list grows while it is walked, breadth first
+        for n in (i - stride, i + stride, i - 1, i + 1):
+            color = cells[n]
+            if color == EMPTY:
+                cells[n] = VISITED
+                region.append(n)
+            elif color == BLACK or color == WHITE:
+                borders |= color
+    return region, borders
 
 
-# def compute_game_result(game_state: GameState) -> GameResult:
-def compute_game_result(game_state) -> GameResult:
-    territory = evaluate_territory(game_state.board)
-    return GameResult(
+# Columns of territory_counts(), and of goboard_batch.territory_counts.
+BLACK_STONES, WHITE_STONES, BLACK_TERRITORY, WHITE_TERRITORY, DAME = range(5)
+
+
+def territory_counts(stones: "np.ndarray") -> "np.ndarray":
+    """ Vectorized evaluate_territory of an (N, num_rows, num_cols) stack of `Board.as_array()` stones.
+
+    Returns (N, 5) counts indexed by BLACK_STONES, WHITE_STONES, BLACK_TERRITORY, WHITE_TERRITORY and
+    DAME; the empty regions of every position are labelled together.
+    """
+    import numpy as np
+
+    from .goboard_batch import territory_counts as territory_counts_padded
+
+    n, num_rows, num_cols = stones.shape
+    cells = np.pad(stones, ((0, 0), (1, 1), (1, 1)), constant_values=BORDER).reshape(n, -1)
+    return territory_counts_padded(cells, num_cols + 2)
+
+
+def area_scores(board) -> Tuple[int, int]:
+    """ Stones plus territory of black and white, as evaluate_territory counts them. """
+    if getattr(board, "tracks_regions", False):  # counted while the game was played
+        return board.area_scores()
+    territory = evaluate_territory(board)
+    return (
         territory.num_black_territory + territory.num_black_stones,
         territory.num_white_territory + territory.num_white_stones,
-        komi=7.5,
     )
+
+
+# def compute_game_result(game_state: GameState) -> GameResult:
+def compute_game_result(game_state, komi: float = 7.5) -> GameResult:
+    black, white = area_scores(game_state.board)
+    return GameResult(black, white, komi=komi)
@@ -0,0 +1,179 @@
+"""
+Headless self-play.
+
+Games are played by a pool of worker processes without any rendering, and every finished game is
+written to disk, either in the binary format of `records` or as one line of text: board size, komi,
+result and the moves in GTP coordinates.
+
+    9 7.5 B+12.5 E5 C3 D7 ... pass pass
+
+Game `i` is always played with the random seed `seed + i`, whichever worker picks it up, so a run is
+reproducible for a given seed and the same file is produced with any number of workers.
+"""
+from __future__ import annotations
+import contextlib
+import multiprocessing
+import random
+import time
+from collections import namedtuple
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from . import goboard_fast
+from .agent.base import Agent
+from .goboard import GameState, Move
+from .gotypes import Player
+from .records import GameRecord, RecordWriter
+from .scoring import GameResult, compute_game_result
+from .utils import COLS, point_from_coordinate
+
+
+class SelfPlayStats(namedtuple("SelfPlayStats", "num_games num_moves seconds")):
+    @property
+    def games_per_second(self) -> float:
+        return self.num_games / self.seconds
+
+    @property
+    def moves_per_second(self) -> float:
+        return self.num_moves / self.seconds
+
+    def __str__(self):
+        return "%d games, %d moves in %.1fs: %.1f games/s, %.0f moves/s" % (
+            self.num_games,
+            self.num_moves,
+            self.seconds,
+            self.games_per_second,
+            self.moves_per_second,
+        )
+
+
+def format_move(move: Move) -> str:
+    if move.is_pass:
+        return "pass"
+    if move.is_resign:
+        return "resign"
+    assert move.point is not None
+    return "%s%d" % (COLS[move.point.col - 1], move.point.row)
+
+
+def parse_move(text: str) -> Move:
+    if text == "pass":
+        return Move.pass_turn()
+    if text == "resign":
+        return Move.resign()
+    return Move.play(point_from_coordinate(text))
+
+
+def format_record(record: GameRecord) -> str:
+    fields = [str(record.board_size), str(record.komi), record.result]
+    fields.extend(format_move(move) for move in record.moves)
+    return " ".join(fields)
+
+
+def parse_record(line: str) -> GameRecord:
+    fields = line.split()
+    moves = [parse_move(text) for text in fields[3:]]
+    return GameRecord(int(fields[0]), float(fields[1]), fields[2], moves)
+
+
+def read_records(path: str) -> Iterator[GameRecord]:
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield parse_record(line)
+
+
+def play_game(
+    black: Agent,
+    white: Agent,
+    board_size: int,
+    game_state_class=goboard_fast.GameState,
+    max_moves: Optional[int] = None,
+    score_fn: Callable[[GameState], GameResult] = compute_game_result,
+    komi: float = 7.5,
+) -> GameRecord:
+    """ Play one game to the end, or until `max_moves` moves have been played, and score it with
+    `score_fn`, e.g. `rules.score_with_dead_stones`.
+
+    A game that ends by resignation is not scored and is recorded with `komi`, which should be the
+    komi of `score_fn`.
+    """
+    agents = {Player.BLACK: black, Player.WHITE: white}
+    game: GameState = game_state_class.new_game(board_size)
+    moves: List[Move] = []
+    while not game.is_over() and (max_moves is None or len(moves) < max_moves):
+        move = agents[game.next_player].select_move(game)
+        moves.append(move)
+        game = game.apply_move(move)
+
+    if game.last_move is not None and game.last_move.is_resign:
+        return GameRecord(board_size, komi, "B+R" if game.next_player is Player.BLACK else "W+R", moves)
+    game_result = score_fn(game)
+    return GameRecord(board_size, game_result.komi, str(game_result), moves)
+
+
+_worker_args: Tuple = ()
+
+
+def _init_worker(*args):
+    global _worker_args
+    _worker_args = args
+
+
+def _play_seeded(game_index: int) -> GameRecord:
+    black, white, board_size, game_state_class, max_moves, seed, score_fn, komi = _worker_args
+    random.seed(seed + game_index)
+    return play_game(black, white, board_size, game_state_class, max_moves, score_fn, komi)
+
+
+def run_self_play(
+    black: Agent,
+    white: Agent,
+    num_games: int,
+    output_path: str,
+    board_size: int = 9,
+    num_workers: Optional[int] = None,
+    seed: int = 0,
+    game_state_class=goboard_fast.GameState,
+    max_moves: Optional[int] = None,
+    record_format: str = "text",
+    score_fn: Callable[[GameState], GameResult] = compute_game_result,
+    komi: float = 7.5,
+) -> SelfPlayStats:
+    """ Play `num_games` games and append their records to `output_path` as they finish.
+
+    The agents are sent to each worker once. `num_workers` defaults to the number of CPUs; with a single
+    worker the games are played in this process, which is easier to profile. `record_format` is "text"
+    or "binary". `score_fn` scores the final positions, and has to be picklable with several workers.
+    `komi` is recorded for games that end by resignation, as in play_game().
+    """
+    if num_workers is None:
+        num_workers = multiprocessing.cpu_count()
+    args = (black, white, board_size, game_state_class, max_moves, seed, score_fn, komi)
+
+    num_moves = 0
+    start = time.perf_counter()
+    with _open_writer(output_path, record_format) as write:
+        if num_workers == 1:
+            _init_worker(*args)
+            for record in map(_play_seeded, range(num_games)):
+                write(record)
+                num_moves += len(record.moves)
+        else:
+            with multiprocessing.Pool(num_workers, initializer=_init_worker, initargs=args) as pool:
+                # imap keeps the records in game order while still writing each one as soon as it can.
+                for record in pool.imap(_play_seeded, range(num_games)):
+                    write(record)
+                    num_moves += len(record.moves)
+    return SelfPlayStats(num_games, num_moves, time.perf_counter() - start)
+
+
+@contextlib.contextmanager
+def _open_writer(output_path: str, record_format: str):
+    if record_format == "binary":
+        with RecordWriter(output_path) as writer:
+            yield writer.write
+    elif record_format == "text":
+        with open(output_path, "a") as f:
+            yield lambda record: f.write(format_record(record) + "\n")
+    else:
+        raise ValueError("Unknown record format %r" % record_format)
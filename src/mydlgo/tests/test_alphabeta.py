@@ -0,0 +1,138 @@
+import random
+import time
+
+import pytest
+
+from mydlgo import goboard_fast
+from mydlgo.goboard import Move
+from mydlgo.agent import RandomBot
+from mydlgo.gotypes import Player, Point
+from mydlgo.minimax import (
+    MIN_SCORE,
+    AlphaBetaAgent,
+    DepthPrunedAgent,
+    NegamaxAgent,
+    SearchContext,
+    TranspositionTable,
+    alpha_beta_result,
+    negamax,
+    resume_search,
+)
+from mydlgo.minimax.negamax import INFINITY
+from mydlgo.minimax.transposition import EXACT, LOWER
+
+
+def stone_diff(game_state):
+    stones = {Player.BLACK: 0, Player.WHITE: 0}
+    for r in range(1, game_state.board.num_rows + 1):
+        for c in range(1, game_state.board.num_cols + 1):
+            color = game_state.board.get_player_at(Point(r, c))
+            if color is not None:
+                stones[color] += 1
+    return stones[game_state.next_player] - stones[game_state.next_player.other]
+
+
+def random_position(board_size, num_moves, seed):
+    random.seed(seed)
+    bot = RandomBot()
+    game = goboard_fast.GameState.new_game(board_size)
+    for _ in range(num_moves):
+        game = game.apply_move(bot.select_move(game))
+    return game
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_transposition_table_does_not_change_the_result(seed):
+    game = random_position(4, 6, seed)
+    expected = alpha_beta_result(game, 3, MIN_SCORE, MIN_SCORE, stone_diff)
+    tt = TranspositionTable(1 << 12)
+    assert alpha_beta_result(game, 3, MIN_SCORE, MIN_SCORE, stone_diff, tt) == expected
+    # A second search is answered from the table.
+    assert alpha_beta_result(game, 3, MIN_SCORE, MIN_SCORE, stone_diff, tt) == expected
+    stats = tt.stats()
+    assert stats.hits > 0 and stats.cutoffs > 0
+    assert stats.probes == stats.hits + stats.misses
+
+
+def test_replacement_prefers_deeper_entries():
+    tt = TranspositionTable(4)
+    assert tt.size == 4
+    tt.store(1, 3, EXACT, 10, None)
+    tt.store(5, 1, LOWER, 20, None)  # same slot, shallower
+    assert tt.probe(5) is None
+    assert tt.probe(1).value == 10
+    assert tt.stats().collisions == 1
+
+    tt.new_search()
+    tt.store(5, 1, LOWER, 20, None)  # the deep entry is from an older search now
+    assert tt.probe(5).value == 20
+    assert tt.stats().replacements == 1
+
+
+def test_iterative_deepening_respects_the_time_budget():
+    game = random_position(5, 6, 0)
+    before = game.board.zobrist_hash()
+    bot = AlphaBetaAgent(20, stone_diff, time_budget=0.2)
+    start = time.perf_counter()
+    move = bot.select_move(game)
+    assert time.perf_counter() - start < 1.0
+    assert game.is_valid_move(move)
+    assert bot.last_depth is not None and bot.last_depth < 20
+    # The search was interrupted deep in the tree, and the board was still unwound.
+    assert game.board.zobrist_hash() == before
+
+
+def test_move_ordering_puts_hash_move_and_killers_first():
+    context = SearchContext()
+    moves = [Move.play(Point(1, c)) for c in range(1, 5)] + [Move.pass_turn(), Move.resign()]
+    context.record_cutoff(moves[2], Player.BLACK, 3, 2)
+    context.record_cutoff(moves[1], Player.BLACK, 1, 2)
+    ordered = context.order_moves(moves, Player.BLACK, 3, hash_move=moves[3])
+    assert ordered[:3] == [moves[3], moves[2], moves[1]]
+    assert ordered[-2:] == [Move.pass_turn(), Move.resign()]
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("depth", [1, 2, 3])
+def test_negamax_matches_alpha_beta(seed, depth):
+    game = random_position(4, 5, seed)
+    expected = alpha_beta_result(game, depth, MIN_SCORE, MIN_SCORE, stone_diff)
+    assert negamax(game, depth, -INFINITY, INFINITY, stone_diff) == expected
+    assert negamax(game, depth, -INFINITY, INFINITY, stone_diff, TranspositionTable(), SearchContext()) == expected
+
+
+def test_negamax_agent_plays_a_best_move():
+    game = random_position(5, 6, 0)
+    bot = NegamaxAgent(3, stone_diff)
+    move = bot.select_move(game)
+    assert bot.last_depth == 3
+    assert bot.last_score == alpha_beta_result(game, 3, MIN_SCORE, MIN_SCORE, stone_diff)
+    child = game.push(move)
+    assert -alpha_beta_result(child, 2, MIN_SCORE, MIN_SCORE, stone_diff) == bot.last_score
+    child.pop()
+
+
+@pytest.mark.parametrize("agent_class", [AlphaBetaAgent, DepthPrunedAgent])
+def test_cache_is_reused_after_the_predicted_reply(agent_class):
+    bot = agent_class(3, stone_diff, seed=0)
+    game = goboard_fast.GameState.new_game(3)
+    game = game.apply_move(bot.select_move(game))
+    line = bot._principal_line
+    assert len(line) >= 3
+    game = game.apply_move(line[1])
+
+    assert resume_search(TranspositionTable(), game, line, 4) == line[2]
+    bot.tt.reset_stats()
+    bot.select_move(game)
+    assert bot.tt.stats().hits > 0
+
+
+def test_evict_drops_entries_older_than_the_given_ply():
+    tt = TranspositionTable(16)
+    tt.new_search(ply=2)
+    tt.store(1, 3, EXACT, 10, None)
+    tt.new_search(ply=6)
+    tt.store(2, 3, EXACT, 20, None)
+    assert tt.evict(4) == 1
+    assert tt.peek(1) is None
+    assert tt.peek(2).value == 20
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from mydlgo import goboard_fast
+from mydlgo.dataset import Dataset, DatasetWriter, game_positions
+from mydlgo.encoders import MultiPlaneEncoder, OnePlaneEncoder
+from mydlgo.selfplay import GameRecord
+from mydlgo.tests.test_goboard import random_game
+
+
+@pytest.fixture
+def games():
+    return [random_game(goboard_fast.GameState, 5, 200, seed=seed) for seed in range(3)]
+
+
+def test_positions_round_trip(tmp_path, games):
+    encoder = MultiPlaneEncoder(5)
+    with DatasetWriter(str(tmp_path), encoder, shard_size=16) as writer:
+        for game in games:
+            writer.add_game(game)
+
+    expected = [
+        (encoder.encode(state), encoder.encode_move(move), 1 if state.next_player == game.winner() else -1)
+        for game in games
+        for state, move in game_positions(game)
+    ]
+    dataset = Dataset(str(tmp_path))
+    assert len(dataset) == len(expected)
+    assert dataset.index["shards"][:-1] == [16] * (len(dataset.index["shards"]) - 1)
+    for i in (0, 15, 16, len(expected) - 1):
+        planes, move, outcome = dataset[i]
+        assert np.array_equal(planes, expected[i][0]) and (move, outcome) == expected[i][1:]
+
+    indices = np.array([len(expected) - 1, 3, 17, 3])
+    planes, moves, outcomes = dataset.batch(indices)
+    assert all(np.array_equal(planes[k], expected[i][0]) for k, i in enumerate(indices))
+    assert moves.tolist() == [expected[i][1] for i in indices]
+    assert outcomes.tolist() == [expected[i][2] for i in indices]
+    assert sum(len(batch[0]) for batch in dataset.batches(10)) == len(expected)
+
+
+def test_writers_append_shards(tmp_path, games):
+    encoder = OnePlaneEncoder(5)
+    with DatasetWriter(str(tmp_path), encoder) as writer:
+        writer.add_game(games[0])
+    moves = [move for _, move in game_positions(games[1])]
+    with DatasetWriter(str(tmp_path), encoder) as writer:
+        writer.add_record(GameRecord(5, 7.5, "W+R", moves))
+
+    dataset = Dataset(str(tmp_path))
+    assert dataset.index["shards"] == [len(game_positions(games[0])), len(moves)]
+    planes, _, outcomes = dataset.sample(8, np.random.default_rng(0))
+    assert planes.shape == (8, 1, 5, 5)
+    assert set(outcomes.tolist()) <= {-1, 1}
+    with pytest.raises(ValueError):
+        DatasetWriter(str(tmp_path), MultiPlaneEncoder(5))
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from mydlgo import goboard
+from mydlgo.encoders import HistoryEncoder, MultiPlaneEncoder, OnePlaneEncoder, encoder_names, get_encoder_by_name
+from mydlgo.gotypes import Point
+from mydlgo.tests.test_goboard import GAME_STATES, random_game
+
+
+def points(board):
+    return [Point(r, c) for r in range(1, board.num_rows + 1) for c in range(1, board.num_cols + 1)]
+
+
+def test_registry():
+    assert list(encoder_names()) == ["history", "multiplane", "oneplane"]
+    encoder = get_encoder_by_name("history", (5, 7), history=2)
+    assert isinstance(encoder, HistoryEncoder)
+    assert encoder.shape() == (5, 5, 7)
+    with pytest.raises(ValueError):
+        get_encoder_by_name("nope", 9)
+
+
+@pytest.mark.parametrize("game_state_class", GAME_STATES)
+def test_one_plane_is_from_the_player_to_move(game_state_class):
+    game = random_game(game_state_class, 7, 41, seed=4)
+    planes = OnePlaneEncoder(7).encode(game)
+    for point in points(game.board):
+        player = game.board.get_player_at(point)
+        expected = 0 if player is None else (1 if player == game.next_player else -1)
+        assert planes[0, point.row - 1, point.col - 1] == expected
+
+
+@pytest.mark.parametrize("game_state_class", GAME_STATES)
+def test_multi_plane_liberties(game_state_class):
+    game = random_game(game_state_class, 7, 50, seed=5)
+    planes = MultiPlaneEncoder(7).encode(game)
+    assert planes[9].all() == (game.next_player.value == 1)
+    for point in points(game.board):
+        string = game.board.get_go_string(point)
+        stone_planes = planes[:8, point.row - 1, point.col - 1]
+        if string is None:
+            assert not stone_planes.any()
+        else:
+            side = 0 if string.color == game.next_player else 4
+            assert np.flatnonzero(stone_planes).tolist() == [side + min(string.num_liberties, 4) - 1]
+
+
+@pytest.mark.parametrize("game_state_class", GAME_STATES)
+def test_multi_plane_marks_ko(game_state_class):
+    game = game_state_class.new_game(5)
+    for row, col in [(2, 1), (1, 3), (1, 2), (3, 3), (3, 2), (2, 4), (5, 5), (2, 2), (2, 3)]:
+        game = game.apply_move(goboard.Move.play(Point(row, col)))
+    ko = MultiPlaneEncoder(5).encode(game)[8]
+    assert np.argwhere(ko).tolist() == [[1, 1]]
+
+
+def test_history_follows_previous_states():
+    game = random_game(GAME_STATES[1], 5, 3, seed=6)
+    planes = HistoryEncoder(5, history=4).encode(game)
+    one_plane = OnePlaneEncoder(5)
+    state = game
+    for k in range(3):
+        stones = one_plane.encode(state)[0] * (1 if state.next_player == game.next_player else -1)
+        assert np.array_equal(planes[2 * k] - planes[2 * k + 1], stones)
+        state = state.previous_state
+    assert not planes[6:8].any()
+
+
+def test_encode_many_reuses_the_buffer():
+    encoder = MultiPlaneEncoder(5)
+    games = [random_game(GAME_STATES[1], 5, n, seed=n) for n in (3, 8, 13)]
+    out = encoder.encode_many(games)
+    assert out.shape == (3, 10, 5, 5) and out.dtype == np.float32
+    again = encoder.encode_many(games[:2], out)
+    assert np.shares_memory(again, out) and len(again) == 2
+    assert all(np.array_equal(encoder.encode(game), planes) for game, planes in zip(games, out))
+
+
+def test_move_indices():
+    encoder = OnePlaneEncoder((3, 4))
+    moves = [goboard.Move.play(Point(r, c)) for r in range(1, 4) for c in range(1, 5)] + [goboard.Move.pass_turn()]
+    indices = encoder.encode_moves(moves)
+    assert indices.tolist() == list(range(encoder.num_moves()))
+    assert [encoder.decode_move_index(i) for i in indices] == moves
+    with pytest.raises(ValueError):
+        encoder.encode_move(goboard.Move.resign())
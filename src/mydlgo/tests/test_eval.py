@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from mydlgo import goboard_fast
+from mydlgo.eval import (
+    EvaluationQueue,
+    Evaluator,
+    FunctionEvaluator,
+    Influence,
+    LibertyWeighted,
+    StoneDifference,
+    TerritoryEstimate,
+    liberty_counts,
+    stone_difference,
+)
+from mydlgo.gotypes import Point
+from mydlgo.minimax import negamax
+from mydlgo.minimax.negamax import INFINITY
+from mydlgo.tests.test_alphabeta import random_position, stone_diff
+from mydlgo.tests.test_goboard import GAME_STATES, random_game
+
+
+class StoneDiffEvaluator(Evaluator):
+    """ Counts batches, to check the search hands over whole batches. """
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def evaluate_prepared(self, items):
+        self.batch_sizes.append(len(items))
+        return np.array([stone_diff(game_state) for game_state in items], dtype=np.float64)
+
+
+def test_queue_evaluates_in_batches():
+    evaluator = StoneDiffEvaluator()
+    queue = EvaluationQueue(evaluator, batch_size=3)
+    games = [random_position(5, n, seed=n) for n in range(1, 6)]
+    pending = [queue.put(game) for game in games]
+    assert evaluator.batch_sizes == [3]
+    assert [p.done for p in pending] == [True, True, True, False, False]
+    assert pending[4].value == stone_diff(games[4])
+    assert evaluator.batch_sizes == [3, 2]
+    assert [p.value for p in pending] == [stone_diff(game) for game in games]
+
+
+def test_queue_flushes_after_timeout():
+    evaluator = StoneDiffEvaluator()
+    queue = EvaluationQueue(evaluator, batch_size=100, timeout=0.0)
+    pending = queue.put(random_position(5, 3, seed=0))
+    assert pending.done
+    assert evaluator.batch_sizes == [1]
+
+
+def test_batched_frontier_gives_the_same_score():
+    game = random_position(4, 5, seed=1)
+    evaluator = StoneDiffEvaluator()
+    for depth in (1, 2, 3):
+        expected = negamax(game, depth, -INFINITY, INFINITY, stone_diff)
+        assert negamax(game, depth, -INFINITY, INFINITY, evaluator) == expected
+        assert negamax(game, depth, -INFINITY, INFINITY, FunctionEvaluator(stone_diff)) == expected
+    assert max(evaluator.batch_sizes) > 1
+
+
+@pytest.mark.parametrize("game_state_class", GAME_STATES)
+def test_board_arrays_match_get_player_at(game_state_class):
+    game = random_game(game_state_class, 7, 60, seed=3)
+    stones = game.board.as_array()
+    assert stones.shape == (7, 7) and stones.dtype == np.int8
+    for r in range(1, 8):
+        for c in range(1, 8):
+            player = game.board.get_player_at(Point(r, c))
+            assert stones[r - 1, c - 1] == (0 if player is None else player.value)
+
+
+def test_liberty_counts_match_go_strings():
+    games = [random_game(goboard_fast.GameState, 7, n, seed=n) for n in (20, 40, 60)]
+    libs = liberty_counts(np.stack([game.board.as_array() for game in games]))
+    for game, counts in zip(games, libs):
+        for r in range(1, 8):
+            for c in range(1, 8):
+                string = game.board.get_go_string(Point(r, c))
+                assert counts[r - 1, c - 1] == (string.num_liberties if string is not None else 0)
+
+
+@pytest.mark.parametrize("evaluator", [StoneDifference(), LibertyWeighted(), Influence(), TerritoryEstimate()])
+def test_batch_and_single_evaluation_agree(evaluator):
+    games = [random_game(goboard_fast.GameState, 7, n, seed=n) for n in (11, 30, 45)]
+    assert list(evaluator.evaluate_batch(games)) == [evaluator(game) for game in games]
+
+
+def test_stone_difference_is_from_the_player_to_move():
+    games = [random_game(goboard_fast.GameState, 7, n, seed=n) for n in (11, 30)]
+    assert [stone_difference(game) for game in games] == [stone_diff(game) for game in games]
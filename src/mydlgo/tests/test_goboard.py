@@ -0,0 +1,292 @@
+import copy
+import random
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from mydlgo import goboard, goboard_bit, goboard_fast, goboard_slow
+from mydlgo.agent import RandomBot
+from mydlgo.gotypes import Player, Point
+
+
+GAME_STATES = [goboard.GameState, goboard_fast.GameState, goboard_bit.GameState]
+
+
+def board_snapshot(board):
+    points = [Point(r, c) for r in range(1, board.num_rows + 1) for c in range(1, board.num_cols + 1)]
+    return board.zobrist_hash(), [board.get_player_at(p) for p in points], [board.get_go_string(p) for p in points]
+
+
+def random_game(game_state_class, board_size, num_moves, seed):
+    random.seed(seed)
+    bot = RandomBot()
+    game = game_state_class.new_game(board_size)
+    for _ in range(num_moves):
+        if game.is_over():
+            break
+        game = game.apply_move(bot.select_move(game))
+    return game
+
+
+@pytest.mark.parametrize("game_state_class", GAME_STATES)
+def test_push_matches_apply_move(game_state_class):
+    game = random_game(game_state_class, 5, 12, seed=0)
+    for move in game.legal_moves():
+        expected = game.apply_move(move)
+        pushed = game.push(move)
+        assert board_snapshot(pushed.board) == board_snapshot(expected.board)
+        assert pushed.next_player == expected.next_player
+        assert pushed.previous_states == expected.previous_states
+        assert pushed.pop() is game
+
+
+@pytest.mark.parametrize("game_state_class", GAME_STATES)
+def test_pop_restores_captures(game_state_class):
+    game = random_game(game_state_class, 5, 30, seed=1)
+    before = board_snapshot(game.board)
+    state = game
+    pushed = 0
+    while not state.is_over() and pushed < 40:
+        state = state.push(RandomBot().select_move(state))
+        pushed += 1
+    for _ in range(pushed):
+        state = state.pop()
+    assert state is game
+    assert board_snapshot(game.board) == before
+
+
+@pytest.mark.parametrize("game_state_class", GAME_STATES)
+def test_copies_do_not_share_undo_history(game_state_class):
+    game = game_state_class.new_game(5)
+    child = game.push(goboard.Move.play(Point(3, 3)))
+    grandchild = child.apply_move(goboard.Move.play(Point(3, 4)))
+    assert child.pop() is game
+    assert game.board.get_player_at(Point(3, 3)) is None
+    assert grandchild.board.get_player_at(Point(3, 3)) is not None
+    assert grandchild.board.get_player_at(Point(3, 4)) is not None
+
+
+def reference_legality(game, point):
+    """ Self-capture and ko decided the old way, by placing the stone on a copy of the board. """
+    next_board = copy.deepcopy(game.board)
+    next_board.place_stone(game.next_player, point)
+    new_string = next_board.get_go_string(point)
+    self_capture = new_string is not None and new_string.is_captured()
+    ko = (game.next_player.other, next_board.zobrist_hash()) in game.previous_states
+    return self_capture, ko, next_board.zobrist_hash()
+
+
+@pytest.mark.parametrize("game_state_class", GAME_STATES)
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_legality_without_board_copies(game_state_class, seed):
+    game = random_game(game_state_class, 5, 40, seed=seed)
+    for r in range(1, 6):
+        for c in range(1, 6):
+            point = Point(r, c)
+            if game.board.get_player_at(point) is not None:
+                continue
+            move = goboard.Move.play(point)
+            self_capture, ko, next_hash = reference_legality(game, point)
+            assert game.is_move_self_capture(game.next_player, move) == self_capture
+            assert game.does_move_violate_ko(game.next_player, move) == ko
+            assert game.board.hash_after(game.next_player, point) == next_hash
+
+
+@pytest.mark.parametrize("game_state_class", GAME_STATES)
+def test_ko_is_detected(game_state_class):
+    game = game_state_class.new_game(5)
+    moves = [(2, 1), (1, 3), (1, 2), (3, 3), (3, 2), (2, 4), (5, 5), (2, 2), (2, 3)]
+    for row, col in moves:
+        game = game.apply_move(goboard.Move.play(Point(row, col)))
+    # Black has just captured at B2, so white may not retake it immediately.
+    assert game.board.get_player_at(Point(2, 2)) is None
+    assert not game.is_valid_move(goboard.Move.play(Point(2, 2)))
+    assert game.is_valid_move(goboard.Move.play(Point(4, 4)))
+
+
+def reference_legal_moves(game):
+    moves = []
+    for r in range(1, game.board.num_rows + 1):
+        for c in range(1, game.board.num_cols + 1):
+            move = goboard.Move.play(Point(r, c))
+            if game.is_valid_move(move):
+                moves.append(move.point)
+    return moves
+
+
+@pytest.mark.parametrize("game_state_class", GAME_STATES)
+@pytest.mark.parametrize("seed", [0, 1])
+def test_legal_moves_are_maintained_incrementally(game_state_class, seed):
+    random.seed(seed)
+    bot = RandomBot()
+    game = game_state_class.new_game(5)
+    while not game.is_over():
+        legal_points = [move.point for move in game.legal_moves() if move.is_play]
+        assert legal_points == reference_legal_moves(game)
+        move = bot.select_move(game)
+        pushed = game.push(move)
+        assert [m.point for m in pushed.legal_moves() if m.is_play] == reference_legal_moves(pushed)
+        pushed.pop()
+        assert [m.point for m in game.legal_moves() if m.is_play] == legal_points
+        game = game.apply_move(move)
+
+
+@pytest.mark.parametrize("game_state_class", GAME_STATES)
+def test_superko_without_a_capture(game_state_class):
+    game = game_state_class.new_game(5)
+    played = game.apply_move(goboard.Move.play(Point(3, 3)))
+    # An empty board again after black's stone, as a position set up by hand could be.
+    repeated = game_state_class(game_state_class.new_game(5).board, Player.BLACK, played, goboard.Move.pass_turn())
+    legal_points = [move.point for move in repeated.legal_moves() if move.is_play]
+    assert Point(3, 3) not in legal_points
+    assert legal_points == reference_legal_moves(repeated)
+
+
+@pytest.mark.parametrize("game_state_class", GAME_STATES)
+@pytest.mark.parametrize("seed", [0, 1])
+def test_capturing_points(game_state_class, seed):
+    game = random_game(game_state_class, 5, 40, seed=seed)
+    state = game
+    for _ in range(10):
+        if state.is_over():
+            break
+        for player in (Player.BLACK, Player.WHITE):
+            expected = []
+            for point in state.board.empty_points():
+                board = copy.deepcopy(state.board)
+                board.place_stone(player, point)
+                if board.num_stones(player.other) < state.board.num_stones(player.other):
+                    expected.append(point)
+            assert sorted(state.board.capturing_points(player)) == expected
+        state = state.push(RandomBot().select_move(state))
+
+
+def board_planes(board):
+    """ The stone, string id and liberty planes built point by point from get_go_string. """
+    stones, ids, libs = [], [], []
+    for r in range(1, board.num_rows + 1):
+        for c in range(1, board.num_cols + 1):
+            string = board.get_go_string(Point(r, c))
+            if string is None:
+                stones.append(0)
+                ids.append(-1)
+                libs.append(0)
+            else:
+                first = min(string.stones)
+                stones.append(string.color.value)
+                ids.append((first.row - 1) * board.num_cols + first.col - 1)
+                libs.append(string.num_liberties)
+    shape = (board.num_rows, board.num_cols)
+    return [np.array(plane).reshape(shape).tolist() for plane in (stones, ids, libs)]
+
+
+@pytest.mark.parametrize("game_state_class", GAME_STATES)
+@pytest.mark.parametrize("seed", [2, 3])
+def test_array_planes_follow_push_and_pop(game_state_class, seed):
+    game = random_game(game_state_class, 6, 30, seed=seed)
+    board = game.board
+    stones, ids, libs = board.as_array(), board.string_array(), board.liberty_array()
+    assert not stones.flags.writeable
+    state = game
+    for _ in range(25):
+        if state.is_over():
+            break
+        state = state.push(RandomBot().select_move(state))
+        assert board.as_array() is stones
+        if game_state_class is goboard_fast.GameState:  # the others label the planes per position
+            assert board.string_array() is ids and board.liberty_array() is libs
+        planes = [stones.tolist(), board.string_array().tolist(), board.liberty_array().tolist()]
+        assert planes == board_planes(board)
+    while state is not game:
+        state = state.pop()
+    assert board.as_array() is stones  # goboard_bit fills the array again here, the others kept it up to date
+    assert [stones.tolist(), board.string_array().tolist(), board.liberty_array().tolist()] == board_planes(board)
+    assert copy.deepcopy(board).as_array().tolist() == stones.tolist()
+
+
+@pytest.mark.parametrize("game_state_class", GAME_STATES)
+def test_planes_first_read_during_a_search(game_state_class):
+    game = random_game(game_state_class, 6, 30, seed=4)
+    state = game
+    for _ in range(10):
+        state = state.push(RandomBot().select_move(state))
+    state.board.string_array()
+    while state is not game:
+        state = state.pop()
+    board = game.board
+    assert [board.as_array().tolist(), board.string_array().tolist(), board.liberty_array().tolist()] == board_planes(
+        board
+    )
+
+
+@pytest.mark.parametrize("game_state_class", GAME_STATES)
+def test_stone_counts_follow_push_and_pop(game_state_class):
+    game = random_game(game_state_class, 5, 60, seed=7)
+
+    def counts(board):
+        stones = board.as_array()
+        return [board.num_stones(Player.BLACK), board.num_stones(Player.WHITE)], [
+            int((stones == 1).sum()),
+            int((stones == 2).sum()),
+        ]
+
+    state = game
+    for _ in range(30):
+        if state.is_over():
+            break
+        state = state.push(RandomBot().select_move(state))
+        tracked, expected = counts(state.board)
+        assert tracked == expected
+    while state is not game:
+        state = state.pop()
+    tracked, expected = counts(game.board)
+    assert tracked == expected
+
+
+@pytest.mark.parametrize("num_rows, num_cols", [(21, 21), (25, 25), (7, 11), (11, 7)])
+def test_large_and_rectangular_boards_agree(num_rows, num_cols):
+    random.seed(num_rows * num_cols)
+    modules = [goboard, goboard_fast, goboard_bit]
+    games = [module.GameState(module.Board(num_rows, num_cols), Player.BLACK, None, None) for module in modules]
+    bot = RandomBot()
+    for _ in range(150):
+        move = bot.select_move(games[0])
+        games = [game.apply_move(move) for game in games]
+        assert len({game.board.zobrist_hash() for game in games}) == 1
+        assert all(game.board.as_array().tolist() == games[0].board.as_array().tolist() for game in games)
+        assert all(game.board.stone_bytes() == games[0].board.as_array().tobytes() for game in games)
+        for plane in ("string_array", "liberty_array"):
+            expected = getattr(games[0].board, plane)().tolist()
+            assert all(getattr(game.board, plane)().tolist() == expected for game in games)
+
+
+def test_random_bot_plays_on_goboard_slow():
+    random.seed(3)
+    bot = RandomBot()
+    slow = goboard_slow.GameState.new_game(5)
+    game = goboard.GameState.new_game(5)
+    for _ in range(20):
+        assert sorted(str(m.point) for m in slow.legal_moves()) == sorted(str(m.point) for m in game.legal_moves())
+        move = bot.select_move(slow)
+        assert slow.is_valid_move(move)
+        slow = slow.apply_move(move)
+        game = game.apply_move(goboard.Move(move.point, move.is_pass, move.is_resign))
+
+
+def test_playing_and_scoring_do_not_import_numpy():
+    script = """
+import random, sys
+sys.modules["numpy"] = None
+from mydlgo import goboard, goboard_slow, scoring, utils
+from mydlgo.agent import RandomBot
+random.seed(1)
+for module in (goboard, goboard_slow):
+    game = module.GameState.new_game(5)
+    while not game.is_over():
+        game = game.apply_move(RandomBot().select_move(game))
+    scoring.compute_game_result(game)
+    utils.print_board(game.board)
+"""
+    subprocess.run([sys.executable, "-c", script], check=True, stdout=subprocess.DEVNULL)
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from mydlgo import goboard
+from mydlgo.agent import BatchRandomBot
+from mydlgo.goboard_batch import BLACK, PASS, WHITE, BatchGameState, label_components
+from mydlgo.gotypes import Player, Point
+from mydlgo.scoring import compute_game_result
+from mydlgo.tests.test_goboard import random_game
+
+
+def to_player(color):
+    return Player.BLACK if color == BLACK else Player.WHITE
+
+
+def test_label_components_follows_snakes():
+    group = np.array(
+        [
+            [1, 1, 1, 1, 0],
+            [0, 0, 0, 1, 0],
+            [1, 1, 0, 1, 2],
+            [1, 0, 0, 1, 2],
+            [1, 1, 1, 1, 0],
+        ],
+        dtype=np.int8,
+    ).reshape(1, -1)
+    labels = label_components(group, 5).reshape(5, 5)
+    assert len(set(labels[group.reshape(5, 5) == 1].tolist())) == 1
+    assert labels[2, 4] == labels[3, 4] != labels[0, 0]
+    assert labels[0, 4] == -1
+
+
+def test_simple_ko_is_forbidden():
+    state = BatchGameState.new_game(1, 5)
+    moves = [(2, 1), (1, 3), (1, 2), (3, 3), (3, 2), (2, 4), (5, 5), (2, 2), (2, 3)]
+    for row, col in moves:
+        state.play(np.array([state.board.point_index(Point(row, col))]))
+    ko = state.board.point_index(Point(2, 2))
+    assert state.board.grid()[0, 1, 1] == 0
+    assert not state.legal_moves_mask()[0, ko]
+    for row, col in [(4, 4), (5, 1)]:
+        state.play(np.array([state.board.point_index(Point(row, col))]))
+    assert state.legal_moves_mask()[0, ko]
+
+
+@pytest.mark.parametrize("board_size", [5, 9])
+def test_matches_goboard_in_random_games(board_size):
+    num_games = 8
+    state = BatchGameState.new_game(num_games, board_size)
+    games = [goboard.GameState.new_game(board_size) for _ in range(num_games)]
+    bot = BatchRandomBot(seed=board_size)
+    while not state.is_over().all():
+        legal = state.legal_moves_mask()
+        for i, game in enumerate(games):
+            if state.is_over()[i]:
+                continue
+            playable = {state.board.point_index(p) for p in game.board.playable_points(game.next_player)}
+            assert set(np.flatnonzero(legal[i])) <= playable
+        moves = bot.select_moves(state)
+        for i in range(num_games):
+            if state.is_over()[i]:
+                continue
+            move = goboard.Move.pass_turn() if moves[i] == PASS else goboard.Move.play(state.board.point(moves[i]))
+            games[i] = games[i].apply_move(move)
+        state.play(moves)
+        for i, game in enumerate(games):
+            assert int(state.board.hashes[i]) == game.board.zobrist_hash()
+            assert state.next_color[i] == (BLACK if game.next_player == Player.BLACK else WHITE)
+
+    winners = state.winners()
+    black, white = state.board.area_scores()
+    for i, game in enumerate(games):
+        result = compute_game_result(game)
+        assert (black[i], white[i]) == (result.b, result.w)
+        assert to_player(winners[i]) == game.winner()
+
+
+@pytest.mark.parametrize("num_moves", [0, 30, 120])
+def test_from_game_states_copies_positions(num_moves):
+    games = [random_game(goboard.GameState, 7, num_moves + i, seed=i) for i in range(3)]
+    state = BatchGameState.from_game_states(games, num_copies=2)
+    assert state.num_games == 6
+    for i, game in enumerate(games):
+        for j in (2 * i, 2 * i + 1):
+            assert np.array_equal(state.board.grid()[j], game.board.as_array())
+            assert int(state.board.hashes[j]) == game.board.zobrist_hash()
+            assert to_player(state.next_color[j]) == game.next_player
+    # The copies have their strings labelled and can be played on to the end.
+    bot = BatchRandomBot(seed=num_moves)
+    while not state.is_over().all():
+        state.play(bot.select_moves(state))
@@ -0,0 +1,44 @@
+import copy
+import random
+
+from mydlgo import goboard, goboard_bit
+from mydlgo.agent import RandomBot
+from mydlgo.gotypes import Player, Point
+
+
+def test_stones_do_not_wrap_around_edges():
+    board = goboard_bit.Board(9, 9)
+    board.place_stone(Player.WHITE, Point(1, 9))
+    board.place_stone(Player.BLACK, Point(2, 1))
+    board.place_stone(Player.BLACK, Point(1, 8))
+    assert board.get_player_at(Point(1, 9)) == Player.WHITE
+    board.place_stone(Player.BLACK, Point(2, 9))
+    assert board.get_player_at(Point(1, 9)) is None
+    assert board.get_go_string(Point(2, 1)).num_liberties == 3
+
+
+def test_copy_and_equality():
+    board = goboard_bit.Board(9, 9)
+    board.place_stone(Player.BLACK, Point(3, 3))
+    copied = copy.deepcopy(board)
+    assert copied == board
+    assert copied.zobrist_hash() == board.zobrist_hash()
+    copied.place_stone(Player.WHITE, Point(3, 4))
+    assert copied != board
+    assert board.get_player_at(Point(3, 4)) is None
+
+
+def test_matches_goboard_in_random_games():
+    random.seed(3)
+    bot = RandomBot()
+    game = goboard.GameState.new_game(9)
+    board = goboard_bit.Board(9, 9)
+    while not game.is_over():
+        move = bot.select_move(game)
+        if move.is_play:
+            board.place_stone(game.next_player, move.point)
+        game = game.apply_move(move)
+        assert board.zobrist_hash() == game.board.zobrist_hash()
+    for r in range(1, 10):
+        for c in range(1, 10):
+            assert board.get_go_string(Point(r, c)) == game.board.get_go_string(Point(r, c))
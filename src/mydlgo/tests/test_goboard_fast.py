@@ -0,0 +1,134 @@
+import copy
+import random
+
+import pytest
+
+from mydlgo import goboard, goboard_fast
+from mydlgo.agent import RandomBot
+from mydlgo.gotypes import Player, Point
+from mydlgo.scoring import compute_game_result, evaluate_territory
+
+
+def assert_same_board(expected, actual):
+    assert expected.zobrist_hash() == actual.zobrist_hash()
+    for r in range(1, expected.num_rows + 1):
+        for c in range(1, expected.num_cols + 1):
+            p = Point(r, c)
+            assert expected.get_player_at(p) == actual.get_player_at(p)
+            assert expected.get_go_string(p) == actual.get_go_string(p)
+
+
+def test_capture_restores_liberties():
+    board = goboard_fast.Board(5, 5)
+    board.place_stone(Player.BLACK, Point(1, 1))
+    board.place_stone(Player.WHITE, Point(1, 2))
+    assert board.num_liberties(Point(1, 1)) == 1
+    board.place_stone(Player.WHITE, Point(2, 1))
+    assert board.get_player_at(Point(1, 1)) is None
+    assert board.num_liberties(Point(1, 2)) == 3
+    assert board.num_liberties(Point(2, 1)) == 3
+
+
+def test_merge_counts_shared_liberties_once():
+    board = goboard_fast.Board(5, 5)
+    board.place_stone(Player.BLACK, Point(3, 2))
+    board.place_stone(Player.BLACK, Point(3, 4))
+    board.place_stone(Player.BLACK, Point(3, 3))
+    string = board.get_go_string(Point(3, 3))
+    assert string is not None
+    assert len(string.stones) == 3
+    assert board.num_liberties(Point(3, 2)) == string.num_liberties == 8
+
+
+def test_deepcopy_is_independent():
+    board = goboard_fast.Board(9, 9)
+    board.place_stone(Player.BLACK, Point(5, 5))
+    copied = copy.deepcopy(board)
+    copied.place_stone(Player.WHITE, Point(5, 6))
+    assert board.get_player_at(Point(5, 6)) is None
+    assert board.num_liberties(Point(5, 5)) == 4
+    assert copied.num_liberties(Point(5, 5)) == 3
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_matches_goboard_in_random_games(seed):
+    random.seed(seed)
+    bot = RandomBot()
+    game = goboard.GameState.new_game(7)
+    board = goboard_fast.Board(7, 7)
+    while not game.is_over():
+        move = bot.select_move(game)
+        if move.is_play:
+            board.place_stone(game.next_player, move.point)
+        game = game.apply_move(move)
+        assert_same_board(game.board, board)
+
+
+def test_game_state_uses_fast_board():
+    game = goboard_fast.GameState.new_game(9)
+    game = game.apply_move(goboard_fast.Move.play(Point(3, 3)))
+    assert isinstance(game, goboard_fast.GameState)
+    assert isinstance(game.board, goboard_fast.Board)
+    assert game.board.get_player_at(Point(3, 3)) == Player.BLACK
+
+
+def rescanned_area_scores(board):
+    territory = evaluate_territory(board)
+    return (
+        territory.num_black_stones + territory.num_black_territory,
+        territory.num_white_stones + territory.num_white_territory,
+    )
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_tracked_area_scores_match_a_rescan(seed):
+    # Any legal move, eye filling included, so that regions split and large strings get captured.
+    rng = random.Random(seed)
+    game = goboard_fast.GameState.new_game(6)
+    game.board.track_regions()
+    for _ in range(150):
+        plays = [move for move in game.legal_moves() if move.is_play]
+        if not plays:
+            break
+        child = game.push(rng.choice(plays))
+        assert child.board.area_scores() == rescanned_area_scores(child.board)
+        child.pop()
+        game = game.apply_move(rng.choice(plays))
+        board = game.board
+        assert board.area_scores() == rescanned_area_scores(board)
+        assert board.num_stones(Player.BLACK) + board.num_stones(Player.WHITE) == 36 - len(board.empty_points())
+    assert compute_game_result(game).b == game.board.area_scores()[0]
+
+
+def board_arrays(board):
+    regions = board._regions
+    planes = [plane.tolist() for plane in board._planes]
+    return (
+        [board._color, board._head, board._next, board._size, board._libs, board._first, board.as_array().tolist()],
+        [board.zobrist_hash(), board._counts, board.empty_points(), planes],
+        [(board.playable_points(p), sorted(board.capturing_points(p))) for p in (Player.BLACK, Player.WHITE)],
+        [regions.region, regions.size, regions.edges, regions.territory],
+    )
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_rollback_restores_every_array(seed):
+    rng = random.Random(seed)
+    game = goboard_fast.GameState.new_game(6)
+    game.board.track_regions()
+    game.board.string_array()
+    for _ in range(80):
+        plays = [move for move in game.legal_moves() if move.is_play]
+        if not plays:
+            break
+        before = board_arrays(copy.deepcopy(game.board))
+        state = game
+        for _ in range(rng.randrange(1, 6)):
+            replies = [move for move in state.legal_moves() if move.is_play]
+            if not replies:
+                break
+            state = state.push(rng.choice(replies))
+        while state is not game:
+            state = state.pop()
+        assert board_arrays(game.board) == before
+        game = game.push(rng.choice(plays))  # searches nest checkpoints
@@ -11,12 +11,12 @@ def P():
     return P
 
 
-@pytest.mark.parametrize("size", [9, 13, 19])
+@pytest.mark.parametrize("size", [9, 13, 19, 21, 25])
 def test_boardsize_with_valid_size(size):
     assert Command.boardsize(size).to_string() == f"{CommandType.BOARDSIZE.value} {size}"
 
 
-@pytest.mark.parametrize("size", [0, 20])
+@pytest.mark.parametrize("size", [0, 26])
 def test_boardsize_with_invalid_size(size):
     with pytest.raises(ValueError):
         Command.boardsize(size)
@@ -58,6 +58,11 @@ def test_point_can_be_converted_to_vertex(P, point):
     assert isinstance(v, Vertex)
 
 
+@pytest.mark.parametrize("point, vertex", [((1, 1), "A1"), ((19, 8), "H19"), ((21, 9), "J21"), ((25, 25), "Z25")])
+def test_vertex_skips_i(P, point, vertex):
+    assert str(Vertex.from_point(P(row=point[0], col=point[1]))) == vertex
+
+
 @pytest.mark.parametrize("player, point", [(Color.BLACK, (1, 1)), (1, (4, 16)), ("Black", (19, 19))])
 def test_play_legal_move_black(P, player, point):
     p = P(row=point[0], col=point[1])
@@ -0,0 +1,95 @@
+import random
+import time
+
+import pytest
+
+from mydlgo import goboard_fast
+from mydlgo.goboard import Move
+from mydlgo.gotypes import Player, Point
+from mydlgo.mcts import FlatMCAgent, MCTSAgent, flat, random_playout
+
+
+def position(moves):
+    game = goboard_fast.GameState.new_game(5)
+    for row, col in moves:
+        game = game.apply_move(Move.play(Point(row, col)))
+    return game
+
+
+def test_random_playout_leaves_the_game_untouched():
+    game = position([(3, 3), (2, 2)])
+    before = game.board.zobrist_hash()
+    random.seed(0)
+    assert random_playout(game) in (Player.BLACK, Player.WHITE)
+    assert game.board.zobrist_hash() == before
+
+
+def test_mcts_reports_playouts():
+    game = position([(3, 3), (2, 2)])
+    bot = MCTSAgent(50, seed=3)
+    assert game.is_valid_move(bot.select_move(game))
+    assert bot.last_playouts == 50
+    assert bot.last_playouts_per_second > 0
+
+
+def test_mcts_stops_at_the_time_budget():
+    game = position([(3, 3)])
+    bot = MCTSAgent(time_budget=0.2, seed=3)
+    start = time.perf_counter()
+    bot.select_move(game)
+    assert time.perf_counter() - start < 0.5
+    assert bot.last_playouts > 0
+
+
+def test_mcts_is_deterministic_when_seeded():
+    game = position([(3, 3)])
+    moves = [MCTSAgent(100, temperature=1.0, seed=5).select_move(game) for _ in range(2)]
+    assert moves[0] == moves[1]
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_flat_monte_carlo_is_deterministic_when_seeded(num_workers):
+    game = position([(3, 3), (2, 2)])
+    moves = []
+    for _ in range(2):
+        with FlatMCAgent(200, batch_size=4, num_workers=num_workers, seed=1) as bot:
+            moves.append(bot.select_move(game))
+        assert bot.last_playouts >= 200
+        assert sum(playouts for playouts, _ in bot.last_worker_stats.values()) == bot.last_playouts
+    assert moves[0] == moves[1]
+    assert game.is_valid_move(moves[0])
+
+
+@pytest.mark.parametrize("num_workers", [1, 2, 3, 8])
+@pytest.mark.parametrize("num_candidates", [1, 2, 5, 8, 26])
+def test_flat_monte_carlo_rounds_keep_every_worker_busy(num_workers, num_candidates):
+    bot = FlatMCAgent(num_workers=num_workers)
+    candidates = [Move.play(Point(1, col)) for col in range(1, num_candidates + 1)]
+    batches = bot._plan_round(candidates)
+    assert len(batches) % num_workers == 0
+    assert len(batches) < num_candidates + num_workers
+    counts = [sum(1 for move, _ in batches if move == candidate) for candidate in candidates]
+    assert min(counts) >= 1 and max(counts) - min(counts) <= 1
+    assert len(set(batches)) == len(batches)
+
+
+def test_flat_monte_carlo_prunes_bad_moves():
+    bot = FlatMCAgent(seed=0)
+    a, b = Move.play(Point(1, 1)), Move.play(Point(1, 2))
+    survivors = bot._prune([a, b], {a: 90, b: 10}, {a: 100, b: 100})
+    assert survivors == [a]
+    assert bot._prune([a, b], {a: 6, b: 4}, {a: 10, b: 10}) == [a, b]
+
+
+def test_flat_monte_carlo_seeds_root_moves_apart(monkeypatch):
+    draws = []
+
+    def fake_playout(game_state, rng):
+        draws.append(rng.random())
+        return Player.BLACK
+
+    monkeypatch.setattr(flat, "random_playout", fake_playout)
+    game = goboard_fast.GameState.new_game(5)
+    FlatMCAgent(20, batch_size=1, seed=3).select_move(game)
+    first_round = draws[: len(game.legal_moves()) - 1]
+    assert len(set(first_round)) == len(first_round)
@@ -0,0 +1,69 @@
+import pickle
+
+import pytest
+
+from mydlgo import goboard_fast
+from mydlgo.goboard import Move
+from mydlgo.gotypes import Player, Point
+from mydlgo.minimax import MIN_SCORE, AlphaBetaAgent, DepthPrunedAgent, RootSplitter, alpha_beta_result, detached
+from mydlgo.tests.test_alphabeta import random_position, stone_diff
+
+
+def set_up_position():
+    """ A position that no sequence of moves from an empty board leads to: white to play against
+    three black handicap stones. """
+    board = goboard_fast.Board(4, 4)
+    for point in [Point(1, 1), Point(2, 3), Point(4, 4)]:
+        board.place_stone(Player.BLACK, point)
+    return goboard_fast.GameState(board, Player.WHITE, None, None)
+
+
+@pytest.mark.parametrize("game", [random_position(5, 8, 0), set_up_position()])
+def test_detached_state_plays_on_like_the_original(game):
+    state = pickle.loads(pickle.dumps(detached(game)))
+    assert state.board is not game.board
+    assert state.board.zobrist_hash() == game.board.zobrist_hash()
+    assert state.previous_states == game.previous_states
+    assert state.legal_moves() == game.legal_moves()
+    for move in [Move.pass_turn(), state.legal_moves()[0]]:
+        next_state, next_game = state.push(move), game.push(move)
+        assert next_state.is_over() == next_game.is_over()
+        assert next_state.board.zobrist_hash() == next_game.board.zobrist_hash()
+        assert next_state.pop() is state
+        next_game.pop()
+
+
+def score(next_state, depth):
+    return -alpha_beta_result(next_state, depth, MIN_SCORE, MIN_SCORE, stone_diff)
+
+
+@pytest.mark.parametrize("game", [random_position(4, 5, 1), random_position((3, 5), 5, 1), set_up_position()])
+def test_root_split_scores_match_sequential_search(game):
+    moves = game.legal_moves()
+    expected = []
+    for move in moves:
+        next_state = game.push(move)
+        expected.append(score(next_state, 1))
+        next_state.pop()
+    with RootSplitter(2) as splitter:
+        assert splitter.scores(game, moves, score, 1) == expected
+
+
+@pytest.mark.parametrize("agent_class", [AlphaBetaAgent, DepthPrunedAgent])
+def test_parallel_agents_are_deterministic_when_seeded(agent_class):
+    game = random_position(4, 5, 2)
+    choices = []
+    for _ in range(2):
+        with agent_class(1, stone_diff, num_workers=2, seed=7) as bot:
+            choices.append(bot.select_move(game))
+    assert choices[0] == choices[1]
+    assert game.is_valid_move(choices[0])
+
+
+@pytest.mark.parametrize("agent_class", [AlphaBetaAgent, DepthPrunedAgent])
+def test_parallel_agents_match_sequential_search_with_a_table(agent_class):
+    game = set_up_position()
+    with agent_class(2, stone_diff, seed=3) as bot:
+        expected = bot.select_move(game)
+    with agent_class(2, stone_diff, num_workers=2, seed=3) as bot:
+        assert bot.select_move(game) == expected
@@ -0,0 +1,53 @@
+import pytest
+
+from mydlgo import goboard
+from mydlgo.agent import RandomBot
+from mydlgo.gotypes import Point
+from mydlgo.records import GameRecord, RecordWriter, decode_record, encode_record, read_records, replay_record
+from mydlgo.selfplay import read_records as read_text_records
+from mydlgo.selfplay import run_self_play
+
+
+@pytest.mark.parametrize("board_size, move_bytes", [(9, 1), (15, 1), (19, 2)])
+@pytest.mark.parametrize("result", ["B+12.5", "W+R", "?"])
+def test_record_round_trip(board_size, move_bytes, result):
+    moves = [
+        goboard.Move.play(Point(1, 1)),
+        goboard.Move.play(Point(board_size, board_size)),
+        goboard.Move.pass_turn(),
+        goboard.Move.resign(),
+    ]
+    record = GameRecord(board_size, 6.5, result, moves)
+    data = encode_record(record)
+    assert len(data) == 8 + move_bytes * len(moves)
+    assert decode_record(data) == record
+
+
+def test_writer_appends_and_reader_streams(tmp_path):
+    path = str(tmp_path / "games.bin")
+    records = [
+        GameRecord(5, 0.5, "W+3.5", [goboard.Move.play(Point(2, 3)), goboard.Move.pass_turn()]),
+        GameRecord(19, 7.5, "B+R", [goboard.Move.play(Point(16, 4)), goboard.Move.resign()]),
+    ]
+    for record in records:
+        with RecordWriter(path) as writer:
+            writer.write(record)
+    assert list(read_records(path)) == records
+
+    with open(path, "ab") as f:
+        f.write(b"\x05")
+    with pytest.raises(ValueError):
+        list(read_records(path))
+
+
+def test_self_play_binary_records_match_text(tmp_path):
+    text = str(tmp_path / "games.txt")
+    binary = str(tmp_path / "games.bin")
+    run_self_play(RandomBot(), RandomBot(), 3, text, board_size=5, num_workers=1, seed=4)
+    run_self_play(RandomBot(), RandomBot(), 3, binary, board_size=5, num_workers=1, seed=4, record_format="binary")
+    records = list(read_records(binary))
+    assert records == list(read_text_records(text))
+
+    positions = list(replay_record(records[0], goboard.GameState))
+    assert len(positions) == len(records[0].moves) + 1
+    assert positions[-1].is_over()
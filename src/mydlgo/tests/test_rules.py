@@ -0,0 +1,72 @@
+import random
+
+import numpy as np
+import pytest
+
+from mydlgo import goboard, goboard_fast
+from mydlgo.goboard import Move
+from mydlgo.gotypes import Player, Point
+from mydlgo.rules import AREA, CHINESE, JAPANESE, Ruleset, dead_stones, estimate_ownership, score_game, score_games
+from mydlgo.scoring import compute_game_result
+from mydlgo.tests.test_goboard import GAME_STATES, random_game
+
+
+def walls_with_invader(game_state_class):
+    """ Black owns columns 1-3 and white columns 7-9 of a 9x9 board, and black has one hopeless stone
+    at (2, 8) inside white's area. """
+    game = game_state_class.new_game(9)
+    moves = []
+    for row in range(1, 10):
+        moves += [Move.play(Point(row, 4)), Move.play(Point(row, 6))]
+    moves += [Move.play(Point(2, 8)), Move.pass_turn(), Move.pass_turn()]
+    for move in moves:
+        game = game.apply_move(move)
+    return game
+
+
+@pytest.mark.parametrize("game_state_class", GAME_STATES)
+@pytest.mark.parametrize("num_moves", [20, 400])
+def test_area_rules_match_compute_game_result(game_state_class, num_moves):
+    game = random_game(game_state_class, 7, num_moves, seed=num_moves)
+    assert score_game(game, CHINESE) == compute_game_result(game)
+
+
+@pytest.mark.parametrize("komi", [0.5, 6.5])
+def test_area_rules_match_compute_game_result_with_komi(komi):
+    game = random_game(goboard_fast.GameState, 7, 400, seed=1)
+    assert score_game(game, Ruleset(AREA, komi, 1.0)) == compute_game_result(game, komi=komi)
+
+
+@pytest.mark.parametrize("game_state_class", [goboard.GameState, goboard_fast.GameState])
+def test_dead_stones_are_removed(game_state_class):
+    game = walls_with_invader(game_state_class)
+    ownership = estimate_ownership([game], seed=0)[0]
+    assert ownership.shape == (9, 9)
+    assert (ownership[:, :3] > 0).all() and (ownership[:, 6:] < 0).all()
+    dead = dead_stones(game, ownership)
+    assert np.flatnonzero(dead).tolist() == [1 * 9 + 7]
+
+    # Column 5 is dame, and so are columns 7-9 while the invader is alive.
+    assert score_game(game, CHINESE) == (9 + 27 + 1, 9, 7.5)
+    assert score_game(game, CHINESE, dead) == (9 + 27, 9 + 27, 7.5)
+    # Under territory rules the removed invader is a prisoner for white.
+    assert score_game(game, JAPANESE, dead) == (27, 27 + 1, 6.5)
+    assert score_games([game], JAPANESE, seed=0) == [score_game(game, JAPANESE, dead)]
+
+
+def test_handicap_compensation():
+    game = goboard_fast.GameState.new_game(9)
+    for point in [Point(3, 3), Point(7, 7)]:
+        game.board.place_stone(Player.BLACK, point)
+    for move in [Move.play(Point(5, 5)), Move.pass_turn(), Move.pass_turn()]:
+        game = game.apply_move(move)
+    assert score_game(game, Ruleset("area", 0.5, 1.0), handicap=2) == (81, 2, 0.5)
+    assert score_game(game, Ruleset("territory", 0.5, 0.0), handicap=2) == (78, 0, 0.5)
+
+
+def test_estimate_follows_the_random_module():
+    game = walls_with_invader(goboard_fast.GameState)
+    random.seed(5)
+    first = estimate_ownership([game])
+    random.seed(5)
+    assert np.array_equal(estimate_ownership([game]), first)
@@ -0,0 +1,63 @@
+import pytest
+
+from mydlgo import goboard_slow
+from mydlgo.gotypes import Player, Point
+from mydlgo.scoring import evaluate_territory, territory_counts
+from mydlgo.tests.test_goboard import GAME_STATES, random_game
+
+
+def reference_counts(board):
+    """ Counts from a plain flood fill over get_player_at. """
+    points = [Point(r, c) for r in range(1, board.num_rows + 1) for c in range(1, board.num_cols + 1)]
+    counts = [0] * 5
+    seen = set()
+    for point in points:
+        player = board.get_player_at(point)
+        if player is not None:
+            counts[player.value - 1] += 1
+            continue
+        if point in seen:
+            continue
+        region, borders, stack = [], set(), [point]
+        seen.add(point)
+        while stack:
+            p = stack.pop()
+            region.append(p)
+            for n in p.neighbors():
+                if not board.is_on_grid(n):
+                    continue
+                if board.get_player_at(n) is None:
+                    if n not in seen:
+                        seen.add(n)
+                        stack.append(n)
+                else:
+                    borders.add(board.get_player_at(n))
+        column = {frozenset([Player.BLACK]): 2, frozenset([Player.WHITE]): 3}.get(frozenset(borders), 4)
+        counts[column] += len(region)
+    return counts
+
+
+@pytest.mark.parametrize("game_state_class", GAME_STATES)
+@pytest.mark.parametrize("num_moves", [0, 10, 60, 300])
+def test_territory_matches_flood_fill(game_state_class, num_moves):
+    board = random_game(game_state_class, 7, num_moves, seed=num_moves).board
+    territory = evaluate_territory(board)
+    counts = [
+        territory.num_black_stones,
+        territory.num_white_stones,
+        territory.num_black_territory,
+        territory.num_white_territory,
+        territory.num_dame,
+    ]
+    assert counts == reference_counts(board)
+    assert len(territory.dame_points) == territory.num_dame
+    assert all(board.get_player_at(p) is None for p in territory.dame_points)
+    assert territory_counts(board.as_array()[None]).tolist() == [counts]
+
+
+def test_large_empty_regions_do_not_recurse():
+    board = goboard_slow.Board(60, 60)
+    assert evaluate_territory(board).num_dame == 3600
+    board.place_stone(Player.WHITE, Point(30, 30))
+    territory = evaluate_territory(board)
+    assert (territory.num_white_stones, territory.num_white_territory) == (1, 3599)
@@ -0,0 +1,51 @@
+from mydlgo import goboard
+from mydlgo.agent import Agent, RandomBot
+from mydlgo.gotypes import Point
+from mydlgo.selfplay import GameRecord, format_record, parse_record, play_game, read_records, run_self_play
+
+
+def test_record_round_trip():
+    moves = [goboard.Move.play(Point(3, 4)), goboard.Move.play(Point(9, 9)), goboard.Move.pass_turn()]
+    record = GameRecord(9, 7.5, "W+7.5", moves)
+    line = format_record(record)
+    assert line == "9 7.5 W+7.5 D3 J9 pass"
+    parsed = parse_record(line)
+    assert parsed.board_size == 9
+    assert parsed.komi == 7.5
+    assert parsed.result == "W+7.5"
+    assert format_record(parsed) == line
+
+
+def test_record_round_trip_on_25x25():
+    moves = [goboard.Move.play(Point(25, 25)), goboard.Move.play(Point(21, 20))]
+    line = format_record(GameRecord(25, 7.5, "?", moves))
+    assert line == "25 7.5 ? Z25 U21"
+    assert parse_record(line).moves == moves
+
+
+def test_records_do_not_depend_on_worker_count(tmp_path):
+    single = tmp_path / "single.txt"
+    pooled = tmp_path / "pooled.txt"
+    stats = run_self_play(RandomBot(), RandomBot(), 4, str(single), board_size=5, num_workers=1, seed=3)
+    run_self_play(RandomBot(), RandomBot(), 4, str(pooled), board_size=5, num_workers=2, seed=3)
+    assert single.read_text() == pooled.read_text()
+
+    records = list(read_records(str(single)))
+    assert len(records) == stats.num_games == 4
+    assert sum(len(r.moves) for r in records) == stats.num_moves
+    assert all(r.moves[-2].is_pass and r.moves[-1].is_pass for r in records)
+
+
+class Resigner(Agent):
+    def select_move(self, game_state):
+        return goboard.Move.resign()
+
+
+def test_resigned_games_are_not_scored():
+    def score_fn(game_state):
+        raise AssertionError("a resigned game was scored")
+
+    record = play_game(RandomBot(), Resigner(), 5, max_moves=10, score_fn=score_fn, komi=6.5)
+    assert record.result == "B+R"
+    assert record.komi == 6.5
+    assert len(record.moves) == 2
@@ -0,0 +1,17 @@
+import pytest
+
+from mydlgo import zobrist
+
+
+@pytest.mark.parametrize("num_rows, num_cols", [(9, 9), (7, 11), (25, 25)])
+def test_codes_are_reproducible_and_distinct(num_rows, num_cols):
+    codes = zobrist.hash_codes(num_rows, num_cols)
+    assert zobrist.hash_codes(num_rows, num_cols) is codes
+    assert codes == zobrist.generate_codes(num_rows, num_cols)
+    assert len(set(codes + [zobrist.EMPTY_BOARD])) == 3 * num_rows * num_cols + 1
+    assert all(0 <= code < 2 ** 63 for code in codes)
+
+
+def test_tables_are_built_per_size():
+    assert zobrist.hash_codes(7, 11) != zobrist.hash_codes(11, 7)
+    assert zobrist.generate_codes(9, 9) != zobrist.generate_codes(9, 9, seed=zobrist.SEED + 1)
@@ -1,7 +1,8 @@
 from .goboard import Board, Move
 from .gotypes import Player, Point
 
-COLS = "ABCDEFGHJKLMNOPQRST"
+# GTP column letters, skipping I; boards up to 25 columns have coordinates.
+COLS = "ABCDEFGHJKLMNOPQRSTUVWXYZ"
 
 STONE_TO_CHAR = {
     None: ".",
@@ -21,13 +22,12 @@ def print_move(player: Player, move: Move):
 
 
 def print_board(board: Board):
+    chars = [STONE_TO_CHAR[None], STONE_TO_CHAR[Player.BLACK], STONE_TO_CHAR[Player.WHITE]]
+    stones = board.stone_bytes()
     for row in range(board.num_rows, 0, -1):
         bump = " " if row <= 9 else ""
-        line = []
-        for col in range(1, board.num_cols + 1):
-            stone = board.get_player_at(Point(row=row, col=col))
-            line.append(STONE_TO_CHAR[stone])
-        print("%s%d %s" % (bump, row, "".join(line)))
+        line = "".join(chars[stone] for stone in stones[(row - 1) * board.num_cols : row * board.num_cols])
+        print("%s%d %s" % (bump, row, line))
     print("   " + "".join(COLS[: board.num_cols]))
 
 
@@ -1,1091 +1,33 @@
-from .gotypes import Player, Point
+"""
+Zobrist hash codes.
 
-__all__ = ["HASH_CODE", "EMPTY_BOARD"]
+Every board size has its own table of codes, drawn from a seed derived from SEED and the size the
+first time a board of that size is created, and cached afterwards; a program that only plays 9x9 never
+builds a 19x19 or 25x25 table. A table is one flat list indexed by
+`((row - 1) * num_cols + (col - 1)) * 3 + color`, with color 1 for black and 2 for white as in Player
+(0 is unused), which boards index directly instead of looking up (Point, Player) keys.
+"""
+import random
+from typing import Dict, List, Tuple
 
-HASH_CODE = {
-    (Point(row=1, col=1), None): 4063866388349657214,
-    (Point(row=1, col=1), Player.BLACK): 3949732988047075625,
-    (Point(row=1, col=1), Player.WHITE): 3583744690823040896,
-    (Point(row=1, col=2), None): 4718424882748533256,
-    (Point(row=1, col=2), Player.BLACK): 397731061451061093,
-    (Point(row=1, col=2), Player.WHITE): 6496119477661150422,
-    (Point(row=1, col=3), None): 5804273428568324268,
-    (Point(row=1, col=3), Player.BLACK): 6512400768304331329,
-    (Point(row=1, col=3), Player.WHITE): 8001802620005854002,
-    (Point(row=1, col=4), None): 8957765900324269543,
-    (Point(row=1, col=4), Player.BLACK): 3377165795399396254,
-    (Point(row=1, col=4), Player.WHITE): 1857714213790710865,
-    (Point(row=1, col=5), None): 1448213784693889051,
-    (Point(row=1, col=5), Player.BLACK): 5692612151242482955,
-    (Point(row=1, col=5), Player.WHITE): 5884505005519086103,
-    (Point(row=1, col=6), None): 5883224818362283333,
-    (Point(row=1, col=6), Player.BLACK): 7459214437390356810,
-    (Point(row=1, col=6), Player.WHITE): 8538322563648211809,
-    (Point(row=1, col=7), None): 7463722631919530499,
-    (Point(row=1, col=7), Player.BLACK): 2049702534468019097,
-    (Point(row=1, col=7), Player.WHITE): 504591695476462314,
-    (Point(row=1, col=8), None): 446995112013488794,
-    (Point(row=1, col=8), Player.BLACK): 5467138724877555844,
-    (Point(row=1, col=8), Player.WHITE): 4727095655533339244,
-    (Point(row=1, col=9), None): 5747403957550735973,
-    (Point(row=1, col=9), Player.BLACK): 562805404772020107,
-    (Point(row=1, col=9), Player.WHITE): 8158712039420236329,
-    (Point(row=1, col=10), None): 5017743125632875859,
-    (Point(row=1, col=10), Player.BLACK): 1878144443823059955,
-    (Point(row=1, col=10), Player.WHITE): 8023033433038395539,
-    (Point(row=1, col=11), None): 2225320706999335770,
-    (Point(row=1, col=11), Player.BLACK): 7003637201422114302,
-    (Point(row=1, col=11), Player.WHITE): 1049097309433313175,
-    (Point(row=1, col=12), None): 7550322208855550359,
-    (Point(row=1, col=12), Player.BLACK): 7815105632129496032,
-    (Point(row=1, col=12), Player.WHITE): 1526525723792198445,
-    (Point(row=1, col=13), None): 162609090742133578,
-    (Point(row=1, col=13), Player.BLACK): 3296183425180175112,
-    (Point(row=1, col=13), Player.WHITE): 7202015361617752160,
-    (Point(row=1, col=14), None): 3772570931130851981,
-    (Point(row=1, col=14), Player.BLACK): 4075645825449399748,
-    (Point(row=1, col=14), Player.WHITE): 8678311221354869215,
-    (Point(row=1, col=15), None): 4398608564758872452,
-    (Point(row=1, col=15), Player.BLACK): 690600094668765382,
-    (Point(row=1, col=15), Player.WHITE): 8054917556142298842,
-    (Point(row=1, col=16), None): 7059239333210778288,
-    (Point(row=1, col=16), Player.BLACK): 2682367628239455511,
-    (Point(row=1, col=16), Player.WHITE): 8720708475950476960,
-    (Point(row=1, col=17), None): 5492039946881886183,
-    (Point(row=1, col=17), Player.BLACK): 2074844473975014224,
-    (Point(row=1, col=17), Player.WHITE): 6280182086533819737,
-    (Point(row=1, col=18), None): 2393551750034284371,
-    (Point(row=1, col=18), Player.BLACK): 8054457627357622310,
-    (Point(row=1, col=18), Player.WHITE): 7447361266231095873,
-    (Point(row=1, col=19), None): 5547225182313428505,
-    (Point(row=1, col=19), Player.BLACK): 2667570872068264228,
-    (Point(row=1, col=19), Player.WHITE): 2617778875883720533,
-    (Point(row=2, col=1), None): 7452849990535879158,
-    (Point(row=2, col=1), Player.BLACK): 5075238558073581230,
-    (Point(row=2, col=1), Player.WHITE): 2960437757011580988,
-    (Point(row=2, col=2), None): 7445296744203008598,
-    (Point(row=2, col=2), Player.BLACK): 8374805626495478320,
-    (Point(row=2, col=2), Player.WHITE): 4341431810423749066,
-    (Point(row=2, col=3), None): 4331268104285633937,
-    (Point(row=2, col=3), Player.BLACK): 3533038573530381086,
-    (Point(row=2, col=3), Player.WHITE): 8706547656737074734,
-    (Point(row=2, col=4), None): 8407727173537721763,
-    (Point(row=2, col=4), Player.BLACK): 9129744605430437484,
-    (Point(row=2, col=4), Player.WHITE): 4602661183726142907,
-    (Point(row=2, col=5), None): 4323718103664242376,
-    (Point(row=2, col=5), Player.BLACK): 6906290672625559498,
-    (Point(row=2, col=5), Player.WHITE): 6055386223601503527,
-    (Point(row=2, col=6), None): 3003748383859462822,
-    (Point(row=2, col=6), Player.BLACK): 684182989417055414,
-    (Point(row=2, col=6), Player.WHITE): 392553304814865691,
-    (Point(row=2, col=7), None): 3538253774044461091,
-    (Point(row=2, col=7), Player.BLACK): 6372665910362930103,
-    (Point(row=2, col=7), Player.WHITE): 7248236768145592352,
-    (Point(row=2, col=8), None): 5694577129390540946,
-    (Point(row=2, col=8), Player.BLACK): 65935059590564114,
-    (Point(row=2, col=8), Player.WHITE): 2968065578798466745,
-    (Point(row=2, col=9), None): 2967400246097285211,
-    (Point(row=2, col=9), Player.BLACK): 469052420826869432,
-    (Point(row=2, col=9), Player.WHITE): 636599077371301141,
-    (Point(row=2, col=10), None): 9108696916777709899,
-    (Point(row=2, col=10), Player.BLACK): 4481291039038964204,
-    (Point(row=2, col=10), Player.WHITE): 5465341184476724971,
-    (Point(row=2, col=11), None): 394451306552562118,
-    (Point(row=2, col=11), Player.BLACK): 3610507997831607071,
-    (Point(row=2, col=11), Player.WHITE): 2826368408281991718,
-    (Point(row=2, col=12), None): 3363060694859073518,
-    (Point(row=2, col=12), Player.BLACK): 8497723154883591022,
-    (Point(row=2, col=12), Player.WHITE): 8966687698491826523,
-    (Point(row=2, col=13), None): 2848127215715293590,
-    (Point(row=2, col=13), Player.BLACK): 7531522472586235544,
-    (Point(row=2, col=13), Player.WHITE): 1514830473304451444,
-    (Point(row=2, col=14), None): 6905926479184238106,
-    (Point(row=2, col=14), Player.BLACK): 802124205343752112,
-    (Point(row=2, col=14), Player.WHITE): 800985065532538439,
-    (Point(row=2, col=15), None): 6420707013936539091,
-    (Point(row=2, col=15), Player.BLACK): 1440453103259782147,
-    (Point(row=2, col=15), Player.WHITE): 8319187016386407328,
-    (Point(row=2, col=16), None): 6050646370823784033,
-    (Point(row=2, col=16), Player.BLACK): 859221184555937618,
-    (Point(row=2, col=16), Player.WHITE): 6906987209458177333,
-    (Point(row=2, col=17), None): 3555540145219629612,
-    (Point(row=2, col=17), Player.BLACK): 876900431627286405,
-    (Point(row=2, col=17), Player.WHITE): 4578596683924359232,
-    (Point(row=2, col=18), None): 7140270485475775790,
-    (Point(row=2, col=18), Player.BLACK): 796148986220139097,
-    (Point(row=2, col=18), Player.WHITE): 5584330294312145827,
-    (Point(row=2, col=19), None): 1448348141226184647,
-    (Point(row=2, col=19), Player.BLACK): 2877838252784561615,
-    (Point(row=2, col=19), Player.WHITE): 6953611671526000288,
-    (Point(row=3, col=1), None): 1376684845352288352,
-    (Point(row=3, col=1), Player.BLACK): 3056974796876699020,
-    (Point(row=3, col=1), Player.WHITE): 4912360391326738806,
-    (Point(row=3, col=2), None): 7646085615908372384,
-    (Point(row=3, col=2), Player.BLACK): 6687246137739275979,
-    (Point(row=3, col=2), Player.WHITE): 1873119543150384875,
-    (Point(row=3, col=3), None): 7952048850716597190,
-    (Point(row=3, col=3), Player.BLACK): 4949629593711377577,
-    (Point(row=3, col=3), Player.WHITE): 3399088756118591852,
-    (Point(row=3, col=4), None): 2560507737566100209,
-    (Point(row=3, col=4), Player.BLACK): 7874625620559946627,
-    (Point(row=3, col=4), Player.WHITE): 6143325335136983356,
-    (Point(row=3, col=5), None): 294806426163837110,
-    (Point(row=3, col=5), Player.BLACK): 3023670858669790832,
-    (Point(row=3, col=5), Player.WHITE): 2979964157730744812,
-    (Point(row=3, col=6), None): 7477034081434128794,
-    (Point(row=3, col=6), Player.BLACK): 5886206091503616462,
-    (Point(row=3, col=6), Player.WHITE): 8539631381682727477,
-    (Point(row=3, col=7), None): 5277553558407228260,
-    (Point(row=3, col=7), Player.BLACK): 7152670295229634318,
-    (Point(row=3, col=7), Player.WHITE): 2932135423148808392,
-    (Point(row=3, col=8), None): 3810186229904247319,
-    (Point(row=3, col=8), Player.BLACK): 6803825173447906382,
-    (Point(row=3, col=8), Player.WHITE): 8768096940860679032,
-    (Point(row=3, col=9), None): 693024684811721493,
-    (Point(row=3, col=9), Player.BLACK): 8700328727493174262,
-    (Point(row=3, col=9), Player.WHITE): 1409910892287564369,
-    (Point(row=3, col=10), None): 4903348446164591459,
-    (Point(row=3, col=10), Player.BLACK): 3122582205862196131,
-    (Point(row=3, col=10), Player.WHITE): 3834876334750210310,
-    (Point(row=3, col=11), None): 771106522677024034,
-    (Point(row=3, col=11), Player.BLACK): 7132787140547127014,
-    (Point(row=3, col=11), Player.WHITE): 1176801541496729415,
-    (Point(row=3, col=12), None): 3347929103334969016,
-    (Point(row=3, col=12), Player.BLACK): 2697474891774556094,
-    (Point(row=3, col=12), Player.WHITE): 3282133200509288832,
-    (Point(row=3, col=13), None): 7032586156533448356,
-    (Point(row=3, col=13), Player.BLACK): 8201569367925570634,
-    (Point(row=3, col=13), Player.WHITE): 5447947570397278917,
-    (Point(row=3, col=14), None): 3169891451442020264,
-    (Point(row=3, col=14), Player.BLACK): 7557101644269711512,
-    (Point(row=3, col=14), Player.WHITE): 9036926875283848631,
-    (Point(row=3, col=15), None): 3104741760536241630,
-    (Point(row=3, col=15), Player.BLACK): 4262392915748415238,
-    (Point(row=3, col=15), Player.WHITE): 4919379303413133021,
-    (Point(row=3, col=16), None): 6517818871104084897,
-    (Point(row=3, col=16), Player.BLACK): 6056010671864107451,
-    (Point(row=3, col=16), Player.WHITE): 4925673491050830666,
-    (Point(row=3, col=17), None): 8753844946648968357,
-    (Point(row=3, col=17), Player.BLACK): 4436013445499015505,
-    (Point(row=3, col=17), Player.WHITE): 2580968298324815014,
-    (Point(row=3, col=18), None): 6055850613062570778,
-    (Point(row=3, col=18), Player.BLACK): 1573718326044832293,
-    (Point(row=3, col=18), Player.WHITE): 5219766679290815853,
-    (Point(row=3, col=19), None): 3633114656952000715,
-    (Point(row=3, col=19), Player.BLACK): 1152708054359069019,
-    (Point(row=3, col=19), Player.WHITE): 6876000408344543316,
-    (Point(row=4, col=1), None): 7329936358438912981,
-    (Point(row=4, col=1), Player.BLACK): 6116049851862491277,
-    (Point(row=4, col=1), Player.WHITE): 8449188531085662570,
-    (Point(row=4, col=2), None): 63250448618564368,
-    (Point(row=4, col=2), Player.BLACK): 1865529746897714947,
-    (Point(row=4, col=2), Player.WHITE): 7830617519257917031,
-    (Point(row=4, col=3), None): 2952807549054733135,
-    (Point(row=4, col=3), Player.BLACK): 2126134046793508116,
-    (Point(row=4, col=3), Player.WHITE): 74143286982632360,
-    (Point(row=4, col=4), None): 1252516381868263613,
-    (Point(row=4, col=4), Player.BLACK): 2091860699571006563,
-    (Point(row=4, col=4), Player.WHITE): 5414925515258612557,
-    (Point(row=4, col=5), None): 3675675970430201686,
-    (Point(row=4, col=5), Player.BLACK): 228236293491988921,
-    (Point(row=4, col=5), Player.WHITE): 1538410724465477494,
-    (Point(row=4, col=6), None): 6387822409072958014,
-    (Point(row=4, col=6), Player.BLACK): 5910028042055709591,
-    (Point(row=4, col=6), Player.WHITE): 1529287677871035752,
-    (Point(row=4, col=7), None): 1609186286351299722,
-    (Point(row=4, col=7), Player.BLACK): 2849440919696535767,
-    (Point(row=4, col=7), Player.WHITE): 7984976498434641049,
-    (Point(row=4, col=8), None): 6737825348740277071,
-    (Point(row=4, col=8), Player.BLACK): 8819506523729718924,
-    (Point(row=4, col=8), Player.WHITE): 5586626366083366887,
-    (Point(row=4, col=9), None): 3437604501192030757,
-    (Point(row=4, col=9), Player.BLACK): 1886065678485703919,
-    (Point(row=4, col=9), Player.WHITE): 4349685705507382245,
-    (Point(row=4, col=10), None): 969914695657874232,
-    (Point(row=4, col=10), Player.BLACK): 493630899064718385,
-    (Point(row=4, col=10), Player.WHITE): 6679487281432465947,
-    (Point(row=4, col=11), None): 8178551617544319257,
-    (Point(row=4, col=11), Player.BLACK): 124447720168346861,
-    (Point(row=4, col=11), Player.WHITE): 8083743157003826860,
-    (Point(row=4, col=12), None): 3090573981934268511,
-    (Point(row=4, col=12), Player.BLACK): 869984271353819387,
-    (Point(row=4, col=12), Player.WHITE): 2646123962844097859,
-    (Point(row=4, col=13), None): 4592108522180134827,
-    (Point(row=4, col=13), Player.BLACK): 499622981837466477,
-    (Point(row=4, col=13), Player.WHITE): 8949038969414766512,
-    (Point(row=4, col=14), None): 4430777892923422780,
-    (Point(row=4, col=14), Player.BLACK): 8456303890657249061,
-    (Point(row=4, col=14), Player.WHITE): 6082764638501368099,
-    (Point(row=4, col=15), None): 8281991822770967246,
-    (Point(row=4, col=15), Player.BLACK): 8800894520093594500,
-    (Point(row=4, col=15), Player.WHITE): 8685341964947286807,
-    (Point(row=4, col=16), None): 7261892374836120701,
-    (Point(row=4, col=16), Player.BLACK): 2328421256163909317,
-    (Point(row=4, col=16), Player.WHITE): 7629502173343397459,
-    (Point(row=4, col=17), None): 7816846856558673934,
-    (Point(row=4, col=17), Player.BLACK): 3892799736319455881,
-    (Point(row=4, col=17), Player.WHITE): 3812630489038458217,
-    (Point(row=4, col=18), None): 1141300480348275601,
-    (Point(row=4, col=18), Player.BLACK): 8590714380407353773,
-    (Point(row=4, col=18), Player.WHITE): 4419838918459204249,
-    (Point(row=4, col=19), None): 764965110515956331,
-    (Point(row=4, col=19), Player.BLACK): 5878146485313450271,
-    (Point(row=4, col=19), Player.WHITE): 5208805214588768037,
-    (Point(row=5, col=1), None): 4189060953102350044,
-    (Point(row=5, col=1), Player.BLACK): 2738846247657068022,
-    (Point(row=5, col=1), Player.WHITE): 7863090200585473831,
-    (Point(row=5, col=2), None): 971677573841965699,
-    (Point(row=5, col=2), Player.BLACK): 6280431525742512725,
-    (Point(row=5, col=2), Player.WHITE): 946401229714610587,
-    (Point(row=5, col=3), None): 7664575128678662502,
-    (Point(row=5, col=3), Player.BLACK): 3092848928922617231,
-    (Point(row=5, col=3), Player.WHITE): 895989564455095609,
-    (Point(row=5, col=4), None): 3030279547477266436,
-    (Point(row=5, col=4), Player.BLACK): 538018310898422620,
-    (Point(row=5, col=4), Player.WHITE): 304486277978179205,
-    (Point(row=5, col=5), None): 5305664547735786557,
-    (Point(row=5, col=5), Player.BLACK): 5890170874719323423,
-    (Point(row=5, col=5), Player.WHITE): 3006049522033949084,
-    (Point(row=5, col=6), None): 8484322935120939470,
-    (Point(row=5, col=6), Player.BLACK): 5188779696424501903,
-    (Point(row=5, col=6), Player.WHITE): 9030906115347788979,
-    (Point(row=5, col=7), None): 2654092940989012780,
-    (Point(row=5, col=7), Player.BLACK): 4324593064577373979,
-    (Point(row=5, col=7), Player.WHITE): 7929142519391462266,
-    (Point(row=5, col=8), None): 8470907607553128143,
-    (Point(row=5, col=8), Player.BLACK): 9105462709015505774,
-    (Point(row=5, col=8), Player.WHITE): 7215615099187687434,
-    (Point(row=5, col=9), None): 9155635859858861176,
-    (Point(row=5, col=9), Player.BLACK): 4790715787738864058,
-    (Point(row=5, col=9), Player.WHITE): 3854981520927296899,
-    (Point(row=5, col=10), None): 6292562993022156596,
-    (Point(row=5, col=10), Player.BLACK): 2373192491985308818,
-    (Point(row=5, col=10), Player.WHITE): 8154320893109203118,
-    (Point(row=5, col=11), None): 3635770601664262255,
-    (Point(row=5, col=11), Player.BLACK): 6762059348716650925,
-    (Point(row=5, col=11), Player.WHITE): 8385787894623910058,
-    (Point(row=5, col=12), None): 4609195789255822468,
-    (Point(row=5, col=12), Player.BLACK): 1538300980461294056,
-    (Point(row=5, col=12), Player.WHITE): 5576817461897556175,
-    (Point(row=5, col=13), None): 5364510269583009706,
-    (Point(row=5, col=13), Player.BLACK): 3606894728362109143,
-    (Point(row=5, col=13), Player.WHITE): 2476533339567735996,
-    (Point(row=5, col=14), None): 5337950175405638048,
-    (Point(row=5, col=14), Player.BLACK): 2078932523669572535,
-    (Point(row=5, col=14), Player.WHITE): 327621818588574676,
-    (Point(row=5, col=15), None): 7992341101693628650,
-    (Point(row=5, col=15), Player.BLACK): 3914938337879835099,
-    (Point(row=5, col=15), Player.WHITE): 1518563256156699863,
-    (Point(row=5, col=16), None): 8901963259761554380,
-    (Point(row=5, col=16), Player.BLACK): 6910435883600088470,
-    (Point(row=5, col=16), Player.WHITE): 8631231664698038944,
-    (Point(row=5, col=17), None): 7716787572062368741,
-    (Point(row=5, col=17), Player.BLACK): 9090971298488943908,
-    (Point(row=5, col=17), Player.WHITE): 253983812830432305,
-    (Point(row=5, col=18), None): 65819525411148400,
-    (Point(row=5, col=18), Player.BLACK): 7153282873289203012,
-    (Point(row=5, col=18), Player.WHITE): 7516454848993421967,
-    (Point(row=5, col=19), None): 7140572331505378666,
-    (Point(row=5, col=19), Player.BLACK): 4900729377243797716,
-    (Point(row=5, col=19), Player.WHITE): 3237432538681098570,
-    (Point(row=6, col=1), None): 652455915627052594,
-    (Point(row=6, col=1), Player.BLACK): 793247087121888986,
-    (Point(row=6, col=1), Player.WHITE): 8496342207312064791,
-    (Point(row=6, col=2), None): 180168064954919634,
-    (Point(row=6, col=2), Player.BLACK): 1642167445613818125,
-    (Point(row=6, col=2), Player.WHITE): 690606974731946781,
-    (Point(row=6, col=3), None): 109841433200428246,
-    (Point(row=6, col=3), Player.BLACK): 7995233438518653203,
-    (Point(row=6, col=3), Player.WHITE): 3233842329810019734,
-    (Point(row=6, col=4), None): 582704161645627423,
-    (Point(row=6, col=4), Player.BLACK): 6353288962578235302,
-    (Point(row=6, col=4), Player.WHITE): 6348152165806389772,
-    (Point(row=6, col=5), None): 2874065840675015141,
-    (Point(row=6, col=5), Player.BLACK): 4004660147452706444,
-    (Point(row=6, col=5), Player.WHITE): 3244068097971524510,
-    (Point(row=6, col=6), None): 7624559942705549302,
-    (Point(row=6, col=6), Player.BLACK): 2329621057201988233,
-    (Point(row=6, col=6), Player.WHITE): 1254574091449438004,
-    (Point(row=6, col=7), None): 6290814673539586737,
-    (Point(row=6, col=7), Player.BLACK): 1127490812895510602,
-    (Point(row=6, col=7), Player.WHITE): 838540782713931506,
-    (Point(row=6, col=8), None): 8056137477627639508,
-    (Point(row=6, col=8), Player.BLACK): 6717307048809889848,
-    (Point(row=6, col=8), Player.WHITE): 4883453106937062595,
-    (Point(row=6, col=9), None): 9023320935029138395,
-    (Point(row=6, col=9), Player.BLACK): 5838021724971276850,
-    (Point(row=6, col=9), Player.WHITE): 7259968133200937559,
-    (Point(row=6, col=10), None): 1391748441112747342,
-    (Point(row=6, col=10), Player.BLACK): 1506282671632186082,
-    (Point(row=6, col=10), Player.WHITE): 3449602562376287621,
-    (Point(row=6, col=11), None): 170287886574523100,
-    (Point(row=6, col=11), Player.BLACK): 1466690530717430118,
-    (Point(row=6, col=11), Player.WHITE): 8116348878212431744,
-    (Point(row=6, col=12), None): 8476397165853632181,
-    (Point(row=6, col=12), Player.BLACK): 4494789800565051691,
-    (Point(row=6, col=12), Player.WHITE): 1969732434789873688,
-    (Point(row=6, col=13), None): 5933286591146602679,
-    (Point(row=6, col=13), Player.BLACK): 4791498662536436650,
-    (Point(row=6, col=13), Player.WHITE): 7652902565516813729,
-    (Point(row=6, col=14), None): 4525619904597822607,
-    (Point(row=6, col=14), Player.BLACK): 6380151861806735822,
-    (Point(row=6, col=14), Player.WHITE): 1810288384049231886,
-    (Point(row=6, col=15), None): 6284902687086984906,
-    (Point(row=6, col=15), Player.BLACK): 4858389021781407001,
-    (Point(row=6, col=15), Player.WHITE): 2833227263113439323,
-    (Point(row=6, col=16), None): 792468675418038460,
-    (Point(row=6, col=16), Player.BLACK): 2093318845580552812,
-    (Point(row=6, col=16), Player.WHITE): 1615691370670537446,
-    (Point(row=6, col=17), None): 7276287228981486920,
-    (Point(row=6, col=17), Player.BLACK): 7070353458320481869,
-    (Point(row=6, col=17), Player.WHITE): 5604721002290696751,
-    (Point(row=6, col=18), None): 6642443862168149141,
-    (Point(row=6, col=18), Player.BLACK): 7953245348861354024,
-    (Point(row=6, col=18), Player.WHITE): 3526990166676158670,
-    (Point(row=6, col=19), None): 849438015049056986,
-    (Point(row=6, col=19), Player.BLACK): 3092201763196968500,
-    (Point(row=6, col=19), Player.WHITE): 5911081813765596449,
-    (Point(row=7, col=1), None): 647847292813010984,
-    (Point(row=7, col=1), Player.BLACK): 6623625630973234091,
-    (Point(row=7, col=1), Player.WHITE): 1724287664306568652,
-    (Point(row=7, col=2), None): 6522668768100512245,
-    (Point(row=7, col=2), Player.BLACK): 9088203046974806149,
-    (Point(row=7, col=2), Player.WHITE): 4896671012117170262,
-    (Point(row=7, col=3), None): 7704041605329890818,
-    (Point(row=7, col=3), Player.BLACK): 8506144526251293636,
-    (Point(row=7, col=3), Player.WHITE): 5907147964946502203,
-    (Point(row=7, col=4), None): 8233061901453445063,
-    (Point(row=7, col=4), Player.BLACK): 474812785853608963,
-    (Point(row=7, col=4), Player.WHITE): 9011221016420795330,
-    (Point(row=7, col=5), None): 5654835247265561209,
-    (Point(row=7, col=5), Player.BLACK): 3332138413077308458,
-    (Point(row=7, col=5), Player.WHITE): 9171014588680117630,
-    (Point(row=7, col=6), None): 7261237343200691945,
-    (Point(row=7, col=6), Player.BLACK): 7224221667334087062,
-    (Point(row=7, col=6), Player.WHITE): 2038343658547225410,
-    (Point(row=7, col=7), None): 6754769486508418282,
-    (Point(row=7, col=7), Player.BLACK): 9212045135260409434,
-    (Point(row=7, col=7), Player.WHITE): 8770988973747310060,
-    (Point(row=7, col=8), None): 7460183848417484889,
-    (Point(row=7, col=8), Player.BLACK): 7573200410416344455,
-    (Point(row=7, col=8), Player.WHITE): 1959560245157541000,
-    (Point(row=7, col=9), None): 2039501222444490849,
-    (Point(row=7, col=9), Player.BLACK): 289975522230027627,
-    (Point(row=7, col=9), Player.WHITE): 3174301939903685218,
-    (Point(row=7, col=10), None): 2393823427031334284,
-    (Point(row=7, col=10), Player.BLACK): 3730900793724175657,
-    (Point(row=7, col=10), Player.WHITE): 2321003734617116869,
-    (Point(row=7, col=11), None): 6049076124737444535,
-    (Point(row=7, col=11), Player.BLACK): 7087415153456414813,
-    (Point(row=7, col=11), Player.WHITE): 1475376443648204106,
-    (Point(row=7, col=12), None): 3583830755561335723,
-    (Point(row=7, col=12), Player.BLACK): 491595999570802120,
-    (Point(row=7, col=12), Player.WHITE): 5332890619174271217,
-    (Point(row=7, col=13), None): 938547303304129863,
-    (Point(row=7, col=13), Player.BLACK): 8407578217527067458,
-    (Point(row=7, col=13), Player.WHITE): 4741480525237687685,
-    (Point(row=7, col=14), None): 8315214875827846471,
-    (Point(row=7, col=14), Player.BLACK): 919313400341571668,
-    (Point(row=7, col=14), Player.WHITE): 3530754679624657642,
-    (Point(row=7, col=15), None): 8377498739629966715,
-    (Point(row=7, col=15), Player.BLACK): 9112459046833181004,
-    (Point(row=7, col=15), Player.WHITE): 1039090096265628637,
-    (Point(row=7, col=16), None): 5304070043171594626,
-    (Point(row=7, col=16), Player.BLACK): 7626555296594350312,
-    (Point(row=7, col=16), Player.WHITE): 2983462922393966957,
-    (Point(row=7, col=17), None): 2359520302153496691,
-    (Point(row=7, col=17), Player.BLACK): 6159148179590645031,
-    (Point(row=7, col=17), Player.WHITE): 503974483423965106,
-    (Point(row=7, col=18), None): 2904773274998860230,
-    (Point(row=7, col=18), Player.BLACK): 8685270329135861798,
-    (Point(row=7, col=18), Player.WHITE): 7331083365608951728,
-    (Point(row=7, col=19), None): 8574752021513347709,
-    (Point(row=7, col=19), Player.BLACK): 1211520427014581229,
-    (Point(row=7, col=19), Player.WHITE): 6501064511370468514,
-    (Point(row=8, col=1), None): 5412380973965970460,
-    (Point(row=8, col=1), Player.BLACK): 6329660753935465753,
-    (Point(row=8, col=1), Player.WHITE): 4607409513248555894,
-    (Point(row=8, col=2), None): 8908764741823066475,
-    (Point(row=8, col=2), Player.BLACK): 4012115181317181822,
-    (Point(row=8, col=2), Player.WHITE): 3976845516352029199,
-    (Point(row=8, col=3), None): 8477393877420433414,
-    (Point(row=8, col=3), Player.BLACK): 6758632297746494868,
-    (Point(row=8, col=3), Player.WHITE): 7585359780768191753,
-    (Point(row=8, col=4), None): 1214218923695647321,
-    (Point(row=8, col=4), Player.BLACK): 2355555032162392749,
-    (Point(row=8, col=4), Player.WHITE): 7751424083134818713,
-    (Point(row=8, col=5), None): 3257970670133688355,
-    (Point(row=8, col=5), Player.BLACK): 6709488066042140597,
-    (Point(row=8, col=5), Player.WHITE): 5902352470932040575,
-    (Point(row=8, col=6), None): 5538971092523814118,
-    (Point(row=8, col=6), Player.BLACK): 3265294404845541831,
-    (Point(row=8, col=6), Player.WHITE): 8787011940814960399,
-    (Point(row=8, col=7), None): 665569797506166792,
-    (Point(row=8, col=7), Player.BLACK): 2693397074855101912,
-    (Point(row=8, col=7), Player.WHITE): 8970310196091889324,
-    (Point(row=8, col=8), None): 2824707566773318570,
-    (Point(row=8, col=8), Player.BLACK): 6103973747446396756,
-    (Point(row=8, col=8), Player.WHITE): 5026105113781071594,
-    (Point(row=8, col=9), None): 1927379658045825605,
-    (Point(row=8, col=9), Player.BLACK): 6050715906882048151,
-    (Point(row=8, col=9), Player.WHITE): 6453258783826907701,
-    (Point(row=8, col=10), None): 4705911407495074849,
-    (Point(row=8, col=10), Player.BLACK): 8352398847523418631,
-    (Point(row=8, col=10), Player.WHITE): 7445932477217122833,
-    (Point(row=8, col=11), None): 8528968679687818123,
-    (Point(row=8, col=11), Player.BLACK): 9132936059389384662,
-    (Point(row=8, col=11), Player.WHITE): 7062690315214452651,
-    (Point(row=8, col=12), None): 2115077187297077827,
-    (Point(row=8, col=12), Player.BLACK): 3230544078749886169,
-    (Point(row=8, col=12), Player.WHITE): 8093992377287385681,
-    (Point(row=8, col=13), None): 4821674300220589567,
-    (Point(row=8, col=13), Player.BLACK): 8523649847288952536,
-    (Point(row=8, col=13), Player.WHITE): 8533576259155434874,
-    (Point(row=8, col=14), None): 7760901726550865576,
-    (Point(row=8, col=14), Player.BLACK): 4047817509722025863,
-    (Point(row=8, col=14), Player.WHITE): 3487368700157734665,
-    (Point(row=8, col=15), None): 3292666695808720933,
-    (Point(row=8, col=15), Player.BLACK): 2420110513228440306,
-    (Point(row=8, col=15), Player.WHITE): 7502378387637672330,
-    (Point(row=8, col=16), None): 1754898080723090352,
-    (Point(row=8, col=16), Player.BLACK): 1026231376670035802,
-    (Point(row=8, col=16), Player.WHITE): 2282605060594544153,
-    (Point(row=8, col=17), None): 3919949594321826595,
-    (Point(row=8, col=17), Player.BLACK): 8123983346156110996,
-    (Point(row=8, col=17), Player.WHITE): 7090362242809768017,
-    (Point(row=8, col=18), None): 3634422639535327136,
-    (Point(row=8, col=18), Player.BLACK): 1903981404580688482,
-    (Point(row=8, col=18), Player.WHITE): 7243494977200045745,
-    (Point(row=8, col=19), None): 8919911240142488801,
-    (Point(row=8, col=19), Player.BLACK): 2692976127882273534,
-    (Point(row=8, col=19), Player.WHITE): 6001530403097698828,
-    (Point(row=9, col=1), None): 8195442464025470676,
-    (Point(row=9, col=1), Player.BLACK): 2851914323225910486,
-    (Point(row=9, col=1), Player.WHITE): 533985463184287048,
-    (Point(row=9, col=2), None): 6928296089828986758,
-    (Point(row=9, col=2), Player.BLACK): 747227990829851201,
-    (Point(row=9, col=2), Player.WHITE): 6684497179054257716,
-    (Point(row=9, col=3), None): 3704964008306802816,
-    (Point(row=9, col=3), Player.BLACK): 8782109634941099096,
-    (Point(row=9, col=3), Player.WHITE): 433448372152611917,
-    (Point(row=9, col=4), None): 4344879505367277396,
-    (Point(row=9, col=4), Player.BLACK): 3128100237345853396,
-    (Point(row=9, col=4), Player.WHITE): 2837525811691832907,
-    (Point(row=9, col=5), None): 6284877570512392915,
-    (Point(row=9, col=5), Player.BLACK): 6404617060995181765,
-    (Point(row=9, col=5), Player.WHITE): 6457353715934487377,
-    (Point(row=9, col=6), None): 7245917329301367469,
-    (Point(row=9, col=6), Player.BLACK): 2393715974180624886,
-    (Point(row=9, col=6), Player.WHITE): 8503536233931560680,
-    (Point(row=9, col=7), None): 7141359501186377505,
-    (Point(row=9, col=7), Player.BLACK): 3932585344119519624,
-    (Point(row=9, col=7), Player.WHITE): 1787465627913711320,
-    (Point(row=9, col=8), None): 5199996422542956242,
-    (Point(row=9, col=8), Player.BLACK): 6505599569717012377,
-    (Point(row=9, col=8), Player.WHITE): 2126552980468379350,
-    (Point(row=9, col=9), None): 6112148766692732099,
-    (Point(row=9, col=9), Player.BLACK): 3832499459956789254,
-    (Point(row=9, col=9), Player.WHITE): 2751062589927904774,
-    (Point(row=9, col=10), None): 489061202935734125,
-    (Point(row=9, col=10), Player.BLACK): 2062595740663047305,
-    (Point(row=9, col=10), Player.WHITE): 2930527889992851532,
-    (Point(row=9, col=11), None): 487068418671001507,
-    (Point(row=9, col=11), Player.BLACK): 2101768832529618932,
-    (Point(row=9, col=11), Player.WHITE): 2585817757966902754,
-    (Point(row=9, col=12), None): 2567655335996277562,
-    (Point(row=9, col=12), Player.BLACK): 2191856434298686763,
-    (Point(row=9, col=12), Player.WHITE): 707623393699939632,
-    (Point(row=9, col=13), None): 2676343516227711431,
-    (Point(row=9, col=13), Player.BLACK): 1671786000630884437,
-    (Point(row=9, col=13), Player.WHITE): 4934142152734574230,
-    (Point(row=9, col=14), None): 262413956631178534,
-    (Point(row=9, col=14), Player.BLACK): 1627819219643832806,
-    (Point(row=9, col=14), Player.WHITE): 1156330568435656553,
-    (Point(row=9, col=15), None): 5426721167186163715,
-    (Point(row=9, col=15), Player.BLACK): 1937788005552476910,
-    (Point(row=9, col=15), Player.WHITE): 190947456314642891,
-    (Point(row=9, col=16), None): 7143684540144004333,
-    (Point(row=9, col=16), Player.BLACK): 8158130695019068629,
-    (Point(row=9, col=16), Player.WHITE): 7645920817327738151,
-    (Point(row=9, col=17), None): 6859486761984691225,
-    (Point(row=9, col=17), Player.BLACK): 7232834224223069929,
-    (Point(row=9, col=17), Player.WHITE): 7245894169926481250,
-    (Point(row=9, col=18), None): 1838174612705919371,
-    (Point(row=9, col=18), Player.BLACK): 7878766175801561153,
-    (Point(row=9, col=18), Player.WHITE): 6727021455125865592,
-    (Point(row=9, col=19), None): 4389408994304583110,
-    (Point(row=9, col=19), Player.BLACK): 1179848608756045189,
-    (Point(row=9, col=19), Player.WHITE): 5218323689326665169,
-    (Point(row=10, col=1), None): 7280275614285782465,
-    (Point(row=10, col=1), Player.BLACK): 2152414196695384071,
-    (Point(row=10, col=1), Player.WHITE): 333971491044229471,
-    (Point(row=10, col=2), None): 7413435411226851147,
-    (Point(row=10, col=2), Player.BLACK): 1965102365940438870,
-    (Point(row=10, col=2), Player.WHITE): 2349124314243461819,
-    (Point(row=10, col=3), None): 8529863795198409255,
-    (Point(row=10, col=3), Player.BLACK): 2845489760966274440,
-    (Point(row=10, col=3), Player.WHITE): 4211564666460253727,
-    (Point(row=10, col=4), None): 8193602229324705535,
-    (Point(row=10, col=4), Player.BLACK): 5030479936727124514,
-    (Point(row=10, col=4), Player.WHITE): 9081337570425244963,
-    (Point(row=10, col=5), None): 4684107940370145251,
-    (Point(row=10, col=5), Player.BLACK): 2908541450217881151,
-    (Point(row=10, col=5), Player.WHITE): 47137546401291290,
-    (Point(row=10, col=6), None): 6959943137141516563,
-    (Point(row=10, col=6), Player.BLACK): 40202462075982630,
-    (Point(row=10, col=6), Player.WHITE): 9114512721910325693,
-    (Point(row=10, col=7), None): 7050834389169048659,
-    (Point(row=10, col=7), Player.BLACK): 8497036039458828586,
-    (Point(row=10, col=7), Player.WHITE): 1776830130693636118,
-    (Point(row=10, col=8), None): 5918223445626685898,
-    (Point(row=10, col=8), Player.BLACK): 5062827292931928096,
-    (Point(row=10, col=8), Player.WHITE): 4600876521603975658,
-    (Point(row=10, col=9), None): 7160349646906644763,
-    (Point(row=10, col=9), Player.BLACK): 3971290024943267351,
-    (Point(row=10, col=9), Player.WHITE): 5614409842876601454,
-    (Point(row=10, col=10), None): 413145248509212380,
-    (Point(row=10, col=10), Player.BLACK): 8781736087543709420,
-    (Point(row=10, col=10), Player.WHITE): 2245355519497177142,
-    (Point(row=10, col=11), None): 6097492463492217089,
-    (Point(row=10, col=11), Player.BLACK): 1359855335395428761,
-    (Point(row=10, col=11), Player.WHITE): 1480177192983461126,
-    (Point(row=10, col=12), None): 1877289297610398303,
-    (Point(row=10, col=12), Player.BLACK): 4712959729745660373,
-    (Point(row=10, col=12), Player.WHITE): 4305299784958050360,
-    (Point(row=10, col=13), None): 4582149144704742426,
-    (Point(row=10, col=13), Player.BLACK): 4414865501442116246,
-    (Point(row=10, col=13), Player.WHITE): 9038052632548292078,
-    (Point(row=10, col=14), None): 2009872547556036986,
-    (Point(row=10, col=14), Player.BLACK): 5096651543035818480,
-    (Point(row=10, col=14), Player.WHITE): 1228712027201402628,
-    (Point(row=10, col=15), None): 8352434247331182570,
-    (Point(row=10, col=15), Player.BLACK): 2002149626103698495,
-    (Point(row=10, col=15), Player.WHITE): 7953123613522694353,
-    (Point(row=10, col=16), None): 6834675364738099826,
-    (Point(row=10, col=16), Player.BLACK): 4018735554920708124,
-    (Point(row=10, col=16), Player.WHITE): 2169825297568182670,
-    (Point(row=10, col=17), None): 2671585455628061995,
-    (Point(row=10, col=17), Player.BLACK): 5583241517870213466,
-    (Point(row=10, col=17), Player.WHITE): 2029958980825545287,
-    (Point(row=10, col=18), None): 2519353684257840006,
-    (Point(row=10, col=18), Player.BLACK): 7485113169094279071,
-    (Point(row=10, col=18), Player.WHITE): 6558345966746272080,
-    (Point(row=10, col=19), None): 7550511234954370497,
-    (Point(row=10, col=19), Player.BLACK): 7657168083711293938,
-    (Point(row=10, col=19), Player.WHITE): 5109578503072667074,
-    (Point(row=11, col=1), None): 2003122699219599762,
-    (Point(row=11, col=1), Player.BLACK): 4300607174119147186,
-    (Point(row=11, col=1), Player.WHITE): 6539339924198233016,
-    (Point(row=11, col=2), None): 4120126260364351362,
-    (Point(row=11, col=2), Player.BLACK): 6298288836310946330,
-    (Point(row=11, col=2), Player.WHITE): 84038769982652521,
-    (Point(row=11, col=3), None): 2227491512430585618,
-    (Point(row=11, col=3), Player.BLACK): 5645616840074365168,
-    (Point(row=11, col=3), Player.WHITE): 6162491832692764042,
-    (Point(row=11, col=4), None): 4452416708968348675,
-    (Point(row=11, col=4), Player.BLACK): 3132526921796490876,
-    (Point(row=11, col=4), Player.WHITE): 31404125192628116,
-    (Point(row=11, col=5), None): 6694087783291199752,
-    (Point(row=11, col=5), Player.BLACK): 986007011550671713,
-    (Point(row=11, col=5), Player.WHITE): 1854200964344234179,
-    (Point(row=11, col=6), None): 8089837169333229612,
-    (Point(row=11, col=6), Player.BLACK): 5471179216096421214,
-    (Point(row=11, col=6), Player.WHITE): 4671513102627257522,
-    (Point(row=11, col=7), None): 7015940757741913727,
-    (Point(row=11, col=7), Player.BLACK): 3206577540711605463,
-    (Point(row=11, col=7), Player.WHITE): 9208565863609057794,
-    (Point(row=11, col=8), None): 518537522821173124,
-    (Point(row=11, col=8), Player.BLACK): 6726474487535670062,
-    (Point(row=11, col=8), Player.WHITE): 2652929510312490816,
-    (Point(row=11, col=9), None): 6655350984287196225,
-    (Point(row=11, col=9), Player.BLACK): 4018659694788667633,
-    (Point(row=11, col=9), Player.WHITE): 221181864609864752,
-    (Point(row=11, col=10), None): 4314660766025033628,
-    (Point(row=11, col=10), Player.BLACK): 8834775368822546016,
-    (Point(row=11, col=10), Player.WHITE): 5821996165398182800,
-    (Point(row=11, col=11), None): 129097788732615717,
-    (Point(row=11, col=11), Player.BLACK): 3745920848252389186,
-    (Point(row=11, col=11), Player.WHITE): 1919562379867062338,
-    (Point(row=11, col=12), None): 7379877385600286533,
-    (Point(row=11, col=12), Player.BLACK): 1602052354332682228,
-    (Point(row=11, col=12), Player.WHITE): 3209460217869703528,
-    (Point(row=11, col=13), None): 6268501291918162370,
-    (Point(row=11, col=13), Player.BLACK): 1089361466685987186,
-    (Point(row=11, col=13), Player.WHITE): 746700560403903542,
-    (Point(row=11, col=14), None): 3161830938605666464,
-    (Point(row=11, col=14), Player.BLACK): 3233062487061565290,
-    (Point(row=11, col=14), Player.WHITE): 946895325640482711,
-    (Point(row=11, col=15), None): 3993044936836062414,
-    (Point(row=11, col=15), Player.BLACK): 5466775128043976332,
-    (Point(row=11, col=15), Player.WHITE): 2066806730037468510,
-    (Point(row=11, col=16), None): 7365749650619710959,
-    (Point(row=11, col=16), Player.BLACK): 8408319672497917854,
-    (Point(row=11, col=16), Player.WHITE): 3550494595418936252,
-    (Point(row=11, col=17), None): 7516197372188561239,
-    (Point(row=11, col=17), Player.BLACK): 8611379411081616650,
-    (Point(row=11, col=17), Player.WHITE): 6396293815803811646,
-    (Point(row=11, col=18), None): 1347442168043834420,
-    (Point(row=11, col=18), Player.BLACK): 3096250009059758027,
-    (Point(row=11, col=18), Player.WHITE): 8976650020800623558,
-    (Point(row=11, col=19), None): 1664122254242866197,
-    (Point(row=11, col=19), Player.BLACK): 5422881668123319590,
-    (Point(row=11, col=19), Player.WHITE): 6136730854308291614,
-    (Point(row=12, col=1), None): 7403593836707835667,
-    (Point(row=12, col=1), Player.BLACK): 8704451666588564718,
-    (Point(row=12, col=1), Player.WHITE): 2699101156330669577,
-    (Point(row=12, col=2), None): 8428184433287973962,
-    (Point(row=12, col=2), Player.BLACK): 81070284820088848,
-    (Point(row=12, col=2), Player.WHITE): 3617214030754845748,
-    (Point(row=12, col=3), None): 7102818895747273522,
-    (Point(row=12, col=3), Player.BLACK): 5987675474681250265,
-    (Point(row=12, col=3), Player.WHITE): 1839922597298241511,
-    (Point(row=12, col=4), None): 1978553705348266928,
-    (Point(row=12, col=4), Player.BLACK): 896360491397711680,
-    (Point(row=12, col=4), Player.WHITE): 7094225292625589569,
-    (Point(row=12, col=5), None): 1267372815847001576,
-    (Point(row=12, col=5), Player.BLACK): 3866048602684649066,
-    (Point(row=12, col=5), Player.WHITE): 6739761516791063134,
-    (Point(row=12, col=6), None): 2001337954201749686,
-    (Point(row=12, col=6), Player.BLACK): 2512307291108159015,
-    (Point(row=12, col=6), Player.WHITE): 3873221074428804007,
-    (Point(row=12, col=7), None): 8883085191292943809,
-    (Point(row=12, col=7), Player.BLACK): 9105850882686003875,
-    (Point(row=12, col=7), Player.WHITE): 8775141446827080788,
-    (Point(row=12, col=8), None): 2430631732984778846,
-    (Point(row=12, col=8), Player.BLACK): 8752504144900592314,
-    (Point(row=12, col=8), Player.WHITE): 566630910466900886,
-    (Point(row=12, col=9), None): 1022402765716431247,
-    (Point(row=12, col=9), Player.BLACK): 3049840179824667485,
-    (Point(row=12, col=9), Player.WHITE): 931688386644005246,
-    (Point(row=12, col=10), None): 7446178617111292207,
-    (Point(row=12, col=10), Player.BLACK): 4249846896049989080,
-    (Point(row=12, col=10), Player.WHITE): 1060375509267974643,
-    (Point(row=12, col=11), None): 2056127845168151117,
-    (Point(row=12, col=11), Player.BLACK): 7700690023829912754,
-    (Point(row=12, col=11), Player.WHITE): 3761679742185147165,
-    (Point(row=12, col=12), None): 836847684316706611,
-    (Point(row=12, col=12), Player.BLACK): 2351267609208576841,
-    (Point(row=12, col=12), Player.WHITE): 4161415692529179591,
-    (Point(row=12, col=13), None): 5183055123641852959,
-    (Point(row=12, col=13), Player.BLACK): 888416266500038575,
-    (Point(row=12, col=13), Player.WHITE): 8892899211450910503,
-    (Point(row=12, col=14), None): 6227136943838494437,
-    (Point(row=12, col=14), Player.BLACK): 1677954551805277236,
-    (Point(row=12, col=14), Player.WHITE): 360931667398257300,
-    (Point(row=12, col=15), None): 1567213642775515100,
-    (Point(row=12, col=15), Player.BLACK): 8691274730304703361,
-    (Point(row=12, col=15), Player.WHITE): 8750985097201526999,
-    (Point(row=12, col=16), None): 4166864088437332799,
-    (Point(row=12, col=16), Player.BLACK): 1882722750449937275,
-    (Point(row=12, col=16), Player.WHITE): 6116520718097088364,
-    (Point(row=12, col=17), None): 3496777878685511716,
-    (Point(row=12, col=17), Player.BLACK): 495985598757286373,
-    (Point(row=12, col=17), Player.WHITE): 4862545603664967669,
-    (Point(row=12, col=18), None): 4132603379139610461,
-    (Point(row=12, col=18), Player.BLACK): 3907285715748919185,
-    (Point(row=12, col=18), Player.WHITE): 4701259386214059025,
-    (Point(row=12, col=19), None): 1782367655952553380,
-    (Point(row=12, col=19), Player.BLACK): 22001853975024458,
-    (Point(row=12, col=19), Player.WHITE): 841107834585715721,
-    (Point(row=13, col=1), None): 3889601236039290917,
-    (Point(row=13, col=1), Player.BLACK): 1235335736192806827,
-    (Point(row=13, col=1), Player.WHITE): 2113625160782026329,
-    (Point(row=13, col=2), None): 5384771588525482456,
-    (Point(row=13, col=2), Player.BLACK): 1518316320087564255,
-    (Point(row=13, col=2), Player.WHITE): 1710397227915407848,
-    (Point(row=13, col=3), None): 4331501341006386985,
-    (Point(row=13, col=3), Player.BLACK): 1285367524826468085,
-    (Point(row=13, col=3), Player.WHITE): 8339013993573708003,
-    (Point(row=13, col=4), None): 1933031660707975504,
-    (Point(row=13, col=4), Player.BLACK): 108100211242310270,
-    (Point(row=13, col=4), Player.WHITE): 3391445507324192199,
-    (Point(row=13, col=5), None): 3384797949436121178,
-    (Point(row=13, col=5), Player.BLACK): 6859851417674410705,
-    (Point(row=13, col=5), Player.WHITE): 6940327032457203927,
-    (Point(row=13, col=6), None): 3628999529133778431,
-    (Point(row=13, col=6), Player.BLACK): 1898299789742526877,
-    (Point(row=13, col=6), Player.WHITE): 423096381793497967,
-    (Point(row=13, col=7), None): 4297246803575160756,
-    (Point(row=13, col=7), Player.BLACK): 6349468039846844055,
-    (Point(row=13, col=7), Player.WHITE): 2567570025195836492,
-    (Point(row=13, col=8), None): 2951657181070593492,
-    (Point(row=13, col=8), Player.BLACK): 2239517886407798741,
-    (Point(row=13, col=8), Player.WHITE): 3998188904992501842,
-    (Point(row=13, col=9), None): 8834664708578183492,
-    (Point(row=13, col=9), Player.BLACK): 8262178172881559013,
-    (Point(row=13, col=9), Player.WHITE): 8018576730671074848,
-    (Point(row=13, col=10), None): 4393971447322448191,
-    (Point(row=13, col=10), Player.BLACK): 1020323443724030444,
-    (Point(row=13, col=10), Player.WHITE): 587960898673961077,
-    (Point(row=13, col=11), None): 4131974256398659879,
-    (Point(row=13, col=11), Player.BLACK): 8291024458815474847,
-    (Point(row=13, col=11), Player.WHITE): 6339592759980528015,
-    (Point(row=13, col=12), None): 1977978065433543442,
-    (Point(row=13, col=12), Player.BLACK): 5397375777629085053,
-    (Point(row=13, col=12), Player.WHITE): 1318955865205111937,
-    (Point(row=13, col=13), None): 5632117970341130107,
-    (Point(row=13, col=13), Player.BLACK): 732235871893664263,
-    (Point(row=13, col=13), Player.WHITE): 6550350254559118509,
-    (Point(row=13, col=14), None): 1960502031947882988,
-    (Point(row=13, col=14), Player.BLACK): 7253124813543761149,
-    (Point(row=13, col=14), Player.WHITE): 622971069377689530,
-    (Point(row=13, col=15), None): 6531499764232178371,
-    (Point(row=13, col=15), Player.BLACK): 2008533686486905560,
-    (Point(row=13, col=15), Player.WHITE): 2189223176351699952,
-    (Point(row=13, col=16), None): 4858701438817808631,
-    (Point(row=13, col=16), Player.BLACK): 9222829228116856677,
-    (Point(row=13, col=16), Player.WHITE): 7242891185543766341,
-    (Point(row=13, col=17), None): 7383894518002863552,
-    (Point(row=13, col=17), Player.BLACK): 6035406233518546748,
-    (Point(row=13, col=17), Player.WHITE): 4858602307124137647,
-    (Point(row=13, col=18), None): 6714626909552357360,
-    (Point(row=13, col=18), Player.BLACK): 8036027770771605477,
-    (Point(row=13, col=18), Player.WHITE): 7838331501136747360,
-    (Point(row=13, col=19), None): 3223813132973298829,
-    (Point(row=13, col=19), Player.BLACK): 8690202396288026439,
-    (Point(row=13, col=19), Player.WHITE): 6369440870455815272,
-    (Point(row=14, col=1), None): 375050899124265358,
-    (Point(row=14, col=1), Player.BLACK): 3193655786371740195,
-    (Point(row=14, col=1), Player.WHITE): 399108772810280696,
-    (Point(row=14, col=2), None): 8446980202057389135,
-    (Point(row=14, col=2), Player.BLACK): 7506450157869141059,
-    (Point(row=14, col=2), Player.WHITE): 410818083658371090,
-    (Point(row=14, col=3), None): 5785791983956610104,
-    (Point(row=14, col=3), Player.BLACK): 6322916731874764458,
-    (Point(row=14, col=3), Player.WHITE): 2855787885999580782,
-    (Point(row=14, col=4), None): 7604697579923542291,
-    (Point(row=14, col=4), Player.BLACK): 3705520545282183962,
-    (Point(row=14, col=4), Player.WHITE): 8123754662812432568,
-    (Point(row=14, col=5), None): 1862003496104635787,
-    (Point(row=14, col=5), Player.BLACK): 1013111829750332789,
-    (Point(row=14, col=5), Player.WHITE): 9094149858223532893,
-    (Point(row=14, col=6), None): 2239414319331248072,
-    (Point(row=14, col=6), Player.BLACK): 6555845697684447605,
-    (Point(row=14, col=6), Player.WHITE): 5413830999068845313,
-    (Point(row=14, col=7), None): 6029536559850609734,
-    (Point(row=14, col=7), Player.BLACK): 9019814520295049976,
-    (Point(row=14, col=7), Player.WHITE): 6293659192868898376,
-    (Point(row=14, col=8), None): 3541051278996889568,
-    (Point(row=14, col=8), Player.BLACK): 4393175311331886140,
-    (Point(row=14, col=8), Player.WHITE): 3299814872965620441,
-    (Point(row=14, col=9), None): 2059658123890187218,
-    (Point(row=14, col=9), Player.BLACK): 4630902760254775492,
-    (Point(row=14, col=9), Player.WHITE): 4515268698090398672,
-    (Point(row=14, col=10), None): 3591361307076692095,
-    (Point(row=14, col=10), Player.BLACK): 1404409929455540046,
-    (Point(row=14, col=10), Player.WHITE): 2176571593116427572,
-    (Point(row=14, col=11), None): 1356422243722797548,
-    (Point(row=14, col=11), Player.BLACK): 3658675012961265278,
-    (Point(row=14, col=11), Player.WHITE): 2497180615578792272,
-    (Point(row=14, col=12), None): 3142581088607942280,
-    (Point(row=14, col=12), Player.BLACK): 7449093787112419292,
-    (Point(row=14, col=12), Player.WHITE): 751207642906916490,
-    (Point(row=14, col=13), None): 1248226898504512415,
-    (Point(row=14, col=13), Player.BLACK): 8883465376101318085,
-    (Point(row=14, col=13), Player.WHITE): 1913283609672647213,
-    (Point(row=14, col=14), None): 3831365512292913936,
-    (Point(row=14, col=14), Player.BLACK): 463690142731412843,
-    (Point(row=14, col=14), Player.WHITE): 8885414624487464169,
-    (Point(row=14, col=15), None): 8791286853579133425,
-    (Point(row=14, col=15), Player.BLACK): 526518186733494155,
-    (Point(row=14, col=15), Player.WHITE): 1736208962116959835,
-    (Point(row=14, col=16), None): 7949396852350728740,
-    (Point(row=14, col=16), Player.BLACK): 5613983106407802257,
-    (Point(row=14, col=16), Player.WHITE): 252682772373236298,
-    (Point(row=14, col=17), None): 8324352652467575932,
-    (Point(row=14, col=17), Player.BLACK): 7216126947175247776,
-    (Point(row=14, col=17), Player.WHITE): 2518741801233125172,
-    (Point(row=14, col=18), None): 2195509387404032122,
-    (Point(row=14, col=18), Player.BLACK): 1655591716045367248,
-    (Point(row=14, col=18), Player.WHITE): 6085928416619842243,
-    (Point(row=14, col=19), None): 2174961931896765114,
-    (Point(row=14, col=19), Player.BLACK): 5016098924391344003,
-    (Point(row=14, col=19), Player.WHITE): 2715928335977562050,
-    (Point(row=15, col=1), None): 7703509096136506405,
-    (Point(row=15, col=1), Player.BLACK): 4597895242668199828,
-    (Point(row=15, col=1), Player.WHITE): 7635650787575855605,
-    (Point(row=15, col=2), None): 1547764138586272469,
-    (Point(row=15, col=2), Player.BLACK): 3874822696411881695,
-    (Point(row=15, col=2), Player.WHITE): 8360371745957118735,
-    (Point(row=15, col=3), None): 3744995326024507751,
-    (Point(row=15, col=3), Player.BLACK): 6176726812439293554,
-    (Point(row=15, col=3), Player.WHITE): 5834633911922432745,
-    (Point(row=15, col=4), None): 9149003734700761174,
-    (Point(row=15, col=4), Player.BLACK): 3558478795037536047,
-    (Point(row=15, col=4), Player.WHITE): 7781779059106594357,
-    (Point(row=15, col=5), None): 2396967739734628501,
-    (Point(row=15, col=5), Player.BLACK): 2588274151999380733,
-    (Point(row=15, col=5), Player.WHITE): 8382279687786232329,
-    (Point(row=15, col=6), None): 3604717533212623252,
-    (Point(row=15, col=6), Player.BLACK): 3973517106794792670,
-    (Point(row=15, col=6), Player.WHITE): 1881071868780061094,
-    (Point(row=15, col=7), None): 4624106722283917673,
-    (Point(row=15, col=7), Player.BLACK): 5505951900908922186,
-    (Point(row=15, col=7), Player.WHITE): 4384296659480496763,
-    (Point(row=15, col=8), None): 4234410379035352585,
-    (Point(row=15, col=8), Player.BLACK): 7553402112363138514,
-    (Point(row=15, col=8), Player.WHITE): 4023297480668373336,
-    (Point(row=15, col=9), None): 3279514529069063783,
-    (Point(row=15, col=9), Player.BLACK): 8455722064480569394,
-    (Point(row=15, col=9), Player.WHITE): 4809623107323772403,
-    (Point(row=15, col=10), None): 552499035141907198,
-    (Point(row=15, col=10), Player.BLACK): 2832462148580590131,
-    (Point(row=15, col=10), Player.WHITE): 7570664960278290804,
-    (Point(row=15, col=11), None): 2563073930991086614,
-    (Point(row=15, col=11), Player.BLACK): 1425407078168847713,
-    (Point(row=15, col=11), Player.WHITE): 6946916565787016003,
-    (Point(row=15, col=12), None): 229685270218430350,
-    (Point(row=15, col=12), Player.BLACK): 1545720123481073458,
-    (Point(row=15, col=12), Player.WHITE): 8371764587018805222,
-    (Point(row=15, col=13), None): 5183884803766627355,
-    (Point(row=15, col=13), Player.BLACK): 5362464192901925158,
-    (Point(row=15, col=13), Player.WHITE): 5893303857631569931,
-    (Point(row=15, col=14), None): 4291054999464157632,
-    (Point(row=15, col=14), Player.BLACK): 571997047946656728,
-    (Point(row=15, col=14), Player.WHITE): 8364548217933476781,
-    (Point(row=15, col=15), None): 6488059137067065660,
-    (Point(row=15, col=15), Player.BLACK): 169780682264012164,
-    (Point(row=15, col=15), Player.WHITE): 8622670959200176667,
-    (Point(row=15, col=16), None): 2517247108673600671,
-    (Point(row=15, col=16), Player.BLACK): 9128308231752648581,
-    (Point(row=15, col=16), Player.WHITE): 4328655184567475990,
-    (Point(row=15, col=17), None): 4434272035974798407,
-    (Point(row=15, col=17), Player.BLACK): 9204324931486537961,
-    (Point(row=15, col=17), Player.WHITE): 8221018074453670848,
-    (Point(row=15, col=18), None): 4668579732315572506,
-    (Point(row=15, col=18), Player.BLACK): 7514331427856383284,
-    (Point(row=15, col=18), Player.WHITE): 255076093462808428,
-    (Point(row=15, col=19), None): 4216030370313173478,
-    (Point(row=15, col=19), Player.BLACK): 4195197158015791158,
-    (Point(row=15, col=19), Player.WHITE): 3743244760049906067,
-    (Point(row=16, col=1), None): 2188046760349533839,
-    (Point(row=16, col=1), Player.BLACK): 5441339095483615387,
-    (Point(row=16, col=1), Player.WHITE): 951703091787285118,
-    (Point(row=16, col=2), None): 1597142972103654768,
-    (Point(row=16, col=2), Player.BLACK): 8677151775641112857,
-    (Point(row=16, col=2), Player.WHITE): 5976606320870127043,
-    (Point(row=16, col=3), None): 1965535597830670112,
-    (Point(row=16, col=3), Player.BLACK): 4399070889341603508,
-    (Point(row=16, col=3), Player.WHITE): 3375094382403741149,
-    (Point(row=16, col=4), None): 7384150421015658913,
-    (Point(row=16, col=4), Player.BLACK): 6252261905680802160,
-    (Point(row=16, col=4), Player.WHITE): 6858412761736595580,
-    (Point(row=16, col=5), None): 9097131178950459176,
-    (Point(row=16, col=5), Player.BLACK): 1931157035711406530,
-    (Point(row=16, col=5), Player.WHITE): 3542405201170229285,
-    (Point(row=16, col=6), None): 3969290972596212421,
-    (Point(row=16, col=6), Player.BLACK): 8554940585223740227,
-    (Point(row=16, col=6), Player.WHITE): 2807490596806178282,
-    (Point(row=16, col=7), None): 1204185779070005337,
-    (Point(row=16, col=7), Player.BLACK): 7241316721070612127,
-    (Point(row=16, col=7), Player.WHITE): 5797803990630355145,
-    (Point(row=16, col=8), None): 5661130055064456021,
-    (Point(row=16, col=8), Player.BLACK): 2617958743550047282,
-    (Point(row=16, col=8), Player.WHITE): 9162280557445649269,
-    (Point(row=16, col=9), None): 3787019558513891331,
-    (Point(row=16, col=9), Player.BLACK): 7084036806479158314,
-    (Point(row=16, col=9), Player.WHITE): 3941691287975281008,
-    (Point(row=16, col=10), None): 8081249307658739469,
-    (Point(row=16, col=10), Player.BLACK): 8671602789287420378,
-    (Point(row=16, col=10), Player.WHITE): 2614659679145653800,
-    (Point(row=16, col=11), None): 6377903392035246727,
-    (Point(row=16, col=11), Player.BLACK): 3721182224636089235,
-    (Point(row=16, col=11), Player.WHITE): 6756499044471340430,
-    (Point(row=16, col=12), None): 4518528979510580880,
-    (Point(row=16, col=12), Player.BLACK): 8350286106808341185,
-    (Point(row=16, col=12), Player.WHITE): 6144870787559651072,
-    (Point(row=16, col=13), None): 8489709826839496398,
-    (Point(row=16, col=13), Player.BLACK): 4037560640324056591,
-    (Point(row=16, col=13), Player.WHITE): 4087730120118997525,
-    (Point(row=16, col=14), None): 4455391584294755486,
-    (Point(row=16, col=14), Player.BLACK): 2050525654283898529,
-    (Point(row=16, col=14), Player.WHITE): 6034544697064081099,
-    (Point(row=16, col=15), None): 3034419220128799551,
-    (Point(row=16, col=15), Player.BLACK): 3280258258536920698,
-    (Point(row=16, col=15), Player.WHITE): 6183756523349607048,
-    (Point(row=16, col=16), None): 5344353042067066461,
-    (Point(row=16, col=16), Player.BLACK): 5893085118493434012,
-    (Point(row=16, col=16), Player.WHITE): 4372157057870628938,
-    (Point(row=16, col=17), None): 3487455926418161344,
-    (Point(row=16, col=17), Player.BLACK): 3758841953374265767,
-    (Point(row=16, col=17), Player.WHITE): 7678576706628488438,
-    (Point(row=16, col=18), None): 1815369272269681502,
-    (Point(row=16, col=18), Player.BLACK): 1007969640502060092,
-    (Point(row=16, col=18), Player.WHITE): 2104040099147132600,
-    (Point(row=16, col=19), None): 1350798841463357242,
-    (Point(row=16, col=19), Player.BLACK): 3285485836817465489,
-    (Point(row=16, col=19), Player.WHITE): 7930409837275771729,
-    (Point(row=17, col=1), None): 446479600673530716,
-    (Point(row=17, col=1), Player.BLACK): 7924478116786864117,
-    (Point(row=17, col=1), Player.WHITE): 638104589994792098,
-    (Point(row=17, col=2), None): 7174842303396321329,
-    (Point(row=17, col=2), Player.BLACK): 403797010094154417,
-    (Point(row=17, col=2), Player.WHITE): 8875619511304555292,
-    (Point(row=17, col=3), None): 3733409224703903535,
-    (Point(row=17, col=3), Player.BLACK): 7198570656967701831,
-    (Point(row=17, col=3), Player.WHITE): 1108847464190068052,
-    (Point(row=17, col=4), None): 5387111512818051358,
-    (Point(row=17, col=4), Player.BLACK): 1825378096638578108,
-    (Point(row=17, col=4), Player.WHITE): 8704112470627832440,
-    (Point(row=17, col=5), None): 6499554922558621220,
-    (Point(row=17, col=5), Player.BLACK): 6325963807243649962,
-    (Point(row=17, col=5), Player.WHITE): 9154759439806901056,
-    (Point(row=17, col=6), None): 7006460765320926769,
-    (Point(row=17, col=6), Player.BLACK): 8905773202525522811,
-    (Point(row=17, col=6), Player.WHITE): 1128350446763144298,
-    (Point(row=17, col=7), None): 5803075846836558804,
-    (Point(row=17, col=7), Player.BLACK): 2015843531323083633,
-    (Point(row=17, col=7), Player.WHITE): 4920470528155052311,
-    (Point(row=17, col=8), None): 651252135787906942,
-    (Point(row=17, col=8), Player.BLACK): 456390805105619765,
-    (Point(row=17, col=8), Player.WHITE): 5208103076228860877,
-    (Point(row=17, col=9), None): 6785692030845328266,
-    (Point(row=17, col=9), Player.BLACK): 5066200710745030282,
-    (Point(row=17, col=9), Player.WHITE): 1876987564845560136,
-    (Point(row=17, col=10), None): 4214233992446662082,
-    (Point(row=17, col=10), Player.BLACK): 8707824093446933358,
-    (Point(row=17, col=10), Player.WHITE): 4548345814072665218,
-    (Point(row=17, col=11), None): 7482018899119065277,
-    (Point(row=17, col=11), Player.BLACK): 1023003089612214271,
-    (Point(row=17, col=11), Player.WHITE): 1718931317729365627,
-    (Point(row=17, col=12), None): 4998971713199221213,
-    (Point(row=17, col=12), Player.BLACK): 878646698570534250,
-    (Point(row=17, col=12), Player.WHITE): 8474278974275406672,
-    (Point(row=17, col=13), None): 4830164061940275722,
-    (Point(row=17, col=13), Player.BLACK): 286041593812200875,
-    (Point(row=17, col=13), Player.WHITE): 7377130026403750057,
-    (Point(row=17, col=14), None): 6578732294382314536,
-    (Point(row=17, col=14), Player.BLACK): 1426134492005116100,
-    (Point(row=17, col=14), Player.WHITE): 1088778999690658138,
-    (Point(row=17, col=15), None): 6913653197911819995,
-    (Point(row=17, col=15), Player.BLACK): 783378168210865160,
-    (Point(row=17, col=15), Player.WHITE): 9192168459346355551,
-    (Point(row=17, col=16), None): 5910788716188770934,
-    (Point(row=17, col=16), Player.BLACK): 3742428777049410801,
-    (Point(row=17, col=16), Player.WHITE): 3307439407847631000,
-    (Point(row=17, col=17), None): 3219874459652592139,
-    (Point(row=17, col=17), Player.BLACK): 7850141700727103627,
-    (Point(row=17, col=17), Player.WHITE): 433412878215029463,
-    (Point(row=17, col=18), None): 543890319663875053,
-    (Point(row=17, col=18), Player.BLACK): 9143594745571901096,
-    (Point(row=17, col=18), Player.WHITE): 4093641466690939025,
-    (Point(row=17, col=19), None): 8910133126123037880,
-    (Point(row=17, col=19), Player.BLACK): 7264014425717207933,
-    (Point(row=17, col=19), Player.WHITE): 792615253677724662,
-    (Point(row=18, col=1), None): 8348147329709739802,
-    (Point(row=18, col=1), Player.BLACK): 7763865448599338482,
-    (Point(row=18, col=1), Player.WHITE): 6298804423332773780,
-    (Point(row=18, col=2), None): 6554979987346164567,
-    (Point(row=18, col=2), Player.BLACK): 1160041414457402505,
-    (Point(row=18, col=2), Player.WHITE): 7756669072385715358,
-    (Point(row=18, col=3), None): 2162854861853958549,
-    (Point(row=18, col=3), Player.BLACK): 6363989948764304769,
-    (Point(row=18, col=3), Player.WHITE): 9093326304622058117,
-    (Point(row=18, col=4), None): 283450754524458774,
-    (Point(row=18, col=4), Player.BLACK): 4951183634819526234,
-    (Point(row=18, col=4), Player.WHITE): 9003424327545532199,
-    (Point(row=18, col=5), None): 3445468333409579094,
-    (Point(row=18, col=5), Player.BLACK): 765129958878940216,
-    (Point(row=18, col=5), Player.WHITE): 5947510879037829336,
-    (Point(row=18, col=6), None): 3138440587889552225,
-    (Point(row=18, col=6), Player.BLACK): 2980285387571476093,
-    (Point(row=18, col=6), Player.WHITE): 7126274734168497575,
-    (Point(row=18, col=7), None): 4866409571234235233,
-    (Point(row=18, col=7), Player.BLACK): 7435767109765306310,
-    (Point(row=18, col=7), Player.WHITE): 4423944781844798487,
-    (Point(row=18, col=8), None): 8432349267597818602,
-    (Point(row=18, col=8), Player.BLACK): 2130589735285294602,
-    (Point(row=18, col=8), Player.WHITE): 5528366161644301041,
-    (Point(row=18, col=9), None): 5309684909430498352,
-    (Point(row=18, col=9), Player.BLACK): 2752915771037927197,
-    (Point(row=18, col=9), Player.WHITE): 3804848851579471800,
-    (Point(row=18, col=10), None): 1113588063595543229,
-    (Point(row=18, col=10), Player.BLACK): 8683875060992659869,
-    (Point(row=18, col=10), Player.WHITE): 8484381234567114361,
-    (Point(row=18, col=11), None): 6874323848734956838,
-    (Point(row=18, col=11), Player.BLACK): 7826355918049901641,
-    (Point(row=18, col=11), Player.WHITE): 4468055954600946873,
-    (Point(row=18, col=12), None): 1323553267003020574,
-    (Point(row=18, col=12), Player.BLACK): 2107494831441119302,
-    (Point(row=18, col=12), Player.WHITE): 1759182595907949364,
-    (Point(row=18, col=13), None): 352584298736463764,
-    (Point(row=18, col=13), Player.BLACK): 9155203549808805563,
-    (Point(row=18, col=13), Player.WHITE): 5905027542981703569,
-    (Point(row=18, col=14), None): 8509237156820811208,
-    (Point(row=18, col=14), Player.BLACK): 3304017341856611234,
-    (Point(row=18, col=14), Player.WHITE): 3483527409342597848,
-    (Point(row=18, col=15), None): 534183309353392974,
-    (Point(row=18, col=15), Player.BLACK): 1130239132292259719,
-    (Point(row=18, col=15), Player.WHITE): 4256877776122424121,
-    (Point(row=18, col=16), None): 8015970242250778211,
-    (Point(row=18, col=16), Player.BLACK): 3932167087070980961,
-    (Point(row=18, col=16), Player.WHITE): 8623848659454084452,
-    (Point(row=18, col=17), None): 5501010904180631603,
-    (Point(row=18, col=17), Player.BLACK): 6759369025657922031,
-    (Point(row=18, col=17), Player.WHITE): 4076351583370045011,
-    (Point(row=18, col=18), None): 4005824696374960624,
-    (Point(row=18, col=18), Player.BLACK): 1685672207082308454,
-    (Point(row=18, col=18), Player.WHITE): 3823582573290406306,
-    (Point(row=18, col=19), None): 4752045250555389152,
-    (Point(row=18, col=19), Player.BLACK): 4613141075510654942,
-    (Point(row=18, col=19), Player.WHITE): 6374536141783131187,
-    (Point(row=19, col=1), None): 9185092696334059673,
-    (Point(row=19, col=1), Player.BLACK): 1442112584941474040,
-    (Point(row=19, col=1), Player.WHITE): 4746288594046043130,
-    (Point(row=19, col=2), None): 9167784536828251864,
-    (Point(row=19, col=2), Player.BLACK): 2007094887340689654,
-    (Point(row=19, col=2), Player.WHITE): 4355579265776209044,
-    (Point(row=19, col=3), None): 916608741136710567,
-    (Point(row=19, col=3), Player.BLACK): 2234527086296288928,
-    (Point(row=19, col=3), Player.WHITE): 4071120800138622389,
-    (Point(row=19, col=4), None): 2838721189149381001,
-    (Point(row=19, col=4), Player.BLACK): 4345703340733522402,
-    (Point(row=19, col=4), Player.WHITE): 8977447508063889872,
-    (Point(row=19, col=5), None): 8176016502243884613,
-    (Point(row=19, col=5), Player.BLACK): 1758774506377782816,
-    (Point(row=19, col=5), Player.WHITE): 1608272747818569279,
-    (Point(row=19, col=6), None): 8917786748917281792,
-    (Point(row=19, col=6), Player.BLACK): 7088856196314517657,
-    (Point(row=19, col=6), Player.WHITE): 9026125504465728374,
-    (Point(row=19, col=7), None): 5162484192286506091,
-    (Point(row=19, col=7), Player.BLACK): 7562783078516042243,
-    (Point(row=19, col=7), Player.WHITE): 5942343938562869784,
-    (Point(row=19, col=8), None): 6237446593896358284,
-    (Point(row=19, col=8), Player.BLACK): 3103876680108296227,
-    (Point(row=19, col=8), Player.WHITE): 6403484444371083029,
-    (Point(row=19, col=9), None): 609348078741412405,
-    (Point(row=19, col=9), Player.BLACK): 1664016017688281888,
-    (Point(row=19, col=9), Player.WHITE): 4690581797585925240,
-    (Point(row=19, col=10), None): 463947371898110866,
-    (Point(row=19, col=10), Player.BLACK): 4892886258342809632,
-    (Point(row=19, col=10), Player.WHITE): 7432473866891071411,
-    (Point(row=19, col=11), None): 1683669907387012182,
-    (Point(row=19, col=11), Player.BLACK): 7226876732878523324,
-    (Point(row=19, col=11), Player.WHITE): 7455560286689499921,
-    (Point(row=19, col=12), None): 5291259211030728033,
-    (Point(row=19, col=12), Player.BLACK): 2801281141714119308,
-    (Point(row=19, col=12), Player.WHITE): 3273305506762894029,
-    (Point(row=19, col=13), None): 7957757243446844776,
-    (Point(row=19, col=13), Player.BLACK): 3543960374526950575,
-    (Point(row=19, col=13), Player.WHITE): 400226855993144902,
-    (Point(row=19, col=14), None): 979127018684915296,
-    (Point(row=19, col=14), Player.BLACK): 8486410937788016699,
-    (Point(row=19, col=14), Player.WHITE): 440422165631672651,
-    (Point(row=19, col=15), None): 2693228070040323282,
-    (Point(row=19, col=15), Player.BLACK): 2024989451295532265,
-    (Point(row=19, col=15), Player.WHITE): 9009247851963260357,
-    (Point(row=19, col=16), None): 2920960703334476403,
-    (Point(row=19, col=16), Player.BLACK): 3678319224428475971,
-    (Point(row=19, col=16), Player.WHITE): 6233571569672083924,
-    (Point(row=19, col=17), None): 1445300291890149933,
-    (Point(row=19, col=17), Player.BLACK): 3944251478103058898,
-    (Point(row=19, col=17), Player.WHITE): 3327998301478553168,
-    (Point(row=19, col=18), None): 1398643761258763066,
-    (Point(row=19, col=18), Player.BLACK): 7395993838743268045,
-    (Point(row=19, col=18), Player.WHITE): 4714432502117270029,
-    (Point(row=19, col=19), None): 907014631634246260,
-    (Point(row=19, col=19), Player.BLACK): 735939055654997872,
-    (Point(row=19, col=19), Player.WHITE): 2208784984727875464,
-}
+__all__ = ["EMPTY_BOARD", "SEED", "hash_codes", "generate_codes"]
 
-EMPTY_BOARD = 7704520708651658071
+SEED = 20190601
+
+EMPTY_BOARD: int = random.Random(SEED).getrandbits(63)
+
+_TABLES: Dict[Tuple[int, int], List[int]] = {}
+
+
+def generate_codes(num_rows: int, num_cols: int, seed: int = SEED) -> List[int]:
+    """ 3 codes per point of a num_rows x num_cols board, the same in every process. """
+    rng = random.Random("%d:%dx%d" % (seed, num_rows, num_cols))
+    return [rng.getrandbits(63) for _ in range(num_rows * num_cols * 3)]
+
+
+def hash_codes(num_rows: int, num_cols: int) -> List[int]:
+    """ Cached codes of a num_rows x num_cols board, see generate_codes. """
+    key = (num_rows, num_cols)
+    if key not in _TABLES:
+        _TABLES[key] = generate_codes(num_rows, num_cols)
+    return _TABLES[key]
@@ -0,0 +1,46 @@
+import argparse
+
+from mydlgo import goboard, goboard_bit, goboard_fast
+from mydlgo.agent import RandomBot
+from mydlgo.rules import score_with_dead_stones
+from mydlgo.scoring import compute_game_result
+from mydlgo.selfplay import run_self_play
+
+GAME_STATES = {
+    "goboard": goboard.GameState,
+    "fast": goboard_fast.GameState,
+    "bit": goboard_bit.GameState,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play random bots against each other without rendering.")
+    parser.add_argument("output", help="file the game records are appended to")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--size", type=int, default=9)
+    parser.add_argument("--workers", type=int, default=None, help="defaults to the number of CPUs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--board", choices=sorted(GAME_STATES), default="fast")
+    parser.add_argument("--format", choices=["binary", "text"], default="text", help="record file format")
+    parser.add_argument(
+        "--dead-stones", action="store_true", help="remove the dead stones estimated by playouts before scoring"
+    )
+    args = parser.parse_args()
+
+    stats = run_self_play(
+        RandomBot(),
+        RandomBot(),
+        args.games,
+        args.output,
+        board_size=args.size,
+        num_workers=args.workers,
+        seed=args.seed,
+        game_state_class=GAME_STATES[args.board],
+        record_format=args.format,
+        score_fn=score_with_dead_stones if args.dead_stones else compute_game_result,
+    )
+    print(stats)
+
+
+if __name__ == "__main__":
+    main()